@@ -1,11 +1,9 @@
 import os
 import re
-import time
 from typing import List, Optional
 
-import requests
-
 from osa_tool.aboutgen.prompts_about_config import PromptAboutLoader
+from osa_tool.aboutgen.topic_index import get_topic_index
 from osa_tool.analytics.metadata import load_data_metadata
 from osa_tool.config.settings import ConfigLoader
 from osa_tool.models.models import ModelHandler, ModelHandlerFactory
@@ -146,7 +144,9 @@ class AboutGenerator:
 
     def _validate_github_topics(self, topics: List[str]) -> List[str]:
         """
-        Validates topics against GitHub Topics API to ensure they exist.
+        Validates topics against the local GitHub topic index to ensure they exist.
+
+        Topics missing from the index are looked up with the GitHub Topics API.
 
         Args:
             topics (List[str]): List of potential topics to validate
@@ -154,38 +154,8 @@ class AboutGenerator:
         Returns:
             List[str]: List of validated topics that exist on GitHub
         """
-        logger.info("Validating topics against GitHub Topics API...")
-        min_repo = 5
-        validated_topics = []
-
-        for topic in topics:
-            try:
-                response = requests.get(
-                    f"https://api.github.com/search/topics?q={topic}+repositories:>{min_repo}",
-                    headers={"Accept": "application/vnd.github.v3+json"},
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if (total := data.get("total_count", 0)) > 0:
-                        if total == 1:
-                            valid_topic = data.get("items")[0].get("name")
-                            logger.debug(f"Applied transformation for topic: '{topic} -> {valid_topic}'")
-                        else:
-                            valid_topic = topic
-                        validated_topics.append(valid_topic)
-                    else:
-                        logger.debug(f"Generated topic '{topic}' is not valid, skipping")
-                elif response.status_code == 403:
-                    logger.warning("Rate limit exceeded, waiting 60 seconds")
-                    time.sleep(60)
-
-                time.sleep(1)
-
-            except Exception as e:
-                logger.error(f"Error validating topic '{topic}': {e}")
-                continue
-
+        logger.info("Validating topics against GitHub topic index...")
+        validated_topics = get_topic_index(self.config.cache).validate(topics)
         logger.info(f"Validated {len(validated_topics)} topics out of {len(topics)}")
         return validated_topics
 
@@ -0,0 +1,206 @@
+import json
+import os
+import threading
+import time
+
+from osa_tool import http_client
+from osa_tool.config.settings import CacheSettings
+from osa_tool.utils import logger
+
+CURATED_TOPICS_URL = "https://api.github.com/repos/github/explore/contents/topics"
+SEARCH_TOPICS_URL = "https://api.github.com/search/topics"
+MIN_REPOSITORIES = 5
+
+
+class TopicIndex:
+    """
+    Local index of GitHub topics used to validate generated topics without a search request per topic.
+
+    The index holds the curated topics of github/explore, refreshed in bulk with a conditional
+    request once its TTL expires, and the results of earlier searches. Every search also adds all
+    returned topic names to the index, so that related topics are answered from memory later.
+    Only topics missing from the index are looked up remotely.
+
+    Attributes:
+        path: Path to the JSON file the index is persisted to, or None to keep it in memory only.
+        ttl_seconds: Lifetime of the curated list and of cached lookups.
+        curated: Names of curated topics.
+        lookups: Results of topic searches: the valid name of a topic, or None if it does not exist.
+    """
+
+    def __init__(self, path: str | None, ttl_hours: float):
+        """
+        Loads the index from disk if it exists.
+
+        Args:
+            path: Path to the JSON file the index is persisted to, or None to keep it in memory only.
+            ttl_hours: Lifetime of the curated list and of cached lookups in hours. Zero disables expiration.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.curated: set[str] = set()
+        self.lookups: dict[str, dict] = {}
+        self._etag: str | None = None
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+
+    def validate(self, topics: list[str]) -> list[str]:
+        """
+        Returns the topics that exist on GitHub, replacing each with its canonical name when it is unambiguous.
+
+        Args:
+            topics: Candidate topics.
+
+        Returns:
+            list[str]: Valid topics in the order of the candidates.
+        """
+        self.refresh()
+        validated = []
+        for topic in topics:
+            name = topic.strip().lower()
+            if name in self.curated:
+                validated.append(name)
+                continue
+
+            lookup = self.lookups.get(name)
+            if lookup is None or self._is_expired(lookup["checked_at"]):
+                lookup = self._search(name)
+            if lookup is None:
+                logger.debug(f"Topic '{topic}' could not be checked, skipping")
+            elif lookup["name"]:
+                if lookup["name"] != name:
+                    logger.debug(f"Applied transformation for topic: '{topic} -> {lookup['name']}'")
+                validated.append(lookup["name"])
+            else:
+                logger.debug(f"Generated topic '{topic}' is not valid, skipping")
+
+        self._save()
+        return validated
+
+    def refresh(self) -> None:
+        """Reloads the curated topics if they are older than the TTL, revalidating them by ETag."""
+        if self.curated and not self._is_expired(self._refreshed_at):
+            return
+
+        headers = self._headers()
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        try:
+            response = http_client.get(CURATED_TOPICS_URL, headers=headers)
+        except Exception as e:
+            logger.warning(f"Failed to refresh GitHub topic index: {e}")
+            return
+
+        if response.status_code == 304:
+            self._refreshed_at = time.time()
+        elif response.status_code == 200:
+            self.curated = {entry["name"].lower() for entry in response.json() if entry.get("type") == "dir"}
+            self._etag = response.headers.get("ETag")
+            self._refreshed_at = time.time()
+            logger.debug(f"GitHub topic index refreshed with {len(self.curated)} curated topics")
+        else:
+            logger.warning(f"Failed to refresh GitHub topic index: {response.status_code}")
+
+    def _search(self, topic: str) -> dict | None:
+        """
+        Looks up a topic remotely and caches all topics found by the search.
+
+        Args:
+            topic: Normalized topic name.
+
+        Returns:
+            dict | None: The lookup result, or None if the search failed.
+        """
+        try:
+            response = http_client.get(
+                SEARCH_TOPICS_URL,
+                params={"q": f"{topic} repositories:>{MIN_REPOSITORIES}"},
+                headers=self._headers(),
+            )
+        except Exception as e:
+            logger.error(f"Error validating topic '{topic}': {e}")
+            return None
+        if response.status_code != 200:
+            logger.warning(f"Failed to validate topic '{topic}': {response.status_code}")
+            return None
+
+        data = response.json()
+        items = data.get("items", [])
+        now = time.time()
+        with self._lock:
+            for item in items:
+                self.lookups[item["name"].lower()] = {"name": item["name"].lower(), "checked_at": now}
+
+            total = data.get("total_count", 0)
+            if total == 1 and items:
+                name = items[0]["name"].lower()
+            elif total > 0:
+                name = topic
+            else:
+                name = None
+            self.lookups[topic] = {"name": name, "checked_at": now}
+            return self.lookups[topic]
+
+    @staticmethod
+    def _headers() -> dict:
+        headers = {"Accept": "application/vnd.github.v3+json"}
+        token = os.getenv("GIT_TOKEN")
+        if token:
+            headers["Authorization"] = f"token {token}"
+        return headers
+
+    def _is_expired(self, timestamp: float) -> bool:
+        return bool(self.ttl_seconds) and time.time() - timestamp > self.ttl_seconds
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.curated = set(data.get("curated", []))
+            self.lookups = data.get("lookups", {})
+            self._etag = data.get("etag")
+            self._refreshed_at = data.get("refreshed_at", 0.0)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable GitHub topic index {self.path}: {e}")
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        data = {
+            "etag": self._etag,
+            "refreshed_at": self._refreshed_at,
+            "curated": sorted(self.curated),
+            "lookups": self.lookups,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+_indexes: dict[str | None, TopicIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_topic_index(settings: CacheSettings) -> TopicIndex:
+    """
+    Returns the process-wide topic index stored in the cache directory.
+
+    Args:
+        settings: Cache settings from the configuration. The index is kept in memory only if caching is disabled.
+
+    Returns:
+        TopicIndex: Shared topic index.
+    """
+    if isinstance(settings, CacheSettings) and settings.enabled:
+        path, ttl_hours = os.path.abspath(os.path.join(settings.directory, "github_topics.json")), settings.ttl_hours
+    else:
+        path, ttl_hours = None, CacheSettings().ttl_hours
+    with _indexes_lock:
+        if path not in _indexes:
+            _indexes[path] = TopicIndex(path, ttl_hours)
+        return _indexes[path]
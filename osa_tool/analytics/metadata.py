@@ -4,6 +4,7 @@ from functools import lru_cache
 
 import requests
 
+from osa_tool import http_client
 from osa_tool.utils import get_base_repo_url, logger
 
 
@@ -110,7 +111,7 @@ def load_data_metadata(repo_url: str) -> RepositoryMetadata | None:
         base_url = get_base_repo_url(repo_url)
         url = f"https://api.github.com/repos/{base_url}"
 
-        response = requests.get(url=url, headers=headers)
+        response = http_client.get(url=url, headers=headers)
 
         metadata = response.json()
         logger.info(f"Successfully fetched metadata for repository: {repo_url}")
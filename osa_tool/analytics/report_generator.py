@@ -10,7 +10,7 @@ from osa_tool.analytics.prompt_builder import RepositoryReport
 from osa_tool.analytics.sourcerank import SourceRank
 from osa_tool.config.settings import ConfigLoader
 from osa_tool.models.models import ModelHandler, ModelHandlerFactory
-from osa_tool.readmegen.postprocessor.response_cleaner import process_text
+from osa_tool.readmegen.postprocessor.response_cleaner import process_text, process_text_stream
 from osa_tool.utils import extract_readme_content, osa_project_root, parse_folder_name
 
 
@@ -31,8 +31,10 @@ class TextGenerator:
         Returns:
             str: The generated repository analysis response from the model.
         """
-        response = self.model_handler.send_request(self._build_prompt())
-        cleaned_response = process_text(response)
+        if self.config.llm.stream is True:
+            cleaned_response = process_text_stream(self.model_handler.send_request_stream(self._build_prompt()))
+        else:
+            cleaned_response = process_text(self.model_handler.send_request(self._build_prompt()))
         try:
             parsed_json = json.loads(cleaned_response)
             parsed_report = RepositoryReport.model_validate(parsed_json)
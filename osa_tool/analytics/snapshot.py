@@ -0,0 +1,185 @@
+import os
+import threading
+from dataclasses import dataclass
+
+TREE_EXCLUDED_DIRS = {".git", "log", "logs"}
+
+TREE_EXCLUDED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".bmp",
+    ".tiff",
+    ".webp",
+    ".drawio",  # images
+    ".mp4",
+    ".mov",
+    ".avi",
+    ".mkv",
+    ".flv",
+    ".wmv",
+    ".webm",  # videos
+    ".csv",
+    ".tsv",
+    ".parquet",
+    ".json",
+    ".xml",
+    ".xls",
+    ".xlsx",  # data files
+    ".zip",
+    ".tar",
+    ".gz",
+    ".bz2",
+    ".7z",  # archives
+    ".exe",
+    ".dll",
+    ".so",
+    ".bin",
+    ".obj",
+    ".class",
+    ".pkl",  # binaries
+    ".pdf",  # documents
+}
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """
+    A single file or directory of the repository snapshot.
+    """
+
+    path: str
+    is_dir: bool
+    size: int
+    mtime: float
+
+    @property
+    def extension(self) -> str:
+        """Lowercased file extension including the leading dot, or an empty string."""
+        return os.path.splitext(self.path)[1].lower()
+
+
+class RepositorySnapshot:
+    """
+    Index of the files of a local repository, shared by all subsystems of a run.
+
+    The directory is walked once on first access and the result is kept until the snapshot is
+    invalidated, e.g. after a stage that adds, removes or renames files. The text tree used in
+    prompts is derived lazily from the index.
+
+    Attributes:
+        repo_path: Absolute path to the repository.
+    """
+
+    _snapshots: dict[str, "RepositorySnapshot"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, repo_path: str):
+        """
+        Initializes an empty snapshot of the repository.
+
+        Args:
+            repo_path: Path to the repository.
+        """
+        self.repo_path = os.path.abspath(repo_path)
+        self._entries: list[FileEntry] | None = None
+        self._tree: str | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, repo_path: str) -> "RepositorySnapshot":
+        """
+        Returns the snapshot shared by the whole run for the given repository.
+
+        Args:
+            repo_path: Path to the repository.
+
+        Returns:
+            RepositorySnapshot: Shared snapshot instance.
+        """
+        key = os.path.abspath(repo_path)
+        with cls._registry_lock:
+            if key not in cls._snapshots:
+                cls._snapshots[key] = cls(key)
+            return cls._snapshots[key]
+
+    @property
+    def entries(self) -> list[FileEntry]:
+        """All files and directories of the repository (except .git), sorted by path."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._scan()
+            return self._entries
+
+    @property
+    def tree(self) -> str:
+        """
+        Text representation of the repository's file tree.
+
+        Each file or directory path is on a new line, relative to the repository root. Git and log
+        directories as well as media, data, archive and binary files are excluded.
+        """
+        entries = self.entries
+        with self._lock:
+            if self._tree is None:
+                self._tree = "\n".join(entry.path for entry in entries if self._in_tree(entry))
+            return self._tree
+
+    def files(self, extensions: set[str] | None = None) -> list[FileEntry]:
+        """
+        Returns files of the repository, optionally filtered by extension.
+
+        Args:
+            extensions: Lowercased extensions with a leading dot to keep. All files are returned if None.
+
+        Returns:
+            list[FileEntry]: Matching files sorted by path.
+        """
+        return [
+            entry
+            for entry in self.entries
+            if not entry.is_dir and (extensions is None or entry.extension in extensions)
+        ]
+
+    def invalidate(self) -> None:
+        """Drops the index so that the repository is walked again on next access."""
+        with self._lock:
+            self._entries = None
+            self._tree = None
+
+    def _scan(self) -> list[FileEntry]:
+        """Walks the repository without following directory symlinks."""
+        entries = []
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                with os.scandir(os.path.join(self.repo_path, rel_dir)) as iterator:
+                    dir_entries = list(iterator)
+            except OSError:
+                continue
+
+            for dir_entry in dir_entries:
+                rel_path = f"{rel_dir}/{dir_entry.name}" if rel_dir else dir_entry.name
+                try:
+                    is_dir = dir_entry.is_dir()
+                    stat = dir_entry.stat()
+                    size, mtime = stat.st_size, stat.st_mtime
+                except OSError:
+                    is_dir, size, mtime = False, 0, 0.0
+
+                if is_dir and dir_entry.name.lower() == ".git":
+                    continue
+                entries.append(FileEntry(path=rel_path, is_dir=is_dir, size=size, mtime=mtime))
+                if is_dir and not dir_entry.is_symlink():
+                    stack.append(rel_path)
+
+        entries.sort(key=lambda entry: entry.path.split("/"))
+        return entries
+
+    @staticmethod
+    def _in_tree(entry: FileEntry) -> bool:
+        if any(part.lower() in TREE_EXCLUDED_DIRS for part in entry.path.split("/")):
+            return False
+        return entry.is_dir or entry.extension not in TREE_EXCLUDED_EXTENSIONS
@@ -1,8 +1,9 @@
 import os
 import re
 
+from osa_tool.analytics.snapshot import RepositorySnapshot
 from osa_tool.config.settings import ConfigLoader
-from osa_tool.utils import get_repo_tree, parse_folder_name
+from osa_tool.utils import parse_folder_name
 
 
 class SourceRank:
@@ -11,7 +12,18 @@ class SourceRank:
         self.config = config_loader.config
         self.repo_url = self.config.git.repository
         self.repo_path = os.path.join(os.getcwd(), parse_folder_name(self.repo_url))
-        self.tree = get_repo_tree(self.repo_path)
+        self.snapshot = RepositorySnapshot.for_path(self.repo_path)
+        self._tree: str | None = None
+
+    @property
+    def tree(self) -> str:
+        if self._tree is not None:
+            return self._tree
+        return self.snapshot.tree
+
+    @tree.setter
+    def tree(self, value: str) -> None:
+        self._tree = value
 
     def readme_presence(self) -> bool:
         pattern = re.compile(r"\bREADME(\.\w+)?\b", re.IGNORECASE)
@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from rich.table import Table
+
+from osa_tool.arguments_parser import build_parser_from_yaml, get_keys_from_group_in_yaml
+from osa_tool.models.cache import log_cache_summary
+from osa_tool.models.rate_limiter import log_rate_limiter_summary
+from osa_tool.run import run_pipeline
+from osa_tool.utils import build_arguments_path, console, get_base_repo_url, logger, rich_section
+
+
+def main():
+    """Batch entry point processing many repositories in one OSA process.
+
+    Takes repository URLs from the command line and/or a file, and processes them in a pool of worker
+    processes. Each repository is cloned and processed in its own working directory, and an error in
+    one repository does not stop the others. Heavy modules are imported once in the parent process,
+    and each worker reuses its HTTP connections and LLM response cache across the repositories it handles.
+    An aggregated summary is printed and saved as JSON.
+    """
+    parser = build_batch_parser()
+    args = parser.parse_args()
+    workflow_keys = get_keys_from_group_in_yaml(build_arguments_path(), "workflow")
+
+    repositories = collect_repositories(args.repositories, args.repositories_file)
+    if not repositories:
+        parser.error("No repositories to process: pass --repositories or --repositories-file")
+
+    summary = run_batch(repositories, args, workflow_keys, args.batch_workers, os.path.abspath(args.work_dir))
+
+    print_summary(summary)
+    summary_path = os.path.abspath(args.summary_file)
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    logger.info(f"Batch summary saved to {summary_path}")
+
+
+def build_batch_parser() -> argparse.ArgumentParser:
+    """Extends the regular OSA command-line parser with batch arguments."""
+    parser = build_parser_from_yaml(build_arguments_path())
+    group = parser.add_argument_group("batch arguments")
+    group.add_argument("--repositories", nargs="+", default=[], help="URLs of the GitHub repositories to process.")
+    group.add_argument(
+        "--repositories-file",
+        default=None,
+        help="Path to a file with repository URLs, one per line. Empty lines and lines starting with '#' are ignored.",
+    )
+    group.add_argument("--batch-workers", type=int, default=4, help="Number of repositories processed at once.")
+    group.add_argument("--work-dir", default="osa_batch", help="Directory to clone and process the repositories in.")
+    group.add_argument("--summary-file", default="osa_batch_summary.json", help="Path to save the batch summary to.")
+    return parser
+
+
+def collect_repositories(repositories: list[str], repositories_file: str | None) -> list[str]:
+    """
+    Combines repository URLs from the command line and a file, keeping the first occurrence of each.
+
+    Args:
+        repositories: URLs passed on the command line.
+        repositories_file: Path to a file with one URL per line, or None.
+
+    Returns:
+        list[str]: Unique repository URLs in the given order.
+    """
+    urls = list(repositories)
+    if repositories_file:
+        with open(repositories_file, "r", encoding="utf-8") as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.strip().startswith("#"))
+    return list(dict.fromkeys(url.rstrip("/") for url in urls))
+
+
+def run_batch(repositories: list[str], args, workflow_keys: list, workers: int, work_dir: str) -> list[dict]:
+    """
+    Processes repositories in a pool of worker processes.
+
+    Args:
+        repositories: URLs of the repositories to process.
+        args: Parsed command-line arguments applied to every repository.
+        workflow_keys: Names of the arguments of the workflow group.
+        workers: Number of worker processes.
+        work_dir: Directory to create per-repository working directories in.
+
+    Returns:
+        list[dict]: Result of every repository in the order of the input.
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    cache_directory = os.path.abspath(os.path.join(work_dir, ".osa_cache"))
+    results = {}
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(repositories)))) as executor:
+        futures = {
+            executor.submit(process_repository, repo_url, args, workflow_keys, work_dir, cache_directory): repo_url
+            for repo_url in repositories
+        }
+        for future in as_completed(futures):
+            repo_url = futures[future]
+            try:
+                results[repo_url] = future.result()
+            except Exception as e:
+                results[repo_url] = {"repository": repo_url, "status": "failed", "error": repr(e), "duration": 0.0}
+            logger.info(f"[{len(results)}/{len(repositories)}] {repo_url}: {results[repo_url]['status']}")
+    return [results[repo_url] for repo_url in repositories]
+
+
+def process_repository(repo_url: str, args, workflow_keys: list, work_dir: str, cache_directory: str) -> dict:
+    """
+    Processes one repository in its own working directory. Runs in a worker process.
+
+    Args:
+        repo_url: URL of the repository.
+        args: Parsed command-line arguments applied to every repository.
+        workflow_keys: Names of the arguments of the workflow group.
+        work_dir: Directory to create the repository's working directory in.
+        cache_directory: Directory of the on-disk caches shared by all repositories.
+
+    Returns:
+        dict: Repository URL, status, executed tasks or error, and processing time in seconds.
+    """
+    repo_args = argparse.Namespace(**{**vars(args), "repository": repo_url})
+    repo_dir = os.path.join(work_dir, re.sub(r"[^\w.-]", "__", get_base_repo_url(repo_url)))
+    os.makedirs(repo_dir, exist_ok=True)
+
+    start = time.monotonic()
+    previous_dir = os.getcwd()
+    os.chdir(repo_dir)
+    try:
+        plan = run_pipeline(repo_args, workflow_keys, interactive=False, cache_directory=cache_directory)
+        tasks = sorted(key for key, value in plan.items() if value is True)
+        result = {"repository": repo_url, "status": "success", "tasks": tasks}
+    except Exception as e:
+        logger.error(f"Failed to process {repo_url}: {e}", exc_info=True)
+        result = {"repository": repo_url, "status": "failed", "error": repr(e)}
+    finally:
+        os.chdir(previous_dir)
+        log_cache_summary()
+        log_rate_limiter_summary()
+
+    result["duration"] = round(time.monotonic() - start, 1)
+    return result
+
+
+def print_summary(summary: list[dict]) -> None:
+    """Prints the aggregated batch results as a table."""
+    rich_section("Batch summary")
+    table = Table()
+    table.add_column("Repository")
+    table.add_column("Status")
+    table.add_column("Time, s", justify="right")
+    table.add_column("Details")
+    for result in summary:
+        details = result.get("error") or ", ".join(result.get("tasks", []))
+        status = "[green]success[/green]" if result["status"] == "success" else "[red]failed[/red]"
+        table.add_row(result["repository"], status, str(result["duration"]), details)
+    console.print(table)
+
+    succeeded = sum(result["status"] == "success" for result in summary)
+    logger.info(f"Processed {len(summary)} repositories: {succeeded} succeeded, {len(summary) - succeeded} failed")
+
+
+if __name__ == "__main__":
+    main()
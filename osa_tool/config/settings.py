@@ -14,12 +14,30 @@ from pydantic import (
     Field,
     model_validator,
     NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
     PositiveInt,
 )
 
 from osa_tool.utils import osa_project_root, parse_git_url
 
 
+class ApiSettings(BaseModel):
+    """Limits applied to all LLM requests of the process."""
+
+    rate_limit: PositiveInt = Field(default=10, description="Maximum number of concurrent LLM requests.")
+    requests_per_minute: NonNegativeFloat = Field(
+        default=0, description="Upper bound for LLM requests per minute, 0 to disable."
+    )
+    tokens_per_minute: NonNegativeFloat = Field(
+        default=0, description="Upper bound for estimated prompt and response tokens per minute, 0 to disable."
+    )
+    max_retries: NonNegativeInt = Field(default=5, description="Number of retries of a rate-limited LLM request.")
+    backoff_factor: NonNegativeFloat = Field(default=2, description="Base delay of the exponential backoff in seconds.")
+    max_backoff: PositiveFloat = Field(default=60, description="Upper bound for a single backoff delay in seconds.")
+    system_message: str = ""
+
+
 class GitSettings(BaseModel):
     """
     User repository settings for a remote codebase.
@@ -56,6 +74,10 @@ class ModelSettings(BaseModel):
     temperature: NonNegativeFloat
     tokens: PositiveInt
     top_p: NonNegativeFloat
+    stream: bool = Field(
+        default=False,
+        description="Flag indicating whether to stream responses and stop reading them once they are complete.",
+    )
 
 
 class WorkflowSettings(BaseModel):
@@ -89,14 +111,78 @@ class WorkflowSettings(BaseModel):
     )
 
 
+class CacheSettings(BaseModel):
+    """On-disk cache settings for LLM responses and GitHub topics."""
+
+    enabled: bool = Field(default=True, description="Flag indicating whether to cache LLM responses and topics.")
+    directory: str = Field(default=".osa_cache", description="Directory to store cache files in.")
+    max_size_mb: PositiveInt = Field(default=256, description="Maximum total size of cached responses.")
+    ttl_hours: NonNegativeFloat = Field(default=168, description="Lifetime of a cached response, 0 to disable.")
+
+
+class DocstringSettings(BaseModel):
+    """Docstring generation settings."""
+
+    max_workers: PositiveInt = Field(default=4, description="Maximum number of concurrent docstring requests.")
+    parse_workers: NonNegativeInt = Field(
+        default=0, description="Number of processes parsing source files, 0 to use all CPU cores."
+    )
+    parallel_parse_threshold: PositiveInt = Field(
+        default=32, description="Minimum number of source files to parse them in a process pool."
+    )
+    manifest: str = Field(
+        default=".osa_docstrings.json",
+        description="Path to the manifest of generated docstrings, empty to disable incremental generation.",
+    )
+    parse_cache: bool = Field(
+        default=True,
+        description="Flag indicating whether to keep extracted source file structures in the cache directory.",
+    )
+
+
+class HttpSettings(BaseModel):
+    """Settings of the HTTP client shared by GitHub, PyPI and other web requests."""
+
+    timeout: PositiveFloat = Field(default=30, description="Connect and read timeout of a request in seconds.")
+    max_retries: NonNegativeInt = Field(default=3, description="Number of retries of a failed or rate-limited request.")
+    backoff_factor: NonNegativeFloat = Field(default=1, description="Base delay of the exponential backoff in seconds.")
+    max_backoff: PositiveFloat = Field(default=60, description="Upper bound for a single retry delay in seconds.")
+    pool_maxsize: PositiveInt = Field(default=10, description="Number of kept-alive connections per host.")
+    etag_cache: bool = Field(default=True, description="Flag indicating whether to revalidate GET responses by ETag.")
+
+
+class CloneSettings(BaseModel):
+    """Settings of cloning the processed repository."""
+
+    depth: NonNegativeInt = Field(default=1, description="Number of latest commits to fetch, 0 for the full history.")
+    filter: str = Field(
+        default="",
+        description="Partial clone filter passed to 'git clone --filter', e.g. 'blob:none', empty to disable.",
+    )
+    sparse_extensions: list[str] = Field(
+        default=[],
+        description="Extensions of files to check out besides top-level files, empty to check out the whole tree.",
+    )
+    mirror: bool = Field(
+        default=False,
+        description="Flag indicating whether to keep bare mirrors of repositories in the cache directory "
+        "and update them with fetch instead of cloning anew.",
+    )
+
+
 class Settings(BaseModel):
     """
     Pydantic settings model for the readmegen package.
     """
 
+    api: ApiSettings = Field(default_factory=ApiSettings)
     git: GitSettings
     llm: ModelSettings
     workflows: WorkflowSettings
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    docstrings: DocstringSettings = Field(default_factory=DocstringSettings)
+    http: HttpSettings = Field(default_factory=HttpSettings)
+    clone: CloneSettings = Field(default_factory=CloneSettings)
 
     model_config = ConfigDict(
         validate_assignment=True,
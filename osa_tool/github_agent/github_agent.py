@@ -1,10 +1,12 @@
 import os
+from pathlib import Path
 
-import requests
 from dotenv import load_dotenv
 from git import GitCommandError, InvalidGitRepositoryError, Repo
 
+from osa_tool import http_client
 from osa_tool.analytics.metadata import load_data_metadata
+from osa_tool.config.settings import CloneSettings
 from osa_tool.utils import get_base_repo_url, logger, parse_folder_name
 
 
@@ -22,6 +24,8 @@ class GithubAgent:
         branch_name: The name of the branch to be created.
         repo: The GitPython Repo object representing the repository.
         token: The GitHub token for authentication.
+        clone_settings: Depth, partial clone filter and sparse checkout used for cloning.
+        mirror_dir: The directory of bare repository mirrors reused across runs, or None to clone from GitHub.
     """
 
     AGENT_SIGNATURE = (
@@ -29,13 +33,22 @@ class GithubAgent:
         "\n_OSA just makes your open source project better!_"
     )
 
-    def __init__(self, repo_url: str, repo_branch_name: str = None, branch_name: str = "osa_tool"):
+    def __init__(
+        self,
+        repo_url: str,
+        repo_branch_name: str = None,
+        branch_name: str = "osa_tool",
+        clone_settings: CloneSettings = None,
+        mirror_dir: str = None,
+    ):
         """Initializes the GithubAgent with the repository URL and branch name.
 
         Args:
             repo_url: The URL of the GitHub repository.
             repo_branch_name: The name of the repository's branch to be checked out.
             branch_name: The name of the branch to be created. Defaults to "osa_tool".
+            clone_settings: Depth, partial clone filter and sparse checkout used for cloning. Defaults are used if None.
+            mirror_dir: The directory of bare repository mirrors reused across runs. Defaults to cloning from GitHub.
         """
         load_dotenv()
         self.repo_url = repo_url
@@ -47,6 +60,8 @@ class GithubAgent:
         self.metadata = load_data_metadata(self.repo_url)
         self.base_branch = repo_branch_name or self.metadata.default_branch
         self.pr_report_body = ""
+        self.clone_settings = clone_settings or CloneSettings()
+        self.mirror_dir = mirror_dir
 
     def create_fork(self) -> None:
         """Creates a fork of the repository in the osa_tool account.
@@ -64,7 +79,7 @@ class GithubAgent:
         }
 
         url = f"https://api.github.com/repos/{base_repo}/forks"
-        response = requests.post(url, headers=headers)
+        response = http_client.post(url, headers=headers)
 
         if response.status_code in {200, 202}:
             self.fork_url = response.json()["html_url"]
@@ -90,7 +105,7 @@ class GithubAgent:
 
         # Check if the repository is already starred
         url_check = f"https://api.github.com/user/starred/{base_repo}"
-        response_check = requests.get(url_check, headers=headers)
+        response_check = http_client.get(url_check, headers=headers)
 
         if response_check.status_code == 204:
             logger.info(f"Repository {base_repo} is already starred.")
@@ -101,7 +116,7 @@ class GithubAgent:
 
         # Star the repository
         url_star = f"https://api.github.com/user/starred/{base_repo}"
-        response_star = requests.put(url_star, headers=headers)
+        response_star = http_client.put(url_star, headers=headers)
 
         if response_star.status_code == 204:
             logger.info(f"Repository {base_repo} has been starred successfully.")
@@ -136,12 +151,20 @@ class GithubAgent:
                 logger.info(
                     f"Cloning the {self.base_branch} branch from {self.repo_url} into directory {self.clone_dir}..."
                 )
+                source_url = self._update_mirror() if self.mirror_dir else self._get_auth_url()
+                sparse_patterns = self._sparse_checkout_patterns()
                 self.repo = Repo.clone_from(
-                    url=self._get_auth_url(),
+                    url=source_url,
                     to_path=self.clone_dir,
                     branch=self.base_branch,
                     single_branch=True,
+                    **self._clone_options(no_checkout=bool(sparse_patterns)),
                 )
+                if self.mirror_dir:
+                    self.repo.remote().set_url(self._get_auth_url())
+                if sparse_patterns:
+                    self.repo.git.sparse_checkout("set", "--no-cone", *sparse_patterns)
+                    self.repo.git.checkout(self.base_branch)
                 logger.info("Cloning completed")
             except GitCommandError as e:
                 logger.error(f"Cloning failed: {repr(e)}")
@@ -247,7 +270,7 @@ class GithubAgent:
             "Accept": "application/vnd.github.v3+json",
         }
         url = f"https://api.github.com/repos/{base_repo}/pulls"
-        response = requests.post(url, json=pr_data, headers=headers)
+        response = http_client.post(url, json=pr_data, headers=headers)
 
         if response.status_code == 201:
             logger.info(f"Pull request created successfully: {response.json()['html_url']}")
@@ -318,7 +341,7 @@ class GithubAgent:
             "description": about_content["description"],
             "homepage": about_content["homepage"],
         }
-        response = requests.patch(url, headers=headers, json=about_data)
+        response = http_client.patch(url, headers=headers, json=about_data)
 
         if response.status_code in {200, 201}:
             logger.info(f"Successfully updated repository description and homepage.")
@@ -334,13 +357,58 @@ class GithubAgent:
             "Content-Type": "application/json",
         }
         topics_data = {"names": about_content["topics"]}
-        response = requests.put(url, headers=headers, json=topics_data)
+        response = http_client.put(url, headers=headers, json=topics_data)
 
         if response.status_code in {200, 201}:
             logger.info(f"Successfully updated repository topics.")
         else:
             logger.error(f"{response.status_code} - Failed to update topics for {repo_url}.")
 
+    def _clone_options(self, no_checkout: bool) -> dict:
+        """Builds the `git clone` options for the depth, partial clone filter and sparse checkout settings."""
+        options = {}
+        if self.clone_settings.depth:
+            options["depth"] = self.clone_settings.depth
+        if self.clone_settings.filter:
+            options["filter"] = self.clone_settings.filter
+        if no_checkout:
+            options["no_checkout"] = True
+        return options
+
+    def _sparse_checkout_patterns(self) -> list[str]:
+        """Builds sparse checkout patterns selecting top-level files and files with the configured extensions.
+
+        Returns:
+            Patterns for `git sparse-checkout set --no-cone`, or an empty list to check out the whole tree.
+        """
+        extensions = [ext if ext.startswith(".") else f".{ext}" for ext in self.clone_settings.sparse_extensions]
+        if not extensions:
+            return []
+        return ["/*", "!/*/", "/.github/"] + [f"*{ext}" for ext in extensions]
+
+    def _update_mirror(self) -> str:
+        """Creates or updates the bare mirror of the repository in the mirror directory.
+
+        The mirror keeps the full history of all branches and tags, so after the first run only new
+        objects are fetched. Credentials are passed on the command line and never stored in the mirror.
+
+        Returns:
+            The file URL of the mirror to clone the working copy from.
+
+        Raises:
+            GitCommandError: If fetching the repository fails.
+        """
+        mirror_path = os.path.join(self.mirror_dir, get_base_repo_url(self.repo_url).replace("/", "__") + ".git")
+        if os.path.exists(mirror_path):
+            logger.info(f"Updating repository mirror at {mirror_path}...")
+            mirror = Repo(mirror_path)
+        else:
+            logger.info(f"Creating repository mirror at {mirror_path}...")
+            mirror = Repo.init(mirror_path, bare=True, mkdir=True)
+            mirror.git.config("uploadpack.allowFilter", "true")
+        mirror.git.fetch(self._get_auth_url(), "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*", "--prune")
+        return Path(mirror_path).resolve().as_uri()
+
     def _get_auth_url(self, url: str = None) -> str:
         """Converts the repository URL by adding a token for authentication.
 
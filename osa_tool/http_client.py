@@ -0,0 +1,223 @@
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from osa_tool.config.settings import HttpSettings
+from osa_tool.utils import logger
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HttpClient:
+    """
+    HTTP client shared by all GitHub, PyPI and other web requests of a run.
+
+    Connections are kept alive in a pooled session. Every request gets a timeout, failed and
+    rate-limited requests are retried with exponential backoff that honors the `Retry-After`
+    and `X-RateLimit-Reset` headers, and GET responses carrying an ETag are revalidated with
+    conditional requests, so that unchanged resources are served from memory.
+
+    Attributes:
+        settings: Timeouts, retry and pooling settings.
+        session: Pooled session used for all requests.
+    """
+
+    def __init__(self, settings: HttpSettings | None = None):
+        """
+        Creates a pooled session.
+
+        Args:
+            settings: Timeouts, retry and pooling settings. Defaults are used if None.
+        """
+        self.settings = settings or HttpSettings()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.settings.pool_maxsize, pool_maxsize=self.settings.pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._etags: dict[tuple, requests.Response] = {}
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request, retrying it on connection errors, server errors and rate limits.
+
+        Non-idempotent requests (POST, PATCH) are retried only when the server explicitly
+        rejected them because of a rate limit, so they are never applied twice.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Arguments accepted by `requests.Session.request`.
+
+        Returns:
+            requests.Response: The last response received.
+
+        Raises:
+            requests.RequestException: If the request could not be sent after all retries.
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", self.settings.timeout)
+        headers = dict(kwargs.pop("headers", None) or {})
+
+        cache_key = None
+        if method == "GET" and self.settings.etag_cache and not kwargs.get("stream"):
+            cache_key = self._cache_key(url, headers, kwargs.get("params"))
+            with self._lock:
+                cached = self._etags.get(cache_key)
+            if cached is not None:
+                headers["If-None-Match"] = cached.headers["ETag"]
+
+        for attempt in range(self.settings.max_retries + 1):
+            is_last = attempt == self.settings.max_retries
+            try:
+                response = self.session.request(method, url, headers=headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if is_last or method not in IDEMPOTENT_METHODS:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{method} {url} failed: {e}. Retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            if is_last or not self._should_retry(method, response):
+                break
+            delay = self._retry_delay(response, attempt)
+            logger.warning(f"{method} {url} returned {response.status_code}. Retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+        if cache_key is not None:
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"Not modified, using cached response: {url}")
+                return cached
+            if response.status_code == 200 and response.headers.get("ETag"):
+                with self._lock:
+                    self._etags[cache_key] = response
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Sends a GET request. See `request`."""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """Sends a HEAD request. See `request`."""
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Sends a POST request. See `request`."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        """Sends a PUT request. See `request`."""
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        """Sends a PATCH request. See `request`."""
+        return self.request("PATCH", url, **kwargs)
+
+    @staticmethod
+    def _cache_key(url: str, headers: dict, params) -> tuple:
+        """Identifies a GET request by its URL, parameters and headers, including credentials."""
+        params_key = tuple(sorted(params.items())) if isinstance(params, dict) else params
+        return url, params_key, tuple(sorted((key.lower(), value) for key, value in headers.items()))
+
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """Checks whether the server rejected the request because of a primary or secondary rate limit."""
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        return (
+            response.headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in response.headers
+            or "rate limit" in response.text.lower()
+        )
+
+    def _should_retry(self, method: str, response: requests.Response) -> bool:
+        if self._is_rate_limited(response):
+            return True
+        return method in IDEMPOTENT_METHODS and response.status_code in RETRY_STATUSES
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Takes the delay requested by the server, falling back to exponential backoff."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0), self.settings.max_backoff)
+            except ValueError:
+                pass
+
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset is not None and response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                return min(max(float(reset) - time.time(), 0) + 1, self.settings.max_backoff)
+            except ValueError:
+                pass
+
+        return self._backoff(attempt)
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter."""
+        delay = self.settings.backoff_factor * (2**attempt)
+        return min(delay + random.uniform(0, self.settings.backoff_factor), self.settings.max_backoff)
+
+
+_client: HttpClient | None = None
+_client_lock = threading.Lock()
+
+
+def configure_http_client(settings: HttpSettings) -> HttpClient:
+    """
+    Replaces the shared client with one built from the given settings.
+
+    The current client and its open connections are kept if it already uses the same settings.
+
+    Args:
+        settings: HTTP settings from the configuration.
+
+    Returns:
+        HttpClient: The shared client.
+    """
+    global _client
+    with _client_lock:
+        if _client is None or _client.settings != settings:
+            _client = HttpClient(settings)
+        return _client
+
+
+def get_http_client() -> HttpClient:
+    """Returns the client shared by the whole process, creating it with default settings if needed."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Sends a GET request with the shared client."""
+    return get_http_client().get(url, **kwargs)
+
+
+def head(url: str, **kwargs) -> requests.Response:
+    """Sends a HEAD request with the shared client."""
+    return get_http_client().head(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """Sends a POST request with the shared client."""
+    return get_http_client().post(url, **kwargs)
+
+
+def put(url: str, **kwargs) -> requests.Response:
+    """Sends a PUT request with the shared client."""
+    return get_http_client().put(url, **kwargs)
+
+
+def patch(url: str, **kwargs) -> requests.Response:
+    """Sends a PATCH request with the shared client."""
+    return get_http_client().patch(url, **kwargs)
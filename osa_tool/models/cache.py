@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from osa_tool.config.settings import CacheSettings
+from osa_tool.utils import logger
+
+
+class ResponseCache:
+    """
+    Persistent content-addressed storage for LLM responses.
+
+    Responses are stored in a SQLite database and addressed by a hash of the model name,
+    sampling temperature and the full list of chat messages. The cache is bounded both by
+    total size (least recently used entries are evicted first) and by entry age (TTL).
+
+    Attributes:
+        path: Path to the SQLite database file.
+        max_size_bytes: Upper bound for the total size of stored responses.
+        ttl_seconds: Lifetime of a cached response. Zero disables expiration.
+        hits: Number of lookups served from the cache during the current run.
+        misses: Number of lookups not found in the cache during the current run.
+    """
+
+    def __init__(self, path: str, max_size_mb: int, ttl_hours: float):
+        """
+        Opens (or creates) the cache database and drops expired entries.
+
+        Args:
+            path: Path to the SQLite database file.
+            max_size_mb: Maximum total size of stored responses in megabytes.
+            ttl_hours: Lifetime of a cached response in hours. Zero disables expiration.
+        """
+        self.path = path
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.ttl_seconds = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_accessed_at ON responses (accessed_at)")
+        self._connection.commit()
+        self._purge_expired()
+
+    @staticmethod
+    def make_key(model: str, temperature: float, messages: list[dict]) -> str:
+        """
+        Builds a content address for a request.
+
+        Args:
+            model: Name of the model the request is sent to.
+            temperature: Sampling temperature of the request.
+            messages: Chat messages of the request.
+
+        Returns:
+            str: SHA-256 hex digest identifying the request.
+        """
+        material = json.dumps(
+            {"model": model, "temperature": temperature, "messages": messages},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns a cached response and marks it as recently used.
+
+        Args:
+            key: Content address of the request.
+
+        Returns:
+            str | None: The cached response, or None if it is absent or expired.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self._is_expired(row[1], now):
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._connection.commit()
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._connection.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Stores a response and evicts least recently used entries if the size limit is exceeded.
+
+        Args:
+            key: Content address of the request.
+            response: Response text returned by the model.
+        """
+        if not isinstance(response, str):
+            return
+
+        size = len(response.encode("utf-8"))
+        if size > self.max_size_bytes:
+            logger.debug(f"Response of {size} bytes exceeds cache size limit, not caching it")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, response, size, now, now),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def summary(self) -> dict:
+        """
+        Returns hit/miss statistics of the current run.
+
+        Returns:
+            dict: Number of hits, misses, total lookups and the hit ratio.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "lookups": lookups,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Removes all stored responses."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - created_at > self.ttl_seconds
+
+    def _purge_expired(self) -> None:
+        """Drops all entries older than the configured TTL."""
+        if not self.ttl_seconds:
+            return
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            self._connection.commit()
+
+    def _evict(self) -> None:
+        """Deletes least recently used entries until the total size fits the limit. Caller holds the lock."""
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} entries from LLM response cache")
+
+
+_caches: dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(settings: CacheSettings) -> ResponseCache | None:
+    """
+    Returns the process-wide response cache for the given settings.
+
+    Handlers are built independently by many modules, so caches are shared per database path
+    to keep a single hit/miss counter for the whole run.
+
+    Args:
+        settings: Cache settings from the configuration.
+
+    Returns:
+        ResponseCache | None: Shared cache instance, or None if caching is disabled or not configured.
+    """
+    if not isinstance(settings, CacheSettings) or not settings.enabled:
+        return None
+
+    path = os.path.abspath(os.path.join(settings.directory, "llm_responses.sqlite"))
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = ResponseCache(path, settings.max_size_mb, settings.ttl_hours)
+        return _caches[path]
+
+
+def log_cache_summary() -> None:
+    """Logs hit/miss statistics of every response cache used during the run."""
+    for path, cache in _caches.items():
+        stats = cache.summary()
+        if not stats["lookups"]:
+            continue
+        logger.info(
+            f"LLM response cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_ratio']:.0%} hit ratio) at {path}"
+        )
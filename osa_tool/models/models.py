@@ -1,5 +1,8 @@
+import json
 import os
+import threading
 from abc import ABC, abstractmethod
+from typing import Iterator
 from uuid import uuid4
 
 import dotenv
@@ -8,6 +11,8 @@ import requests
 from protollm.connectors import create_llm_connector
 
 from osa_tool.config.settings import Settings
+from osa_tool.models.cache import ResponseCache, get_response_cache
+from osa_tool.models.rate_limiter import RateLimiter, get_rate_limiter
 from osa_tool.utils import logger
 
 
@@ -19,6 +24,9 @@ class ModelHandler(ABC):
     Methods:
      send_request: Sends a request to a specified URL and returns the response. The response is of type requests.Response.
 
+     send_request_stream: Sends a request and yields the response in chunks as they are generated.
+      Handlers without streaming support yield the whole response as a single chunk.
+
      initialize_payload: Initializes the payload for the instance using the provided configuration and prompt.
       The payload is generated using the payloadFactory and is then converted to payload completions and stored in the instance's payload attribute.
       The method takes two arguments: config which are the configuration settings to be used for payload generation,
@@ -31,21 +39,41 @@ class ModelHandler(ABC):
     @abstractmethod
     def send_request(self, prompt: str) -> str: ...
 
-    def initialize_payload(self, config: Settings, prompt: str) -> None:
+    def send_request_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Sends a request and yields the response in chunks as they are generated.
+
+        Closing the returned generator stops reading the response, so callers can stop a generation
+        as soon as they have received what they need.
+
+        Args:
+            prompt: The prompt to send.
+
+        Returns:
+            Iterator[str]: Chunks of the response.
+        """
+        yield self.send_request(prompt)
+
+    def initialize_payload(self, config: Settings, prompt: str) -> dict:
         """
         Initializes the payload for the instance.
 
         This method uses the provided configuration and prompt to generate a payload using the payloadFactory.
         The generated payload is then converted to payload completions and stored in the instance's payload attribute.
 
+        Handlers are shared between threads, so requests should use the returned payload
+        rather than the attribute, which may be overwritten by a concurrent request.
+
         Args:
             config: The configuration settings to be used for payload generation.
             prompt: The prompt to be used for payload generation.
 
         Returns:
-            None
+            dict: The generated payload.
         """
-        self.payload = PayloadFactory(config, prompt).to_payload_completions()
+        payload = PayloadFactory(config, prompt).to_payload_completions()
+        self.payload = payload
+        return payload
 
 
 class PayloadFactory:
@@ -188,8 +216,8 @@ class LlamaHandler(ModelHandler):
         Returns:
             str: The response received from the request.
         """
-        self.initialize_payload(self.config, prompt)
-        response = requests.post(url=self.url, json=self.payload)
+        payload = self.initialize_payload(self.config, prompt)
+        response = requests.post(url=self.url, json=payload)
         logger.info(response)
         return response.json()["content"]
 
@@ -239,8 +267,7 @@ class OpenaiHandler(ModelHandler):
         Returns:
             str: The response received from the request.
         """
-        self.initialize_payload(self.config, prompt)
-        messages = self.payload["messages"]
+        messages = self.initialize_payload(self.config, prompt)["messages"]
         response = self.client.chat.completions.create(
             model=self.config.llm.model,
             messages=messages,
@@ -249,6 +276,31 @@ class OpenaiHandler(ModelHandler):
         )
         return response.choices[0].message.content
 
+    def send_request_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Sends a streaming chat completion request and yields the content deltas.
+
+        Args:
+            prompt: The prompt to initialize the payload with.
+
+        Returns:
+            Iterator[str]: Chunks of the response.
+        """
+        messages = self.initialize_payload(self.config, prompt)["messages"]
+        stream = self.client.chat.completions.create(
+            model=self.config.llm.model,
+            messages=messages,
+            max_tokens=self.config.llm.tokens,
+            temperature=self.config.llm.temperature,
+            stream=True,
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()
+
     def _configure_api(self) -> None:
         """
         Configures the API for the instance based on the provided base_url.
@@ -315,22 +367,56 @@ class OllamaHandler(ModelHandler):
             str: Generated response content from the model.
         """
 
-        self.initialize_payload(self.config, prompt)
-
-        self.payload["model"] = self.model
-        self.payload["stream"] = False
-        self.payload["options"] = {
-            "temperature": self.payload["meta"]["temperature"],
-            "max_tokens": self.payload["meta"]["tokens_limit"],
-        }
+        payload = self._initialize_chat_payload(prompt, stream=False)
 
         try:
-            response = self.client.post(f"{self.base_url}/api/chat", json=self.payload)
+            response = self.client.post(f"{self.base_url}/api/chat", json=payload)
             response.raise_for_status()
             return response.json()["message"]["content"]
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Ollama API request failed: {str(e)}") from e
 
+    def send_request_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Sends a streaming chat request to Ollama API and yields the generated content.
+
+        Closing the generator closes the connection, which makes Ollama stop the generation.
+
+        Args:
+            prompt: Input text to send to the model.
+
+        Returns:
+            Iterator[str]: Chunks of the response.
+        """
+        payload = self._initialize_chat_payload(prompt, stream=True)
+
+        try:
+            with self.client.post(f"{self.base_url}/api/chat", json=payload, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    content = data.get("message", {}).get("content")
+                    if content:
+                        yield content
+                    if data.get("done"):
+                        break
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Ollama API request failed: {str(e)}") from e
+
+    def _initialize_chat_payload(self, prompt: str, stream: bool) -> dict:
+        """Builds the Ollama chat payload for the prompt."""
+        payload = self.initialize_payload(self.config, prompt)
+
+        payload["model"] = self.model
+        payload["stream"] = stream
+        payload["options"] = {
+            "temperature": payload["meta"]["temperature"],
+            "max_tokens": payload["meta"]["tokens_limit"],
+        }
+        return payload
+
 
 class ProtollmHandler(ModelHandler):
     """
@@ -385,11 +471,25 @@ class ProtollmHandler(ModelHandler):
         Returns:
             str: The response received from the request.
         """
-        self.initialize_payload(self.config, prompt)
-        messages = self.payload["messages"]
+        messages = self.initialize_payload(self.config, prompt)["messages"]
         response = self.client.invoke(messages)
         return response.content
 
+    def send_request_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Sends a request through the ProtoLLM connector and yields the response chunks as they arrive.
+
+        Args:
+            prompt: The prompt to initialize the payload with.
+
+        Returns:
+            Iterator[str]: Chunks of the response.
+        """
+        messages = self.initialize_payload(self.config, prompt)["messages"]
+        for chunk in self.client.stream(messages):
+            if chunk.content:
+                yield chunk.content
+
     def _configure_api(self, api: str, model_name: str) -> None:
         """
         Configures the API for the instance based on the provided API name.
@@ -411,6 +511,165 @@ class ProtollmHandler(ModelHandler):
         self.client = connector_creator(model_url)
 
 
+class CachedModelHandler(ModelHandler):
+    """
+    Wraps another handler with a persistent response cache.
+
+    Requests are addressed by the model name, temperature and chat messages, so identical prompts
+    sent during repeated runs on the same repository are answered from disk instead of the backend.
+
+    Methods:
+        __init__:
+            Initializes the wrapper with the handler to delegate to and the cache to use.
+
+        send_request:
+            Returns a cached response for the prompt if one exists, otherwise sends the request through
+            the wrapped handler and stores the response.
+
+        send_request_stream:
+            Yields a cached response as a single chunk, otherwise streams the response of the wrapped
+            handler and stores what was received.
+    """
+
+    def __init__(self, handler: ModelHandler, cache: ResponseCache, config: Settings):
+        """
+        Initializes the wrapper with the handler to delegate to and the cache to use.
+
+        Args:
+            handler: The handler that actually sends requests to the backend.
+            cache: The response cache shared by all handlers of the run.
+            config: The configuration settings used to build the request messages.
+
+        Returns:
+            None
+        """
+        self.handler = handler
+        self.cache = cache
+        self.config = config
+
+    def __getattr__(self, name: str):
+        return getattr(self.handler, name)
+
+    def send_request(self, prompt: str) -> str:
+        """
+        Sends a request through the wrapped handler unless its response is already cached.
+
+        Args:
+            prompt: The prompt to send.
+
+        Returns:
+            str: The cached or freshly received response.
+        """
+        key = self._make_key(prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"LLM response cache hit: {key}")
+            return cached
+
+        response = self.handler.send_request(prompt)
+        self.cache.put(key, response)
+        return response
+
+    def send_request_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Streams a response through the wrapped handler unless it is already cached.
+
+        The received text is stored when the stream ends, and also when the caller closes the stream
+        early because the response is already complete for its purpose. A stream interrupted by an
+        error is not stored.
+
+        Args:
+            prompt: The prompt to send.
+
+        Returns:
+            Iterator[str]: Chunks of the cached or freshly received response.
+        """
+        key = self._make_key(prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"LLM response cache hit: {key}")
+            yield cached
+            return
+
+        stream = self.handler.send_request_stream(prompt)
+        received = ""
+        completed = False
+        try:
+            for chunk in stream:
+                received += chunk
+                yield chunk
+            completed = True
+        except GeneratorExit:
+            completed = True
+            raise
+        finally:
+            stream.close()
+            if completed and received:
+                self.cache.put(key, received)
+
+    def _make_key(self, prompt: str) -> str:
+        messages = PayloadFactory(self.config, prompt).roles
+        return self.cache.make_key(self.config.llm.model, self.config.llm.temperature, messages)
+
+
+class RateLimitedModelHandler(ModelHandler):
+    """
+    Wraps another handler so that its requests go through the process-wide rate limiter.
+
+    Methods:
+        __init__:
+            Initializes the wrapper with the handler to delegate to and the limiter to use.
+
+        send_request:
+            Sends the request through the wrapped handler once the limiter allows it,
+            retrying it if the backend rejects it because of a rate limit.
+
+        send_request_stream:
+            Streams the response of the wrapped handler, holding a concurrency slot until the stream is closed.
+    """
+
+    def __init__(self, handler: ModelHandler, limiter: RateLimiter):
+        """
+        Initializes the wrapper with the handler to delegate to and the limiter to use.
+
+        Args:
+            handler: The handler that actually sends requests to the backend.
+            limiter: The limiter shared by all handlers of the process.
+
+        Returns:
+            None
+        """
+        self.handler = handler
+        self.limiter = limiter
+
+    def __getattr__(self, name: str):
+        return getattr(self.handler, name)
+
+    def send_request(self, prompt: str) -> str:
+        """
+        Sends a request through the wrapped handler within the rate limits.
+
+        Args:
+            prompt: The prompt to send.
+
+        Returns:
+            str: The response received from the request.
+        """
+        return self.limiter.call(self.handler.send_request, prompt)
+
+    def send_request_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Streams a response through the wrapped handler within the rate limits.
+
+        Args:
+            prompt: The prompt to send.
+
+        Returns:
+            Iterator[str]: Chunks of the response.
+        """
+        return self.limiter.stream(self.handler.send_request_stream, prompt)
+
+
 class ModelHandlerFactory:
     """
     Class: modelHandlerFactory
@@ -423,19 +682,29 @@ class ModelHandlerFactory:
         and then creates and returns a handler using the configuration. The class from which the configuration is
         retrieved is passed as an argument.
 
+     get_handler:
+        This method returns the pooled handler for the API, URL, model and sampling settings of the configuration,
+        creating it on first use. Handlers are thread-safe and shared by all modules of the process, so that
+        clients, sessions and their connection pools are created once.
+
      create_handler:
         This method uses the model specified in the configuration to create a handler. It supports three types of
         models: 'llama', 'openai', and 'gpt-4'. For 'llama', it creates a llamaHandler, and for 'openai' and 'gpt-4',
         it creates an openaiHandler. The configuration object which contains the model information is passed as an argument.
     """
 
+    _handlers: dict[tuple, ModelHandler] = {}
+    _handlers_lock = threading.Lock()
+
     @classmethod
     def build(cls, config: Settings) -> ModelHandler:
         """
         Builds and returns a handler based on the configuration of the class.
 
         This method retrieves the configuration from the class
-        and then creates and returns a handler using the configuration.
+        and then returns the pooled handler for the configuration.
+        Requests of the handler go through the process-wide rate limiter. If response caching is enabled,
+        the handler is also wrapped with the shared response cache, so that cached responses are not rate limited.
 
         Args:
             config: The configuration object which contains the model information.
@@ -444,7 +713,35 @@ class ModelHandlerFactory:
         Returns:
             None: This method does not return anything.
         """
-        return cls.create_handler(config)
+        handler = cls.get_handler(config)
+        limiter = get_rate_limiter(config.api)
+        if limiter is not None:
+            handler = RateLimitedModelHandler(handler, limiter)
+        cache = get_response_cache(config.cache)
+        if cache is not None:
+            return CachedModelHandler(handler, cache, config)
+        return handler
+
+    @classmethod
+    def get_handler(cls, config: Settings) -> ModelHandler:
+        """
+        Returns the pooled handler for the configuration, creating it on first use.
+
+        Handlers are keyed by everything they use to send requests: the API, URL, model and sampling settings.
+
+        Args:
+            config: The configuration object which contains the model information.
+
+        Returns:
+            ModelHandler: The handler shared by all modules of the process.
+        """
+        llm = config.llm
+        key = (llm.api, llm.url, llm.model, llm.temperature, llm.tokens)
+        with cls._handlers_lock:
+            handler = cls._handlers.get(key)
+            if handler is None:
+                handler = cls._handlers[key] = cls.create_handler(config)
+            return handler
 
     @staticmethod
     def create_handler(config: Settings) -> ModelHandler:
@@ -0,0 +1,303 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from osa_tool.config.settings import ApiSettings
+from osa_tool.utils import logger
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at a fixed rate per minute.
+
+    The bucket holds at most one minute worth of tokens, so short bursts are allowed
+    while the average rate stays within the limit.
+
+    Attributes:
+        rate_per_second: Number of tokens added per second.
+        capacity: Maximum number of stored tokens.
+    """
+
+    def __init__(self, per_minute: float):
+        """
+        Creates a full bucket.
+
+        Args:
+            per_minute: Number of tokens added per minute.
+        """
+        self.rate_per_second = per_minute / 60
+        self.capacity = per_minute
+        self._tokens = per_minute
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1) -> float:
+        """
+        Takes tokens from the bucket, waiting until enough of them are available.
+
+        Amounts larger than the capacity wait for a full bucket, so they never block forever.
+
+        Args:
+            amount: Number of tokens to take.
+
+        Returns:
+            float: Time spent waiting in seconds.
+        """
+        with self._lock:
+            self._refill()
+            needed = min(amount, self.capacity)
+            delay = max(needed - self._tokens, 0) / self.rate_per_second
+            self._tokens -= amount
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def consume(self, amount: float) -> None:
+        """Takes tokens without waiting. The balance may go negative, delaying later acquisitions."""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated_at) * self.rate_per_second, self.capacity)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """
+    Process-wide governor for LLM requests.
+
+    Every request waits for a free concurrency slot, for the requests-per-minute bucket and for the
+    tokens-per-minute bucket. Requests rejected by the backend because of a rate limit are retried with
+    exponential backoff, and the backoff pauses all requests, not only the rejected one, since the
+    backend limit is shared by the whole process.
+
+    Attributes:
+        settings: Concurrency, rate and retry settings.
+        requests: Number of requests sent through the limiter.
+        throttled: Number of requests rejected by the backend because of a rate limit.
+        wait_seconds: Total time requests spent waiting in the queue.
+        max_wait_seconds: Longest time a single request spent waiting in the queue.
+    """
+
+    def __init__(self, settings: ApiSettings):
+        """
+        Creates the limiter.
+
+        Args:
+            settings: Concurrency, rate and retry settings.
+        """
+        self.settings = settings
+        self._slots = threading.BoundedSemaphore(settings.rate_limit)
+        self._request_bucket = TokenBucket(settings.requests_per_minute) if settings.requests_per_minute else None
+        self._token_bucket = TokenBucket(settings.tokens_per_minute) if settings.tokens_per_minute else None
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @contextmanager
+    def slot(self, prompt_tokens: int) -> Iterator[None]:
+        """
+        Holds a concurrency slot for the duration of a request, after waiting for the rate limits.
+
+        Args:
+            prompt_tokens: Estimated number of tokens in the request.
+        """
+        start = time.monotonic()
+        self._slots.acquire()
+        try:
+            self._wait_for_pause()
+            if self._request_bucket is not None:
+                self._request_bucket.acquire()
+            if self._token_bucket is not None:
+                self._token_bucket.acquire(prompt_tokens)
+            self._record_wait(time.monotonic() - start)
+            yield
+        finally:
+            self._slots.release()
+
+    def call(self, func, prompt: str, *args, **kwargs):
+        """
+        Calls the function for the prompt within the limits, retrying it if the backend rejects it with a rate limit.
+
+        Args:
+            func: Function sending the request, called as `func(prompt, *args, **kwargs)`.
+            prompt: The prompt to send.
+            *args: Other positional arguments of the function.
+            **kwargs: Keyword arguments of the function.
+
+        Returns:
+            The value returned by the function.
+        """
+        for attempt in range(self.settings.max_retries + 1):
+            with self.slot(estimate_tokens(prompt)):
+                try:
+                    response = func(prompt, *args, **kwargs)
+                except Exception as e:
+                    if attempt == self.settings.max_retries or not is_rate_limit_error(e):
+                        raise
+                    self.backoff(attempt, e)
+                    continue
+            self.record_response(response)
+            return response
+
+    def stream(self, func, prompt: str) -> Iterator[str]:
+        """
+        Streams a response for the prompt within the limits.
+
+        The concurrency slot is held until the stream ends or is closed. A request rejected because of
+        a rate limit is retried only if no chunk has been received yet.
+
+        Args:
+            func: Function returning the stream, called as `func(prompt)`.
+            prompt: The prompt to send.
+
+        Returns:
+            Iterator[str]: Chunks of the response.
+        """
+        for attempt in range(self.settings.max_retries + 1):
+            with self.slot(estimate_tokens(prompt)):
+                stream = func(prompt)
+                received = ""
+                try:
+                    for chunk in stream:
+                        received += chunk
+                        yield chunk
+                    return
+                except Exception as e:
+                    if received or attempt == self.settings.max_retries or not is_rate_limit_error(e):
+                        raise
+                    self.backoff(attempt, e)
+                finally:
+                    stream.close()
+                    if received:
+                        self.record_response(received)
+
+    def record_response(self, response) -> None:
+        """Charges the tokens of a received response to the tokens-per-minute bucket."""
+        if self._token_bucket is not None and isinstance(response, str):
+            self._token_bucket.consume(estimate_tokens(response))
+
+    def backoff(self, attempt: int, error: Exception) -> None:
+        """
+        Pauses all requests after the backend rejected one of them because of a rate limit.
+
+        Args:
+            attempt: Number of the failed attempt, starting from zero.
+            error: The rate limit error.
+        """
+        delay = retry_after(error)
+        if delay is None:
+            delay = self.settings.backoff_factor * (2**attempt) + random.uniform(0, self.settings.backoff_factor)
+        delay = min(delay, self.settings.max_backoff)
+        with self._lock:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        logger.warning(f"LLM request was rate limited, pausing requests for {delay:.1f}s: {error}")
+
+    def summary(self) -> dict:
+        """Returns request and queue wait statistics for the current run."""
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 1),
+            "max_wait_seconds": round(self.max_wait_seconds, 1),
+        }
+
+    def _wait_for_pause(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        if waited >= 1:
+            logger.debug(f"LLM request waited {waited:.1f}s in the queue")
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimates the number of tokens in a text, assuming four characters per token."""
+    return len(text) // 4 + 1
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Checks whether an error raised by a handler means that the backend rejected the request because of a rate limit.
+
+    Handlers wrap errors of their clients, so the whole chain of causes is checked.
+    """
+    while error is not None:
+        if _status_code(error) == 429 or "rate limit" in str(error).lower():
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Extracts the delay requested by the backend in the `Retry-After` header of a rate limit error."""
+    while error is not None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            if "Retry-After" in headers:
+                return max(float(headers["Retry-After"]), 0)
+        except (TypeError, ValueError):
+            pass
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def _status_code(error: BaseException) -> int | None:
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+_limiter: RateLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(settings: ApiSettings) -> RateLimiter | None:
+    """
+    Returns the limiter shared by all model handlers of the process.
+
+    Handlers are built independently by many modules, so the limiter is created once and only
+    recreated if the settings change.
+
+    Args:
+        settings: API settings from the configuration.
+
+    Returns:
+        RateLimiter | None: Shared limiter, or None if the settings are not configured.
+    """
+    global _limiter
+    if not isinstance(settings, ApiSettings):
+        return None
+    with _limiter_lock:
+        if _limiter is None or _limiter.settings != settings:
+            _limiter = RateLimiter(settings)
+        return _limiter
+
+
+def log_rate_limiter_summary() -> None:
+    """Logs request, throttling and queue wait statistics of the shared limiter."""
+    if _limiter is None or not _limiter.requests:
+        return
+    stats = _limiter.summary()
+    logger.info(
+        f"LLM requests: {stats['requests']} sent, {stats['throttled']} rate limited, "
+        f"{stats['wait_seconds']}s total queue wait (max {stats['max_wait_seconds']}s)"
+    )
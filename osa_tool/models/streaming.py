@@ -0,0 +1,75 @@
+from typing import Callable, Iterable
+
+
+def collect_stream(chunks: Iterable[str], is_complete: Callable[[str], bool] | None = None) -> str:
+    """
+    Joins streamed response chunks, stopping as soon as the response is complete.
+
+    Once `is_complete` returns True for the text received so far, the stream is closed,
+    which cancels the generation on the backend side.
+
+    Args:
+        chunks: Response chunks yielded by `ModelHandler.send_request_stream`.
+        is_complete: Predicate telling whether the text received so far contains everything the caller needs.
+            The whole stream is read if None.
+
+    Returns:
+        str: The text received before the stream ended or was stopped.
+    """
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        if is_complete is not None and is_complete(text):
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            break
+    return text
+
+
+def json_object_end(text: str) -> int:
+    """
+    Finds the end of the first complete top-level JSON object in the text.
+
+    Args:
+        text: Text that may contain a JSON object surrounded by other text.
+
+    Returns:
+        int: Index right after the closing brace of the object, or -1 if no object is complete yet.
+    """
+    start = text.find("{")
+    if start == -1:
+        return -1
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
+
+def is_json_complete(text: str) -> bool:
+    """Checks whether the text contains a complete JSON object."""
+    return json_object_end(text) != -1
+
+
+def is_docstring_complete(text: str) -> bool:
+    """Checks whether the text contains both the opening and the closing triple quotes of a docstring."""
+    start = text.find('"""')
+    return start != -1 and text.find('"""', start + 3) != -1
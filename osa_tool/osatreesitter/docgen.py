@@ -1,6 +1,7 @@
 import os
 import re
 import black
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import shutil
 import subprocess
@@ -11,6 +12,12 @@ import yaml
 
 from osa_tool.config.settings import ConfigLoader
 from osa_tool.models.models import ModelHandler, ModelHandlerFactory
+from osa_tool.models.streaming import collect_stream, is_docstring_complete
+from osa_tool.osatreesitter.docstring_inserter import DocstringInserter
+from osa_tool.osatreesitter.docstring_manifest import DocstringManifest
+from osa_tool.osatreesitter.osa_treesitter import StructureStream
+from osa_tool.osatreesitter.structures import preload_source
+from osa_tool.osatreesitter.symbol_index import SymbolIndex
 from osa_tool.utils import logger, osa_project_root
 
 dotenv.load_dotenv()
@@ -45,12 +52,6 @@ class DocGen(object):
         extract_pure_docstring(gpt_response)
             Extracts only the docstring from the GPT-4 response while keeping triple quotes.
 
-        insert_docstring_in_code(source_code, method_details, generated_docstring)
-            Inserts a generated docstring into the specified location in the source code.
-
-        insert_cls_docstring_in_code(source_code, class_details, generated_docstring)
-            Inserts a generated class docstring into the class definition and returns the updated source code.
-
         process_python_file(parsed_structure, file_path)
             Processes a Python file by generating and inserting missing docstrings and updates the source file
             with the new docstrings.
@@ -171,7 +172,7 @@ class DocGen(object):
             for method in class_details[2:]:
                 prompt += f"- {method['method_name']}: {method['docstring']}\n"
 
-        return self.model_handler.send_request(prompt)
+        return self._request_docstring(prompt)
 
     def generate_method_documentation(self, method_details: dict, context_code: str = None) -> str:
         """
@@ -194,6 +195,17 @@ class DocGen(object):
         {"- Imported methods source code:" if context_code else ""}
         {context_code if context_code else ""}
         """
+        return self._request_docstring(prompt)
+
+    def _request_docstring(self, prompt: str) -> str:
+        """
+        Sends a docstring prompt to the model.
+
+        If streaming is enabled, the response is read only until the docstring's closing triple quotes arrive,
+        and the rest of the generation is cancelled.
+        """
+        if self.config.llm.stream is True:
+            return collect_stream(self.model_handler.send_request_stream(prompt), is_docstring_complete)
         return self.model_handler.send_request(prompt)
 
     def extract_pure_docstring(self, gpt_response: str) -> str:
@@ -231,82 +243,13 @@ class DocGen(object):
 
         return '"""No valid docstring found."""'  # Return a placeholder if no docstring was found
 
-    def insert_docstring_in_code(self, source_code: str, method_details: dict, generated_docstring: str) -> str:
-        """
-        This method inserts a generated docstring into the specified location in the source code.
-
-        Args:
-            source_code: The source code where the docstring should be inserted.
-            method_details: A dictionary containing details about the method.
-                It should have a key 'method_name' with the name of the method where the docstring should be inserted.
-            generated_docstring: The docstring that should be inserted into the source code.
-
-        Returns:
-            None
-        """
-        # Matches a method definition with the given name,
-        # including an optional return type. Ensures no docstring follows.
-        method_pattern = rf"((?:@\w+(?:\([^)]*\))?\s*\n)*\s*(?:async\s+)?def\s+{method_details['method_name']}\s*\((?:[^)(]|\((?:[^)(]*|\([^)(]*\))*\))*\)\s*(->\s*[a-zA-Z0-9_\[\],. |]+)?\s*:\n)(\s*)(?!\s*\"\"\")"
-        """
-        (
-            (?:@\w+(?:\([^)]*\))?\s*\n)*                # Optional decorators: e.g. @decorator or @decorator(args), each followed by newline
-            \s*                                         # Optional whitespace before function definition
-            (?:async\s+)?                               # Optional 'async' keyword followed by whitespace
-            def\s+{method_details['method_name']}\s*    # 'def' keyword followed by the specific method name and optional spaces
-            \(                                          # Opening parenthesis for the parameter list
-                (?:                                     # Non-capturing group to match parameters inside parentheses
-                    [^)(]                               # Match any character except parentheses (simple parameter)
-                    |                                   # OR
-                    \(                                  # Opening a nested parenthesis
-                        (?:[^)(]*|\([^)(]*\))*          # Recursively match nested parentheses content
-                    \)                                  # Closing the nested parenthesis
-                )*                                      # Repeat zero or more times (all parameters)
-            \)                                          # Closing parenthesis of the parameter list
-            \s*                                         # Optional whitespace after parameters
-            (->\s*[a-zA-Z0-9_\[\],. |]+)?               # Optional return type annotation (e.g. -> int, -> dict[str, Any])
-            \s*:\n                                      # Colon ending the function header followed by newline
-        )
-        (\s*)                                          # Capture indentation (spaces/tabs) of the next line (function body)
-        (?!\s*\"\"\")                                  # Negative lookahead: ensure the next non-space characters are NOT triple quotes (no docstring yet)
-        """
-
-        docstring_with_format = self.extract_pure_docstring(generated_docstring)
-        updated_code = re.sub(method_pattern, rf"\1\3{docstring_with_format}\n\3", source_code, count=1)
-
-        return updated_code
-
-    def insert_cls_docstring_in_code(self, source_code: str, class_name: str, generated_docstring: str) -> str:
+    def context_extractor(self, method_details: dict, symbol_index: SymbolIndex) -> str:
         """
-        Inserts a generated class docstring into the class definition.
-
-        Args:
-
-            source_code: The source code where the docstring should be inserted.
-            class_name: Class name.
-            generated_docstring: The docstring that should be inserted.
-
-        Returns:
-            The updated source code with the class docstring inserted.
-        """
-
-        # Matches a class definition with the given name,
-        # including optional parentheses. Ensures no docstring follows.
-        class_pattern = rf"(class\s+{class_name}\s*(\([^)]*\))?\s*:\n)(\s*)(?!\s*\"\"\")"
-
-        # Ensure we keep only the extracted docstring
-        docstring_with_format = self.extract_pure_docstring(generated_docstring)
-
-        updated_code = re.sub(class_pattern, rf"\1\3{docstring_with_format}\n\3", source_code, count=1)
-
-        return updated_code
-
-    def context_extractor(self, method_details: dict, structure: dict) -> str:
-        """
-            Extracts the context of method calls and functions from given method_details and code structure.
+            Extracts the context of method calls and functions from given method_details and the codebase's symbol index.
 
             Parameters:
             - method_details: A dictionary containing details about the method calls.
-            - structure: A dictionary representing the code structure.
+            - symbol_index: The index of the classes, methods and functions of the codebase.
 
             Returns:
             A string containing the context of the method calls and functions in the format:
@@ -314,45 +257,25 @@ class DocGen(object):
               "# Method {method_name} in class {class_name}
         {source_code}"
             - If a function call is found:
-              "# Function {class_name}
+              "# Function {function_name}
         {source_code}"
 
             Note:
-            - This method iterates over the method calls in method_details and searches for the corresponding methods and functions
-              in the code structure. It constructs the context of the found methods and functions by appending their source code
-              along with indicator comments.
-            - The returned string contains the structured context of all the detected methods and functions.
+            - Each method call in method_details is resolved with a single lookup in the symbol index, which follows
+              packages, relative imports and re-exports to the module that defines the called symbol. A call of
+              a class resolves to its constructor. Calls of symbols defined outside the codebase are skipped.
         """
-
-        def is_target_class(item, call):
-            return item["type"] == "class" and item["name"] == call["class"]
-
-        def is_target_method(method, call):
-            return method["method_name"] == call["function"]
-
-        def is_constructor(method, call):
-            return method["method_name"] == "__init__" and call["function"] is None
-
-        def is_target_function(item, call):
-            return item["type"] == "function" and item["details"]["method_name"] == call["class"]
-
         context = []
 
         for call in method_details.get("method_calls", []):
-            file_data = structure.get(call["path"], {})
-            if not file_data:
+            symbol = symbol_index.resolve_call(call)
+            if symbol is None:
                 continue
-
-            for item in file_data.get("structure", []):
-                if is_target_class(item, call):
-                    for method in item.get("methods", []):
-                        if is_target_method(method, call) or is_constructor(method, call):
-                            method_name = call["function"] if call["function"] else "__init__"
-                            context.append(
-                                f"# Method {method_name} in class {call['class']}\n" + method.get("source_code", "")
-                            )
-                elif is_target_function(item, call):
-                    context.append(f"# Function {call['class']}\n" + item["details"].get("source_code", ""))
+            if symbol.kind == "method":
+                class_name = symbol.qualified_name.rsplit(".", 2)[-2]
+                context.append(f"# Method {symbol.name} in class {class_name}\n" + symbol.source_code)
+            else:
+                context.append(f"# Function {symbol.name}\n" + symbol.source_code)
 
         return "\n".join(context)
 
@@ -375,7 +298,7 @@ class DocGen(object):
             write_back=black.WriteBack.YES,
         )
 
-    def process_python_file(self, parsed_structure: dict) -> None:
+    def process_python_file(self, parsed_structure: dict | StructureStream) -> None:
         """
         Processes a Python file by generating and inserting missing docstrings.
 
@@ -383,57 +306,222 @@ class DocGen(object):
         docstrings, and generates and inserts them if missing. The method updates the source file with the new docstrings
         and logs the path of the updated file.
 
+        Method and function docstring requests of all files are sent concurrently, bounded by the configured number of
+        workers and by the process-wide LLM rate limits. Insertions are still applied file by file in the order of the parsed structure,
+        and the class docstring of each class is requested only after all of its method docstrings are generated.
+
+        Given a stream of structures, requests for a file are sent as soon as it is parsed, while the later files are
+        still being parsed. The symbol index is filled as files arrive, and context extraction of a request waits for
+        the files its calls refer to.
+
+        Generation is incremental: files left untouched since the previous run are skipped without formatting, and
+        functions whose body has not changed reuse the docstring recorded in the manifest.
+
         Args:
             parsed_structure: A dictionary representing the parsed structure of the Python codebase.
                 The dictionary keys are filenames and the values are lists of dictionaries representing
-                classes and their methods.
+                classes and their methods. A stream returned by `OSA_TreeSitter.iter_structures` is accepted as well.
 
         Returns:
             None
         """
-        for filename, structure in parsed_structure.items():
-            self.format_with_black(filename)
-            with open(filename, "r", encoding="utf-8") as f:
-                source_code = f.read()
-            for item in structure["structure"]:
-                if item["type"] == "class":
-                    for method in item["methods"]:
-                        if method["docstring"] == None:  # If docstring is missing
+        settings = self.config.docstrings
+        manifest = DocstringManifest(settings.manifest)
+        if isinstance(parsed_structure, StructureStream):
+            symbol_index = SymbolIndex(root=parsed_structure.root, expected_files=parsed_structure.files)
+            structures = parsed_structure
+        else:
+            symbol_index = SymbolIndex(expected_files=parsed_structure)
+            structures = parsed_structure.items()
+
+        executor = ThreadPoolExecutor(max_workers=settings.max_workers)
+        changed_files = {}
+        pending = {}
+        try:
+            try:
+                for filename, structure in structures:
+                    symbol_index.add_file(filename, structure)
+                    if manifest.is_unchanged(filename):
+                        logger.info(f"Skipping unchanged file: {filename}")
+                        continue
+                    # The file is rewritten below, while requests of later files may still read its source as context
+                    preload_source(structure)
+                    changed_files[filename] = structure
+                    pending[filename] = self._submit_method_docstrings(
+                        executor, manifest, filename, structure, symbol_index
+                    )
+            finally:
+                symbol_index.finish()
+
+            for filename, structure in changed_files.items():
+                self._update_file_docstrings(executor, manifest, filename, structure, pending.pop(filename))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit_method_docstrings(
+        self,
+        executor: ThreadPoolExecutor,
+        manifest: DocstringManifest,
+        filename: str,
+        structure: dict,
+        symbol_index: SymbolIndex,
+    ) -> list[tuple[dict, dict, Future]]:
+        """
+        Schedules docstring generation for every method and function of a file that lacks one.
+
+        Functions whose docstring is found in the manifest get an already completed future instead of a request.
+
+        Args:
+            executor: The pool running the requests.
+            manifest: The manifest of docstrings generated by previous runs.
+            filename: The path of the processed file.
+            structure: The parsed structure of the file.
+            symbol_index: The symbol index of the whole codebase, used to extract method context.
+
+        Returns:
+            A list of (item, method details, future) tuples in the order of the file's structure.
+        """
+        pending = []
+        for item in structure["structure"]:
+            if item["type"] == "class":
+                for method in item["methods"]:
+                    if method["docstring"] == None:  # If docstring is missing
+                        cached = manifest.get_docstring(
+                            filename, self._qualified_name(item, method), method["source_code"]
+                        )
+                        if cached is not None:
+                            future = self._completed_future(cached)
+                        else:
                             logger.info(
                                 f"Generating docstring for method: {method['method_name']} in class {item['name']} at {filename}"
                             )
-                            method_context = self.context_extractor(method, parsed_structure)
-                            generated_docstring = self.generate_method_documentation(method, method_context)
-                            if item["docstring"] == None:
-                                method["docstring"] = self.extract_pure_docstring(generated_docstring)
-                            source_code = self.insert_docstring_in_code(source_code, method, generated_docstring)
-                if item["type"] == "function":
-                    func_details = item["details"]
-                    if func_details["docstring"] == None:
+                            future = executor.submit(self._document_function, method, symbol_index)
+                        pending.append((item, method, future))
+            if item["type"] == "function":
+                func_details = item["details"]
+                if func_details["docstring"] == None:
+                    cached = manifest.get_docstring(
+                        filename, self._qualified_name(item, func_details), func_details["source_code"]
+                    )
+                    if cached is not None:
+                        future = self._completed_future(cached)
+                    else:
                         logger.info(f"Generating docstring for a function: {func_details['method_name']} at {filename}")
-                        generated_docstring = self.generate_method_documentation(func_details)
-                        source_code = self.insert_docstring_in_code(source_code, func_details, generated_docstring)
-
-            for item in structure["structure"]:
-                if item["type"] == "class" and item["docstring"] == None:
-                    class_name = item["name"]
-                    cls_structure = []
-                    cls_structure.append(class_name)
-                    cls_structure.append(item["attributes"])
-                    for method in item["methods"]:
-                        cls_structure.append(
-                            {
-                                "method_name": method["method_name"],
-                                "docstring": method["docstring"],
-                            }
-                        )
-                    logger.info(f"Generating docstring for class: {item['name']} in class at {filename}")
-                    generated_cls_docstring = self.generate_class_documentation(cls_structure)
-                    source_code = self.insert_cls_docstring_in_code(source_code, class_name, generated_cls_docstring)
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(source_code)
-            self.format_with_black(filename)
-            logger.info(f"Updated file: {filename}")
+                        future = executor.submit(self._document_function, func_details, symbol_index)
+                    pending.append((item, func_details, future))
+        return pending
+
+    def _document_function(self, method_details: dict, symbol_index: SymbolIndex) -> str:
+        """
+        Extracts the context of a method or function and generates its docstring.
+
+        Runs in the request pool, since extracting the context may wait for files that are still being parsed.
+        """
+        return self.generate_method_documentation(method_details, self.context_extractor(method_details, symbol_index))
+
+    @staticmethod
+    def _qualified_name(item: dict, method_details: dict) -> str:
+        """Returns the name a function or method is recorded under in the docstring manifest."""
+        if item["type"] == "class":
+            return f"{item['name']}.{method_details['method_name']}"
+        return method_details["method_name"]
+
+    @staticmethod
+    def _occurrence(items: list[dict], target: dict, name_of) -> int:
+        """Counts the definitions named like the target that precede it, telling redefinitions of a name apart."""
+        name = name_of(target)
+        for index, item in enumerate(items):
+            if item is target:
+                return sum(1 for previous in items[:index] if name_of(previous) == name)
+        return 0
+
+    @staticmethod
+    def _completed_future(result: str) -> Future:
+        """Wraps an already known docstring into a completed future."""
+        future = Future()
+        future.set_result(result)
+        return future
+
+    def _update_file_docstrings(
+        self,
+        executor: ThreadPoolExecutor,
+        manifest: DocstringManifest,
+        filename: str,
+        structure: dict,
+        pending: list[tuple[dict, dict, Future]],
+    ) -> None:
+        """
+        Inserts generated method and class docstrings into a file, rewrites it and records it in the manifest.
+
+        Args:
+            executor: The pool running the requests.
+            manifest: The manifest of docstrings generated by previous runs.
+            filename: The path of the processed file.
+            structure: The parsed structure of the file.
+            pending: Scheduled method docstring requests of the file, as returned by _submit_method_docstrings.
+
+        Returns:
+            None
+        """
+        self.format_with_black(filename)
+        with open(filename, "r", encoding="utf-8") as f:
+            inserter = DocstringInserter(f.read())
+
+        classes = [item for item in structure["structure"] if item["type"] == "class"]
+        functions = [item for item in structure["structure"] if item["type"] == "function"]
+        for item, method_details, future in pending:
+            generated_docstring = future.result()
+            manifest.record_function(
+                filename, self._qualified_name(item, method_details), method_details["source_code"], generated_docstring
+            )
+            docstring_with_format = self.extract_pure_docstring(generated_docstring)
+            if item["type"] == "class":
+                if item["docstring"] == None:
+                    method_details["docstring"] = docstring_with_format
+                inserter.add_function_docstring(
+                    docstring_with_format,
+                    method_details["method_name"],
+                    self._occurrence(item["methods"], method_details, lambda method: method["method_name"]),
+                    item["name"],
+                    self._occurrence(classes, item, lambda cls: cls["name"]),
+                )
+            else:
+                inserter.add_function_docstring(
+                    docstring_with_format,
+                    method_details["method_name"],
+                    self._occurrence(functions, item, lambda function: function["details"]["method_name"]),
+                )
+
+        class_pending = []
+        for item in structure["structure"]:
+            if item["type"] == "class" and item["docstring"] == None:
+                class_name = item["name"]
+                cls_structure = []
+                cls_structure.append(class_name)
+                cls_structure.append(item["attributes"])
+                for method in item["methods"]:
+                    cls_structure.append(
+                        {
+                            "method_name": method["method_name"],
+                            "docstring": method["docstring"],
+                        }
+                    )
+                logger.info(f"Generating docstring for class: {item['name']} in class at {filename}")
+                future = executor.submit(self.generate_class_documentation, cls_structure)
+                class_pending.append((item, future))
+
+        for item, future in class_pending:
+            inserter.add_class_docstring(
+                self.extract_pure_docstring(future.result()),
+                item["name"],
+                self._occurrence(classes, item, lambda cls: cls["name"]),
+            )
+
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(inserter.apply())
+        self.format_with_black(filename)
+        manifest.record_file(filename)
+        logger.info(f"Updated file: {filename}")
 
     def generate_documentation_mkdocs(self, path: str) -> None:
         """
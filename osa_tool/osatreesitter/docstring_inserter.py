@@ -0,0 +1,139 @@
+from collections import defaultdict
+
+import tree_sitter
+
+from osa_tool.osatreesitter.osa_treesitter import get_parser
+
+
+class DocstringInserter:
+    """
+    Inserts docstrings into Python source code at the positions of definitions in its syntax tree.
+
+    Definitions are addressed by name and occurrence index, and methods also by their class, so same-named
+    methods of different classes and redefinitions of a name are told apart. Insertions are collected
+    first and applied in a single pass over the source, so that offsets of the parsed tree stay valid.
+
+    Attributes:
+        source: The source code as UTF-8 bytes, which tree-sitter offsets refer to.
+    """
+
+    def __init__(self, source_code: str):
+        """
+        Parses the source code and indexes the bodies of its classes, methods and functions.
+
+        Args:
+            source_code: The source code to insert docstrings into.
+        """
+        self.source = source_code.encode("utf-8")
+        self._bodies: dict[tuple, tree_sitter.Node] = {}
+        self._insertions: dict[int, bytes] = {}
+        self._index(get_parser(".py").parse(self.source).root_node)
+
+    def add_function_docstring(
+        self,
+        docstring: str,
+        function_name: str,
+        occurrence: int = 0,
+        class_name: str | None = None,
+        class_occurrence: int = 0,
+    ) -> bool:
+        """
+        Schedules insertion of a function or method docstring.
+
+        Args:
+            docstring: The docstring including triple quotes.
+            function_name: The name of the function or method.
+            occurrence: The index of the definition among same-named functions of the module or the class.
+            class_name: The name of the class the method belongs to, or None for a module-level function.
+            class_occurrence: The index of the class among same-named classes of the module.
+
+        Returns:
+            bool: False if the definition was not found, already has a docstring or has its body on the same line.
+        """
+        return self._add((class_name, class_occurrence, function_name, occurrence), docstring)
+
+    def add_class_docstring(self, docstring: str, class_name: str, occurrence: int = 0) -> bool:
+        """
+        Schedules insertion of a class docstring.
+
+        Args:
+            docstring: The docstring including triple quotes.
+            class_name: The name of the class.
+            occurrence: The index of the class among same-named classes of the module.
+
+        Returns:
+            bool: False if the class was not found, already has a docstring or has its body on the same line.
+        """
+        return self._add((class_name, occurrence, None, 0), docstring)
+
+    def apply(self) -> str:
+        """
+        Applies all scheduled insertions.
+
+        Returns:
+            str: The source code with the docstrings inserted.
+        """
+        parts = []
+        previous = 0
+        for offset in sorted(self._insertions):
+            parts.append(self.source[previous:offset])
+            parts.append(self._insertions[offset])
+            previous = offset
+        parts.append(self.source[previous:])
+        return b"".join(parts).decode("utf-8")
+
+    def _add(self, key: tuple, docstring: str) -> bool:
+        body = self._bodies.get(key)
+        if body is None or self._has_docstring(body):
+            return False
+
+        line_start = self.source.rfind(b"\n", 0, body.start_byte) + 1
+        indent = self.source[line_start : body.start_byte]
+        if indent.strip():
+            return False
+
+        self._insertions[body.start_byte] = docstring.encode("utf-8") + b"\n" + indent
+        return True
+
+    def _index(self, root_node: tree_sitter.Node) -> None:
+        counts = defaultdict(int)
+
+        def register(key: tuple, body: tree_sitter.Node) -> None:
+            self._bodies[key + (counts[key],)] = body
+            counts[key] += 1
+
+        for node in root_node.children:
+            definition = self._definition(node)
+            if definition is None:
+                continue
+            name = definition.child_by_field_name("name").text.decode("utf-8")
+            body = definition.child_by_field_name("body")
+            if definition.type == "function_definition":
+                register((None, 0, name), body)
+                continue
+
+            class_occurrence = counts[(name,)]
+            counts[(name,)] += 1
+            self._bodies[(name, class_occurrence, None, 0)] = body
+            for child in body.children:
+                method = self._definition(child)
+                if method is not None and method.type == "function_definition":
+                    method_name = method.child_by_field_name("name").text.decode("utf-8")
+                    register((name, class_occurrence, method_name), method.child_by_field_name("body"))
+
+    @staticmethod
+    def _definition(node: tree_sitter.Node) -> tree_sitter.Node | None:
+        """Returns the class or function definition of a node, unwrapping decorators."""
+        if node.type == "decorated_definition":
+            node = node.child_by_field_name("definition")
+        if node is not None and node.type in ("function_definition", "class_definition"):
+            return node
+        return None
+
+    @staticmethod
+    def _has_docstring(body: tree_sitter.Node) -> bool:
+        for child in body.named_children:
+            if child.type == "comment":
+                continue
+            return child.type == "expression_statement" and child.named_children[0].type == "string"
+        return False
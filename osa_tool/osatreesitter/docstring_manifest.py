@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import re
+
+from osa_tool.utils import logger
+
+
+class DocstringManifest:
+    """
+    Record of docstrings generated by previous runs, used to process only what has changed since then.
+
+    For every processed file the manifest keeps the hash of its content as it was written, and for every
+    function or method sent to the model the hash of its body together with the generated docstring.
+    Files whose content still matches the recorded hash are skipped entirely, and functions whose body
+    is unchanged reuse the recorded docstring instead of a new request.
+
+    Attributes:
+        path: Path to the JSON manifest file. An empty path disables the manifest.
+        files: Mapping of absolute file paths to their content hash and function records.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        """
+        Loads the manifest from disk if it exists.
+
+        Args:
+            path: Path to the JSON manifest file. An empty path disables the manifest.
+        """
+        self.path = path
+        self.files: dict[str, dict] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == self.VERSION:
+                    self.files = data.get("files", {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable docstring manifest {path}: {e}")
+
+    @staticmethod
+    def file_hash(filename: str) -> str:
+        """
+        Computes the hash of a file's content.
+
+        Args:
+            filename: Path to the file.
+
+        Returns:
+            str: SHA-256 hex digest of the file's bytes.
+        """
+        with open(filename, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    @staticmethod
+    def body_hash(source_code: str) -> str:
+        """
+        Computes the hash of a function's source, ignoring whitespace so that reformatting keeps it stable.
+
+        Args:
+            source_code: Source code of the function.
+
+        Returns:
+            str: SHA-256 hex digest of the normalized source.
+        """
+        normalized = re.sub(r"\s+", "", source_code or "")
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def is_unchanged(self, filename: str) -> bool:
+        """
+        Checks whether a file is exactly as it was written by the previous run.
+
+        Args:
+            filename: Path to the file.
+
+        Returns:
+            bool: True if the recorded content hash matches the file.
+        """
+        record = self.files.get(os.path.abspath(filename))
+        return bool(self.path and record and record.get("hash") == self.file_hash(filename))
+
+    def get_docstring(self, filename: str, name: str, source_code: str) -> str | None:
+        """
+        Returns the docstring generated earlier for a function whose body has not changed.
+
+        Args:
+            filename: Path to the file containing the function.
+            name: Qualified name of the function, e.g. "Class.method".
+            source_code: Current source code of the function.
+
+        Returns:
+            str | None: The recorded docstring, or None if the function is new or was changed.
+        """
+        record = self.files.get(os.path.abspath(filename), {}).get("functions", {}).get(name)
+        if record and record["body_hash"] == self.body_hash(source_code):
+            return record["docstring"]
+        return None
+
+    def record_function(self, filename: str, name: str, source_code: str, docstring: str) -> None:
+        """
+        Remembers the docstring generated for a function.
+
+        Args:
+            filename: Path to the file containing the function.
+            name: Qualified name of the function, e.g. "Class.method".
+            source_code: Source code of the function the docstring was generated for.
+            docstring: The generated docstring.
+        """
+        record = self.files.setdefault(os.path.abspath(filename), {"hash": None, "functions": {}})
+        record["functions"][name] = {"body_hash": self.body_hash(source_code), "docstring": docstring}
+
+    def record_file(self, filename: str) -> None:
+        """
+        Remembers the content of a file written by the current run and saves the manifest.
+
+        Args:
+            filename: Path to the file.
+        """
+        if not self.path:
+            return
+        record = self.files.setdefault(os.path.abspath(filename), {"hash": None, "functions": {}})
+        record["hash"] = self.file_hash(filename)
+        self.save()
+
+    def save(self) -> None:
+        """Writes the manifest to disk atomically."""
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "files": self.files}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
@@ -1,9 +1,34 @@
 import os
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import Iterator
+
 import tree_sitter
 from tree_sitter import Parser, Language
 import tree_sitter_python as tspython
 
+from osa_tool.osatreesitter.parse_cache import ParseCache
+from osa_tool.osatreesitter.structures import (
+    ClassStructure,
+    FunctionItem,
+    FunctionStructure,
+    SourceBuffer,
+    dump_structure,
+    load_structure,
+)
+
+# Version of the extracted structure, bump it whenever the extraction changes to invalidate parse caches
+STRUCTURE_VERSION = "3"
+
+# Parsers are reused for all files of the same language within a process
+_PARSERS: dict[str, Parser] = {}
+
+# Analyzer instance of a pool worker process, created once by the pool initializer
+_worker_analyzer: "OSA_TreeSitter | None" = None
+
 
 class OSA_TreeSitter(object):
     """Class for the extraction of the source code's structure to be processed later by LLM.
@@ -12,14 +37,33 @@ class OSA_TreeSitter(object):
         cwd: A current working directory with source code files.
     """
 
-    def __init__(self, scripts_path: str):
+    def __init__(
+        self,
+        scripts_path: str,
+        workers: int = 0,
+        parallel_threshold: int = 32,
+        cache_path: str | None = None,
+        file_index: set[str] | None = None,
+    ):
         """Initialization of the instance based on the provided path to the scripts.
 
         Args:
             scripts_path: provided by user path to the scripts.
+            workers: number of processes used to parse files, 0 to use all CPU cores.
+            parallel_threshold: minimum number of files to parse them in a process pool,
+                smaller trees are parsed serially.
+            cache_path: path to the SQLite database of extracted structures reused across runs,
+                None to parse every file on every run.
+            file_index: absolute paths of the files imports are resolved to. Filled by "analyze_directory",
+                the file system is probed while it is None.
         """
         self.cwd = scripts_path
         self.import_map = {}
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self.parse_cache = ParseCache(cache_path) if cache_path else None
+        self.file_index = file_index
+        self._probes: dict[str, bool] | None = None
 
     @staticmethod
     def files_list(path: str) -> tuple[list, 0] | tuple[list[str], 1]:
@@ -88,9 +132,7 @@ class OSA_TreeSitter(object):
         Returns:
             Compiled parser.
         """
-        if filename.endswith(".py"):
-            PY_LANGUAGE = Language(tspython.language())
-            return Parser(PY_LANGUAGE)
+        return get_parser(filename)
 
     def _parse_source_code(self, filename: str) -> tuple[tree_sitter.Tree, str]:
         """Inner method parses the provided file with the source code.
@@ -147,7 +189,7 @@ class OSA_TreeSitter(object):
     def _class_parser(
         self,
         structure: dict[dict, list],
-        source_code: str,
+        source_code: SourceBuffer,
         node: tree_sitter.Node,
         dec_list: list = [],
     ) -> list:
@@ -156,7 +198,7 @@ class OSA_TreeSitter(object):
 
         Args:
             structure: A list where the parsed class details will be appended.
-            source_code: A string of the source code that contains the class to be parsed.
+            source_code: The buffer of the source code that contains the class to be parsed.
             node: A tree_sitter.Node object that represents the class in the source code.
             dec_list: A list of decorators for the class. Defaults to an empty list.
 
@@ -181,21 +223,22 @@ class OSA_TreeSitter(object):
                 class_methods.append(method_details)
 
         structure["structure"].append(
-            {
-                "type": "class",
-                "name": class_name,
-                "decorators": dec_list,
-                "start_line": start_line,
-                "docstring": docstring,
-                "attributes": class_attributes,
-                "methods": class_methods,
-            }
+            ClassStructure(
+                name=class_name,
+                decorators=dec_list,
+                start_line=start_line,
+                start_byte=node.start_byte,
+                end_byte=node.end_byte,
+                docstring=docstring,
+                attributes=class_attributes,
+                methods=class_methods,
+            )
         )
 
     def _function_parser(
         self,
         structure: dict[dict, list],
-        source_code: str,
+        source_code: SourceBuffer,
         node: tree_sitter.Node,
         dec_list: list = [],
     ) -> list:
@@ -205,7 +248,7 @@ class OSA_TreeSitter(object):
         Parameters:
             - self: The instance of the class.
             - structure: A list containing the structure details of the code.
-            - source_code: The source code of the function.
+            - source_code: The buffer of the source code containing the function.
             - node: The tree-sitter Node representing the function.
             - dec_list: A list of decorators for the function (default=[]).
 
@@ -214,13 +257,7 @@ class OSA_TreeSitter(object):
         """
         method_details = self._extract_function_details(node, source_code, structure["imports"], dec_list)
         start_line = node.start_point[0] + 1  # convert 0-based to 1-based indexing
-        structure["structure"].append(
-            {
-                "type": "function",
-                "start_line": start_line,
-                "details": method_details,
-            }
-        )
+        structure["structure"].append(FunctionItem(start_line=start_line, details=method_details))
 
     def _get_decorators(self, dec_list: list, dec_node: tree_sitter.Node) -> list:
         """
@@ -239,15 +276,18 @@ class OSA_TreeSitter(object):
 
         return dec_list
 
-    def _resolve_import_path(self, import_text: str):
+    def _resolve_import_path(self, import_text: str, filename: str | None = None):
         """
         Resolve import path from given import text.
 
         This method resolves the import path of entities specified in the import_text. It extracts the module name,
         entity names, and their corresponding paths in case they are found in the current working directory.
+        Modules may be plain files or packages with an `__init__.py`, relative imports are resolved against
+        the importing file, and names imported from a package that are its submodules are mapped to the submodules.
 
         Parameters:
             - import_text: The import text containing import statements to be resolved.
+            - filename: The path of the file containing the import, required to resolve relative imports.
 
         Returns:
             dict: A dictionary containing the import mappings where keys are alias names and values are dictionaries
@@ -264,21 +304,30 @@ class OSA_TreeSitter(object):
                 except ValueError:
                     return import_mapping
 
-                module_name = from_part.replace("from", "").strip()
-                imported_entities = [entity.strip() for entity in import_part.split(",")]
-
-                module_path = None
-                possible_path = os.path.join(self.cwd, *module_name.split(".")) + ".py"
-                if os.path.exists(possible_path):
-                    module_path = possible_path
+                module_name = from_part.replace("from", "", 1).strip()
+                imported_entities = [entity.strip() for entity in import_part.strip().strip("()").split(",")]
+                module_path = self._find_module_path(module_name, filename)
+                is_package = module_path is not None and os.path.basename(module_path) == "__init__.py"
 
                 for entity in imported_entities:
+                    if not entity:
+                        continue
                     if " as " in entity:
                         imported_name, alias_name = [e.strip() for e in entity.split(" as ", 1)]
                     else:
                         imported_name = entity
                         alias_name = imported_name
-                    if module_path:
+
+                    submodule_path = None
+                    if is_package:
+                        submodule_path = self._find_module_path(f".{imported_name}", module_path)
+                    if submodule_path:
+                        separator = "" if module_name.endswith(".") else "."
+                        import_mapping[alias_name] = {
+                            "module": f"{module_name}{separator}{imported_name}",
+                            "path": submodule_path,
+                        }
+                    elif module_path:
                         import_mapping[alias_name] = {
                             "module": module_name,
                             "class": imported_name,
@@ -286,7 +335,7 @@ class OSA_TreeSitter(object):
                         }
 
             elif import_text.startswith("import"):
-                parts = import_text.replace("import", "").strip().split()
+                parts = import_text.replace("import", "", 1).strip().split()
                 if "as" in parts:
                     idx = parts.index("as")
                     module_name = parts[0]
@@ -295,10 +344,7 @@ class OSA_TreeSitter(object):
                     module_name = parts[0]
                     alias_name = module_name
 
-                module_path = None
-                possible_path = os.path.join(self.cwd, *module_name.split(".")) + ".py"
-                if os.path.exists(possible_path):
-                    module_path = possible_path
+                module_path = self._find_module_path(module_name, filename)
 
                 if module_path:
                     import_mapping[alias_name] = {
@@ -308,13 +354,64 @@ class OSA_TreeSitter(object):
 
         return import_mapping
 
-    def _extract_imports(self, root_node: tree_sitter.Node):
+    def _find_module_path(self, module_name: str, filename: str | None = None) -> str | None:
+        """
+        Finds the file of a module within the analyzed directory.
+
+        Parameters:
+            - module_name: The dotted module name, possibly relative, i.e. starting with dots.
+            - filename: The path of the importing file, required to resolve relative module names.
+
+        Returns:
+            str | None: The path of the module file or of the package's `__init__.py`, or None if not found.
+        """
+        relative_name = module_name.lstrip(".")
+        level = len(module_name) - len(relative_name)
+        if level:
+            if filename is None:
+                return None
+            base = os.path.dirname(filename)
+            for _ in range(level - 1):
+                base = os.path.dirname(base)
+        else:
+            base = self.cwd
+
+        parts = [part for part in relative_name.split(".") if part]
+        candidates = [os.path.join(base, *parts, "__init__.py")]
+        if parts:
+            candidates.insert(0, os.path.join(base, *parts) + ".py")
+        for candidate in candidates:
+            if self._module_exists(candidate):
+                return candidate
+        return None
+
+    def _module_exists(self, path: str) -> bool:
+        """
+        Checks whether a module file exists, looking it up in the file index if it is built.
+
+        Parameters:
+            - path: The path of the module file.
+
+        Returns:
+            bool: True if the file exists.
+        """
+        if self.file_index is None:
+            return os.path.exists(path)
+
+        absolute_path = os.path.abspath(path)
+        exists = absolute_path in self.file_index
+        if self._probes is not None:
+            self._probes[absolute_path] = exists
+        return exists
+
+    def _extract_imports(self, root_node: tree_sitter.Node, filename: str | None = None):
         """
         Extracts import statements from the given root node and returns a dictionary mapping imported
         module names to their resolved paths.
 
         Parameters:
             root_node: The root node from which to extract import statements.
+            filename: The path of the parsed file, used to resolve relative imports.
 
         Returns:
             dict: A dictionary mapping imported module names to their resolved paths.
@@ -323,7 +420,7 @@ class OSA_TreeSitter(object):
         for node in root_node.children:
             if node.type in ("import_statement", "import_from_statement"):
                 import_text = node.text.decode("utf-8")
-                resolved_imports = self._resolve_import_path(import_text)
+                resolved_imports = self._resolve_import_path(import_text, filename)
                 import_map.update(resolved_imports)
         return import_map
 
@@ -389,13 +486,13 @@ class OSA_TreeSitter(object):
 
         return resolved_import
 
-    def _resolve_method_calls(self, function_node: tree_sitter.Node, source_code: str, imports: dict) -> list:
+    def _resolve_method_calls(self, function_node: tree_sitter.Node, source_code: SourceBuffer, imports: dict) -> list:
         """
         Resolve method calls in the given function node and return a list of resolved method calls.
 
         Parameters:
             - function_node: The tree_sitter.Node representing the function node to analyze.
-            - source_code: The source code of the function as a string.
+            - source_code: The buffer of the source code containing the function.
             - imports: A dictionary containing information about imports.
 
         Returns:
@@ -409,7 +506,7 @@ class OSA_TreeSitter(object):
             if not call_target:
                 return
 
-            call_text = source_code[call_target.start_byte : call_target.end_byte]
+            call_text = source_code.text(call_target.start_byte, call_target.end_byte)
             resolved_call = self._resolve_import(call_text, alias, imports, alias_map)
             if resolved_call:
                 method_calls.append(resolved_call)
@@ -449,13 +546,15 @@ class OSA_TreeSitter(object):
             filename: name of the file occured in the provided directory.
 
         Returns:
-            List containing occuring in file functions, classes, their start lines and methods
+            List containing occuring in file functions, classes, their start lines and methods.
+            Classes and functions are compact records referring to a single buffer of the file's source code.
         """
         structure = {}
         structure["structure"] = []
-        tree, source_code = self._parse_source_code(filename)
+        tree, text = self._parse_source_code(filename)
+        source_code = SourceBuffer(filename, text.encode("utf-8"))
         root_node = tree.root_node
-        imports = self._extract_imports(root_node)
+        imports = self._extract_imports(root_node, filename)
         structure["imports"] = imports
         for node in root_node.children:
             if node.type == "decorated_definition":
@@ -495,12 +594,12 @@ class OSA_TreeSitter(object):
                         docstring = c_c.text.decode("utf-8")
         return docstring
 
-    def _traverse_block(self, block_node: tree_sitter.Node, source_code: bytes, imports: dict) -> list:
+    def _traverse_block(self, block_node: tree_sitter.Node, source_code: SourceBuffer, imports: dict) -> list:
         """Inner method traverses occuring in file's tree structure "block" node.
 
         Args:
             block_node: an occured block node, containing class's methods.
-            source_code: source code of the file in bytes.
+            source_code: buffer of the file's source code.
 
         Returns:
             List of function/method's details.
@@ -525,19 +624,19 @@ class OSA_TreeSitter(object):
     def _extract_function_details(
         self,
         function_node: tree_sitter.Node,
-        source_code: str,
+        source_code: SourceBuffer,
         imports: dict,
         dec_list: list = [],
-    ) -> dict:
+    ) -> FunctionStructure:
         """Inner method extracts the details of "function_definition" node in file's tree structure.
 
         Args:
             function_node: an occured block node, containing class's methods details.
-            source_code: source code of the file in bytes.
+            source_code: buffer of the file's source code.
 
         Returns:
-            Dictionary containing method's/function's name, args, return type, start line
-            and source code.
+            Record containing method's/function's name, args, return type, start line
+            and the byte range of its source code.
         """
         method_name = function_node.child_by_field_name("name").text.decode("utf-8")
         start_line = function_node.start_point[0] + 1
@@ -562,46 +661,178 @@ class OSA_TreeSitter(object):
                 if param_node.type == "identifier":
                     arguments.append(param_node.text.decode("utf-8"))
 
-        source_code_start = function_node.start_byte
-        source_code_end = function_node.end_byte
-        source = source_code[source_code_start:source_code_end]
-
         return_node = function_node.child_by_field_name("return_type")
         return_type = None
         if return_node:
-            return_type = source_code[return_node.start_byte : return_node.end_byte]
+            return_type = source_code.text(return_node.start_byte, return_node.end_byte)
 
         method_calls = self._resolve_method_calls(function_node, source_code, imports)
 
-        return {
-            "method_name": method_name,
-            "decorators": dec_list,
-            "docstring": docstring,
-            "arguments": arguments,
-            "return_type": return_type,
-            "start_line": start_line,
-            "source_code": source,
-            "method_calls": method_calls,
-        }
+        return FunctionStructure(
+            method_name=method_name,
+            decorators=dec_list,
+            docstring=docstring,
+            arguments=arguments,
+            return_type=return_type,
+            start_line=start_line,
+            start_byte=function_node.start_byte,
+            end_byte=function_node.end_byte,
+            method_calls=method_calls,
+            source=source_code,
+        )
 
     def analyze_directory(self, path: str) -> dict:
         """Method analyzes provided directory.
 
+        Structures of files left unchanged since the previous run are loaded from the parse cache, if configured,
+        and only the remaining files are parsed.
+
         Args:
             path: provided by user path to the scripts.
 
         Returns:
             Dictionary containing a filename and its source code's structure.
         """
-        results = {}
+        return dict(self.iter_structures(path))
+
+    def iter_structures(self, path: str) -> "StructureStream":
+        """Method analyzes provided directory, yielding the structure of every file as soon as it is parsed.
+
+        The files are listed immediately, and parsing advances only as the structures are consumed, so the caller
+        can process the first files while the later ones are still being parsed. Structures are yielded in the
+        order of the files list; in a process pool, later files are parsed ahead in the background.
+
+        Args:
+            path: provided by user path to the scripts.
+
+        Returns:
+            Iterable of tuples of a filename and its source code's structure, also exposing the list of files.
+        """
         files_list, status = self.files_list(path)
         if status:
             self.cwd = OSA_TreeSitter._if_file_handler(path)
+        files_list = [filename for filename in files_list if filename.endswith(".py")]
+        # A single file is analyzed without its directory, so imports are still resolved against the file system
+        self.file_index = None if status else {os.path.abspath(filename) for filename in files_list}
+        return StructureStream(files_list, self.cwd, self._generate_structures(files_list))
+
+    def _generate_structures(self, files_list: list[str]) -> Iterator[tuple[str, dict]]:
+        """Inner generator loads structures from the parse cache or parses the files, in the order of files_list.
+
+        Args:
+            files_list: paths to the files to be analyzed.
+
+        Yields:
+            Tuples of a filename and its source code's structure.
+        """
+        use_cache = self.parse_cache is not None and self.file_index is not None
+        cached = {}
+        digests = {}
+        if use_cache:
+            for filename in files_list:
+                digests[filename] = self._digest(filename)
+                structure = self.parse_cache.get(filename, digests[filename], self.file_index)
+                if structure is not None:
+                    cached[filename] = load_structure(structure, SourceBuffer(filename, size=os.path.getsize(filename)))
+
+        parsed = self._parse_files([filename for filename in files_list if filename not in cached])
+        entries = []
+        try:
+            for filename in files_list:
+                if filename in cached:
+                    yield filename, cached.pop(filename)
+                    continue
+                _, (structure, probes) = next(parsed)
+                if use_cache:
+                    entries.append((filename, digests[filename], probes, dump_structure(structure)))
+                yield filename, structure
+        finally:
+            parsed.close()
+            if use_cache:
+                self.parse_cache.put(entries)
+                logging.info(
+                    f"Parse cache: {self.parse_cache.hits} files loaded, {self.parse_cache.misses} files parsed "
+                    f"at {self.parse_cache.path}"
+                )
+
+    def _parse_files(self, files_list: list[str]) -> Iterator[tuple[str, tuple[dict, dict[str, bool]]]]:
+        """Inner generator parses files serially or, for large trees, in a pool of processes.
+
+        Args:
+            files_list: paths to the files to be parsed.
+
+        Yields:
+            Tuples of a filename and a tuple of its source code's structure and the module paths probed
+            while resolving its imports, in the order of files_list.
+        """
+        workers = min(self.workers, len(files_list))
+        if workers > 1 and len(files_list) >= self.parallel_threshold:
+            done = 0
+            try:
+                for result in self._analyze_files_parallel(files_list, workers):
+                    yield result
+                    done += 1
+                return
+            except (BrokenProcessPool, OSError) as e:
+                logging.warning(f"Parallel parsing failed, falling back to serial mode: {e!r}")
+            files_list = files_list[done:]
+
         for filename in files_list:
-            if filename.endswith(".py"):
-                structure = self.extract_structure(filename)
-                results[filename] = structure
-        return results
+            yield filename, self._extract_structure_with_probes(filename)
+
+    def _analyze_files_parallel(
+        self, files_list: list[str], workers: int
+    ) -> Iterator[tuple[str, tuple[dict, dict[str, bool]]]]:
+        """Inner generator parses files in a pool of processes, each of them reusing its own parser.
+
+        Args:
+            files_list: paths to the files to be parsed.
+            workers: number of worker processes.
+
+        Yields:
+            Tuples of a filename and a tuple of its source code's structure and the module paths probed
+            while resolving its imports, in the order of files_list.
+        """
+        chunksize = max(1, len(files_list) // (workers * 4))
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.cwd, self.file_index),
+        )
+        try:
+            structures = executor.map(_extract_structure_in_worker, files_list, chunksize=chunksize)
+            yield from zip(files_list, structures)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _extract_structure_with_probes(self, filename: str) -> tuple[dict, dict[str, bool]]:
+        """Inner method extracts the structure of a file, recording the module paths probed while resolving its imports.
+
+        Args:
+            filename: name of the file occured in the provided directory.
+
+        Returns:
+            Tuple containing the file's structure and whether each probed module path exists.
+        """
+        self._probes = {}
+        try:
+            structure = self.extract_structure(filename)
+            return structure, self._probes
+        finally:
+            self._probes = None
+
+    def _digest(self, filename: str) -> str:
+        """Inner method computes the digest the cached structure of a file is validated by.
+
+        Args:
+            filename: name of the file occured in the provided directory.
+
+        Returns:
+            Digest of the file content, the structure version and the working directory.
+        """
+        with open(filename, "rb") as f:
+            content = f.read()
+        return ParseCache.make_digest(content, _structure_version(), self.cwd)
 
     def show_results(self, results: dict) -> None:
         """Method logs out the results of the directory analyze.
@@ -665,3 +896,77 @@ class OSA_TreeSitter(object):
                             f.write(f"    Docstring:\n    {details['docstring']}\n")
                         f.write(f"        Source:\n    {details['source_code']}\n")
                 f.write("\n")
+
+
+def get_parser(filename: str) -> Parser | None:
+    """Returns the parser for the language of the file, shared within the process, or None if it is not supported."""
+    if filename.endswith(".py"):
+        if ".py" not in _PARSERS:
+            _PARSERS[".py"] = Parser(Language(tspython.language()))
+        return _PARSERS[".py"]
+    return None
+
+
+class StructureStream:
+    """Iterator over the structures of analyzed files, knowing the list of files before they are parsed.
+
+    Attributes:
+        files: paths of all files the stream yields, in order.
+        root: the working directory imports are resolved against.
+    """
+
+    def __init__(self, files: list[str], root: str, structures: Iterator[tuple[str, dict]]):
+        """Initialization of the stream.
+
+        Args:
+            files: paths of all files the stream yields, in order.
+            root: the working directory imports are resolved against.
+            structures: generator of tuples of a filename and its source code's structure.
+        """
+        self.files = files
+        self.root = root
+        self._structures = structures
+
+    def __iter__(self) -> "StructureStream":
+        return self
+
+    def __next__(self) -> tuple[str, dict]:
+        return next(self._structures)
+
+    def close(self) -> None:
+        """Stops parsing, e.g. when the consumer fails before reading all structures."""
+        self._structures.close()
+
+
+@cache
+def _structure_version() -> str:
+    """Returns the version of extracted structures, combining the extraction and the grammar versions."""
+    try:
+        grammar_version = version("tree-sitter-python")
+    except PackageNotFoundError:
+        grammar_version = "unknown"
+    return f"{STRUCTURE_VERSION}-{grammar_version}"
+
+
+def _init_worker(cwd: str, file_index: set[str] | None) -> None:
+    """Creates the analyzer of a pool worker process.
+
+    Args:
+        cwd: a working directory used to resolve imports.
+        file_index: absolute paths of the files imports are resolved to.
+    """
+    global _worker_analyzer
+    _worker_analyzer = OSA_TreeSitter(cwd, file_index=file_index)
+
+
+def _extract_structure_in_worker(filename: str) -> tuple[dict, dict[str, bool]]:
+    """Extracts the structure of a file in a pool worker process.
+
+    Args:
+        filename: name of the file occured in the provided directory.
+
+    Returns:
+        Picklable tuple of the dictionary with the file's imports and structure, and the module paths probed
+        while resolving its imports.
+    """
+    return _worker_analyzer._extract_structure_with_probes(filename)
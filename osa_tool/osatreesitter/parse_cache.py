@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+
+class ParseCache:
+    """
+    Persistent storage for file structures extracted by `OSA_TreeSitter`.
+
+    Structures are stored in a SQLite database, one row per file, together with a digest of the file content,
+    the structure format version and the analyzed directory. Since imports of a file are resolved to paths of
+    other files, every row also records which module paths were probed during resolution and whether they
+    existed. A stored structure is reused only if the digest matches and all probes give the same answer
+    against the current file index, so adding or removing a module invalidates only the files importing it.
+
+    Attributes:
+        path: Path to the SQLite database file.
+        hits: Number of structures loaded from the cache during the current run.
+        misses: Number of files parsed because their structure was absent or outdated.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens (or creates) the cache database.
+
+        Args:
+            path: Path to the SQLite database file.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS structures (
+                path TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                probes TEXT NOT NULL,
+                structure TEXT NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def make_digest(content: bytes, version: str, cwd: str) -> str:
+        """
+        Builds the digest a stored structure is validated by.
+
+        Args:
+            content: Raw content of the file.
+            version: Version of the structure format, changed whenever the extraction changes.
+            cwd: The analyzed directory imports are resolved against.
+
+        Returns:
+            str: SHA-256 hex digest.
+        """
+        digest = hashlib.sha256(f"{version}\0{cwd}\0".encode("utf-8"))
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, filename: str, digest: str, file_index: set[str]) -> dict | None:
+        """
+        Returns the stored structure of a file if it is still valid.
+
+        Args:
+            filename: Path of the file.
+            digest: Digest of the current file content, see `make_digest`.
+            file_index: Absolute paths of all files of the analyzed directory.
+
+        Returns:
+            dict | None: The structure, or None if it is absent or outdated.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT digest, probes, structure FROM structures WHERE path = ?", (os.path.abspath(filename),)
+            ).fetchone()
+
+            if row is None or row[0] != digest or not self._probes_match(json.loads(row[1]), file_index):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return json.loads(row[2])
+
+    def put(self, entries: list[tuple[str, str, dict[str, bool], dict]]) -> None:
+        """
+        Stores structures of files in a single transaction, replacing their previous versions.
+
+        Args:
+            entries: Tuples of the file path, the digest of the content the structure was extracted from
+                (see `make_digest`), whether each module path probed during import resolution existed
+                (by absolute path), and the extracted structure.
+        """
+        rows = [
+            (os.path.abspath(filename), digest, json.dumps(probes), json.dumps(structure, ensure_ascii=False))
+            for filename, digest, probes, structure in entries
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO structures (path, digest, probes, structure) VALUES (?, ?, ?, ?)", rows
+            )
+            self._connection.commit()
+
+    def summary(self) -> dict:
+        """Returns hit/miss statistics of the current run."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    @staticmethod
+    def _probes_match(probes: dict[str, bool], file_index: set[str]) -> bool:
+        return all((path in file_index) == existed for path, existed in probes.items())
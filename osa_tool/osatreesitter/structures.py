@@ -0,0 +1,235 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar
+
+from osa_tool.utils import logger
+
+
+class SourceBuffer:
+    """
+    Content of a source file shared by all structures extracted from it.
+
+    Structures keep byte offsets into the buffer instead of copies of their source code, and the text is
+    decoded only when it is accessed. A buffer that is pickled or restored from the parse cache keeps only
+    the path and size of the file and reads the content on first access. Once read, the content is kept,
+    so the text reflects the file as it was at that moment.
+
+    Attributes:
+        path: Path of the source file.
+        size: Size of the content in bytes, used to detect files changed after parsing.
+    """
+
+    __slots__ = ("path", "size", "_data")
+
+    def __init__(self, path: str, data: bytes | None = None, size: int | None = None):
+        """
+        Creates the buffer.
+
+        Args:
+            path: Path of the source file.
+            data: Content of the file as UTF-8 bytes, or None to read it on first access.
+            size: Expected size of the content if it is not given.
+        """
+        self.path = path
+        self._data = data
+        self.size = len(data) if data is not None else size
+
+    @property
+    def data(self) -> bytes:
+        """The content of the file, read on first access."""
+        if self._data is None:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            if self.size is not None and len(data) != self.size:
+                logger.warning(f"{self.path} changed after it was parsed, its source code may be out of date")
+            self._data = data
+        return self._data
+
+    def text(self, start_byte: int, end_byte: int) -> str:
+        """Decodes the text between two byte offsets."""
+        return self.data[start_byte:end_byte].decode("utf-8", errors="replace")
+
+    def __reduce__(self):
+        # Worker processes send structures without the content, the receiving process reads the file itself
+        return SourceBuffer, (self.path, None, self.size)
+
+    def __repr__(self) -> str:
+        return f"SourceBuffer({self.path!r})"
+
+
+class StructureRecord(Mapping):
+    """
+    Base of the compact records of an extracted structure.
+
+    Records are slotted dataclasses that behave as read-only mappings with the keys of the dictionaries
+    `OSA_TreeSitter` used to return, so existing callers keep working. Fields may be assigned through item
+    access, derived keys such as `source_code` are read-only.
+    """
+
+    __slots__ = ()
+    KEYS: ClassVar[tuple[str, ...]] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in {f.name for f in fields(self)}:
+            raise KeyError(f"{key} is not assignable")
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def to_dict(self) -> dict:
+        """Returns the stored fields as plain data, without the source buffer and derived text."""
+        return {f.name: _plain(getattr(self, f.name)) for f in fields(self) if f.name != "source"}
+
+
+@dataclass(slots=True, eq=False)
+class FunctionStructure(StructureRecord):
+    """
+    A function or method with the byte range of its source code.
+    """
+
+    KEYS: ClassVar[tuple[str, ...]] = (
+        "method_name",
+        "decorators",
+        "docstring",
+        "arguments",
+        "return_type",
+        "start_line",
+        "start_byte",
+        "end_byte",
+        "source_code",
+        "method_calls",
+    )
+
+    method_name: str
+    decorators: list[str]
+    docstring: str | None
+    arguments: list[str]
+    return_type: str | None
+    start_line: int
+    start_byte: int
+    end_byte: int
+    method_calls: list[dict]
+    source: SourceBuffer = field(repr=False)
+
+    @property
+    def source_code(self) -> str:
+        """The source code of the function, decoded from the file buffer."""
+        return self.source.text(self.start_byte, self.end_byte)
+
+
+@dataclass(slots=True, eq=False)
+class ClassStructure(StructureRecord):
+    """
+    A class with its attributes and methods.
+    """
+
+    KEYS: ClassVar[tuple[str, ...]] = (
+        "type",
+        "name",
+        "decorators",
+        "start_line",
+        "start_byte",
+        "end_byte",
+        "docstring",
+        "attributes",
+        "methods",
+    )
+
+    name: str
+    decorators: list[str]
+    start_line: int
+    start_byte: int
+    end_byte: int
+    docstring: str | None
+    attributes: list[str]
+    methods: list[FunctionStructure]
+
+    @property
+    def type(self) -> str:
+        return "class"
+
+
+@dataclass(slots=True, eq=False)
+class FunctionItem(StructureRecord):
+    """
+    A module-level function.
+    """
+
+    KEYS: ClassVar[tuple[str, ...]] = ("type", "start_line", "details")
+
+    start_line: int
+    details: FunctionStructure
+
+    @property
+    def type(self) -> str:
+        return "function"
+
+
+def dump_structure(structure: dict) -> dict:
+    """
+    Converts the structure of a file into plain data, e.g. to store it in the parse cache.
+
+    Args:
+        structure: The structure returned by `OSA_TreeSitter.extract_structure`.
+
+    Returns:
+        dict: The imports and items of the file, with byte offsets instead of source code.
+    """
+    return {
+        "imports": structure["imports"],
+        "structure": [{"type": item["type"], **item.to_dict()} for item in structure["structure"]],
+    }
+
+
+def load_structure(data: dict, source: SourceBuffer) -> dict:
+    """
+    Restores the structure of a file converted by `dump_structure`.
+
+    Args:
+        data: The plain data of the structure.
+        source: The buffer of the file the structure was extracted from.
+
+    Returns:
+        dict: The structure with compact records.
+    """
+    items = []
+    for item in data["structure"]:
+        item = dict(item)
+        if item.pop("type") == "class":
+            item["methods"] = [FunctionStructure(**method, source=source) for method in item["methods"]]
+            items.append(ClassStructure(**item))
+        else:
+            items.append(FunctionItem(item["start_line"], FunctionStructure(**item["details"], source=source)))
+    return {"structure": items, "imports": data["imports"]}
+
+
+def preload_source(structure: dict) -> None:
+    """
+    Reads the source buffer of a file's structure, so its text stays valid after the file is rewritten.
+
+    Args:
+        structure: The structure returned by `OSA_TreeSitter.extract_structure`.
+    """
+    for item in structure["structure"]:
+        details = item["methods"] if item["type"] == "class" else [item["details"]]
+        for function in details:
+            if isinstance(function, FunctionStructure):
+                function.source.data
+                return
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, StructureRecord):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(element) for element in value]
+    return value
@@ -0,0 +1,218 @@
+import os
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """
+    A class, method or function of the analyzed codebase.
+
+    The symbol refers to its record in the extracted structure, so the source code is not copied into the index.
+    The source code is available for methods and functions only; the source of a class is given by its byte range.
+    """
+
+    kind: str
+    qualified_name: str
+    path: str
+    details: Mapping = field(repr=False)
+
+    @property
+    def name(self) -> str:
+        """The name of the symbol without its module and class."""
+        return self.qualified_name.rsplit(".", 1)[-1]
+
+    @property
+    def source_code(self) -> str:
+        return self.details.get("source_code", "")
+
+    @property
+    def docstring(self) -> str | None:
+        return self.details.get("docstring")
+
+    @property
+    def start_byte(self) -> int | None:
+        return self.details.get("start_byte")
+
+    @property
+    def end_byte(self) -> int | None:
+        return self.details.get("end_byte")
+
+
+class SymbolIndex:
+    """
+    Index of all classes, methods and functions of a codebase by their qualified names.
+
+    The index is built from the result of `OSA_TreeSitter.analyze_directory`, or filled file by file while
+    `OSA_TreeSitter.iter_structures` parses the codebase. Module names are derived from file paths relative to
+    the root directory, with a package named after the directory of its `__init__.py`. Names bound by imports
+    are recorded as aliases of the symbols they refer to, so re-exports of a package resolve to the module that
+    actually defines the symbol. Lookups of names in expected files that are not added yet wait until they are
+    added or the index is finished, so they may run in other threads while the index is being filled.
+
+    Attributes:
+        root: The directory module names are relative to.
+        modules: Module names by normalized file path.
+        symbols: Symbols by qualified name, e.g. `pkg.module.Class.method`.
+        aliases: Qualified names of the symbols or modules that imported names refer to.
+    """
+
+    def __init__(
+        self, parsed_structure: dict | None = None, root: str | None = None, expected_files: Iterable[str] = ()
+    ):
+        """
+        Builds the index.
+
+        Args:
+            parsed_structure: Structure of every file by its path, as returned by `analyze_directory`.
+            root: The directory module names are relative to. Defaults to the common directory of all files.
+            expected_files: Paths of the files to be added later with `add_file`.
+        """
+        parsed_structure = parsed_structure or {}
+        expected_files = [os.path.normpath(path) for path in expected_files]
+        paths = [os.path.normpath(path) for path in parsed_structure] + expected_files
+        if root is None:
+            root = os.path.commonpath([os.path.dirname(path) for path in paths]) if paths else ""
+        self.root = os.path.normpath(root) if root else ""
+        self.modules: dict[str, str] = {path: self._module_name(path) for path in paths}
+        self.symbols: dict[str, Symbol] = {}
+        self.aliases: dict[str, str] = {}
+        self._pending = {self.modules[path] for path in expected_files}
+        self._condition = threading.Condition()
+
+        for filename, file_data in parsed_structure.items():
+            self.add_file(filename, file_data)
+
+    def add_file(self, filename: str, file_data: dict) -> None:
+        """
+        Adds the symbols and imported names of a file to the index.
+
+        Args:
+            filename: Path of the file.
+            file_data: Structure of the file, as returned by `extract_structure`.
+        """
+        path = os.path.normpath(filename)
+        with self._condition:
+            module = self.modules.setdefault(path, self._module_name(path))
+            for item in file_data.get("structure", []):
+                self._add_item(module, filename, item)
+            for alias, imported in file_data.get("imports", {}).items():
+                target = self.module_of(imported.get("path"))
+                if target is None:
+                    continue
+                if imported.get("class"):
+                    target = f"{target}.{imported['class']}"
+                self.aliases[self._join(module, alias)] = target
+            self._pending.discard(module)
+            self._condition.notify_all()
+
+    def finish(self) -> None:
+        """Marks the index as complete, so lookups stop waiting for expected files that were never added."""
+        with self._condition:
+            self._pending.clear()
+            self._condition.notify_all()
+
+    def module_of(self, path: str | None) -> str | None:
+        """Returns the name of the module of a file, or None if the file is neither indexed nor expected."""
+        if not path:
+            return None
+        return self.modules.get(os.path.normpath(path))
+
+    def lookup(self, qualified_name: str) -> Symbol | None:
+        """
+        Finds a symbol by its qualified name, following import aliases and re-exports.
+
+        Args:
+            qualified_name: A dotted name, e.g. `pkg.Class.method`, where any prefix may be an imported name.
+
+        Returns:
+            Symbol | None: The symbol, or None if the name does not refer to an indexed symbol.
+        """
+        seen = set()
+        name = qualified_name
+        while True:
+            self._wait_for_modules(name)
+            if name in self.symbols:
+                return self.symbols[name]
+            if name in seen:
+                return None
+            seen.add(name)
+            name = self._expand_alias(name)
+            if name is None:
+                return None
+
+    def resolve_call(self, call: dict) -> Symbol | None:
+        """
+        Finds the symbol a method call extracted by `OSA_TreeSitter` refers to.
+
+        A call of a class resolves to its constructor.
+
+        Args:
+            call: A resolved method call with the 'class', 'function' and 'path' keys.
+
+        Returns:
+            Symbol | None: The called method or function, or None if it is not defined in the codebase.
+        """
+        module = self.module_of(call.get("path"))
+        if module is None:
+            return None
+
+        parts = [part.replace("()", "") for part in (call.get("function") or "").split(".") if part]
+        class_name = call.get("class")
+        if class_name:
+            if parts and parts[0] == class_name:
+                parts = parts[1:]
+            parts.insert(0, class_name)
+        if not parts:
+            return None
+
+        symbol = self.lookup(self._join(module, ".".join(parts)))
+        if symbol is not None and symbol.kind == "class":
+            symbol = self.symbols.get(f"{symbol.qualified_name}.__init__")
+        return symbol
+
+    def _add_item(self, module: str, filename: str, item: dict) -> None:
+        if item["type"] == "function":
+            self._add_function(
+                self._join(module, item["details"]["method_name"]), filename, item["details"], "function"
+            )
+            return
+
+        class_name = self._join(module, item["name"])
+        self.symbols.setdefault(class_name, Symbol("class", class_name, filename, item))
+        for method in item["methods"]:
+            self._add_function(f"{class_name}.{method['method_name']}", filename, method, "method")
+
+    def _add_function(self, qualified_name: str, filename: str, details: Mapping, kind: str) -> None:
+        # A redefined name keeps its first definition
+        self.symbols.setdefault(qualified_name, Symbol(kind, qualified_name, filename, details))
+
+    def _wait_for_modules(self, name: str) -> None:
+        """Waits until no module the name may belong to is still expected."""
+        if not self._pending:
+            return
+        parts = name.split(".")
+        prefixes = {".".join(parts[:end]) for end in range(len(parts) + 1)}
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending.isdisjoint(prefixes))
+
+    def _expand_alias(self, name: str) -> str | None:
+        """Replaces the longest prefix of the name that is an imported name with its target."""
+        parts = name.split(".")
+        for end in range(len(parts), 0, -1):
+            target = self.aliases.get(".".join(parts[:end]))
+            if target is not None:
+                return ".".join([target] + parts[end:])
+        return None
+
+    def _module_name(self, path: str) -> str:
+        relative = os.path.relpath(path, self.root) if self.root else path
+        parts = os.path.splitext(relative)[0].split(os.sep)
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        return ".".join(part for part in parts if part not in ("", os.curdir))
+
+    @staticmethod
+    def _join(module: str, name: str) -> str:
+        return f"{module}.{name}" if module else name
@@ -3,6 +3,7 @@ from tempfile import NamedTemporaryFile
 
 import requests
 
+from osa_tool import http_client
 from osa_tool.utils import logger
 
 
@@ -45,7 +46,7 @@ def fetch_pdf_from_url(url: str) -> str | None:
         str | None: The file path to the downloaded PDF if successful, otherwise None.
     """
     try:
-        response = requests.get(url, stream=True, timeout=10)
+        response = http_client.get(url, stream=True, timeout=10)
         content_type = response.headers.get("Content-Type", "")
 
         if response.status_code == 200 and "application/pdf" in content_type.lower():
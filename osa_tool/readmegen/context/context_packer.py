@@ -0,0 +1,276 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import tiktoken
+
+from osa_tool.config.settings import Settings
+from osa_tool.readmegen.context.files_contents import FileContext
+from osa_tool.utils import logger
+
+# Share of the context window kept free for the model's response
+RESPONSE_SHARE = 0.25
+
+# Relative weights used to split the prompt budget between context sources
+README_WEIGHT = 1
+TREE_WEIGHT = 1
+FILES_WEIGHT = 2
+
+# Lines that carry most of the information about a file: definitions, decorators and headings
+SIGNATURE_PATTERN = re.compile(r"^\s*(?:@\w|(?:async\s+)?def\s|class\s|#{1,6}\s)")
+
+GAP_MARKER = "..."
+
+
+@dataclass
+class PackedContext:
+    """
+    Context sources trimmed to fit a prompt's token budget.
+    """
+
+    readme: str = ""
+    tree: str = ""
+    files: list[FileContext] = field(default_factory=list)
+
+
+class ContextPacker:
+    """
+    Fits README content, repository tree and key files into the configured context window.
+
+    The token budget left after the prompt template is split between the context sources by weight, and the
+    share a source does not need is passed on to the others. Files that do not fit are reduced to their most
+    informative lines: the top of the file followed by signatures and docstrings, with gaps marked by "...".
+    """
+
+    def __init__(self, config: Settings):
+        self.config = config
+        context_window = config.llm.context_window
+        self.context_window = context_window if isinstance(context_window, int) else None
+        max_tokens = config.llm.tokens if isinstance(config.llm.tokens, int) else 0
+        self.response_tokens = min(max_tokens, int((self.context_window or 0) * RESPONSE_SHARE))
+        self.encoding = _load_encoding(config.llm.encoder) if self.context_window else None
+
+    def count_tokens(self, text: str) -> int:
+        """Counts tokens of the text with the configured encoder."""
+        if not text:
+            return 0
+        if self.encoding is None:
+            return len(text) // 4 + 1
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def pack(
+        self,
+        fixed_parts: list[str],
+        readme: str = "",
+        tree: str = "",
+        files: list[FileContext] | None = None,
+    ) -> PackedContext:
+        """
+        Trims context sources so that the whole prompt fits the context window.
+
+        Args:
+            fixed_parts: Prompt template and the values inserted into it as is.
+            readme: README content.
+            tree: Repository file tree, one path per line.
+            files: Contents of the key files.
+
+        Returns:
+            PackedContext: Context sources fitting the remaining budget.
+        """
+        files = files or []
+        if self.context_window is None:
+            return PackedContext(readme=readme, tree=tree, files=files)
+
+        fixed_tokens = sum(self.count_tokens(str(part)) for part in fixed_parts)
+        available = max(0, self.context_window - self.response_tokens - fixed_tokens)
+
+        headers = [self._file_header(file) for file in files]
+        header_tokens = sum(self.count_tokens(header) for header in headers)
+        file_tokens = [self.count_tokens(file.content) for file in files]
+        demands = {
+            "readme": self.count_tokens(readme),
+            "tree": self.count_tokens(tree),
+            "files": header_tokens + sum(file_tokens),
+        }
+        weights = {"readme": README_WEIGHT, "tree": TREE_WEIGHT, "files": FILES_WEIGHT}
+        budgets = self._allocate(demands, weights, available)
+
+        files_budget = max(0, budgets["files"] - header_tokens)
+        file_budgets = self._allocate(
+            dict(enumerate(file_tokens)),
+            {index: 1 for index in range(len(files))},
+            files_budget,
+        )
+        packed_files = [
+            FileContext(
+                path=file.path,
+                name=file.name,
+                content=self.pack_source(file.content, file_budgets[index], file_tokens[index]),
+            )
+            for index, file in enumerate(files)
+        ]
+
+        if sum(demands.values()) > available:
+            logger.debug(f"Context packed into {available} tokens out of {sum(demands.values())} requested")
+        return PackedContext(
+            readme=self.truncate(readme, budgets["readme"], demands["readme"]),
+            tree=self.pack_tree(tree, budgets["tree"], demands["tree"]),
+            files=packed_files,
+        )
+
+    @staticmethod
+    def _allocate(demands: dict, weights: dict, available: int) -> dict:
+        """
+        Splits the available tokens by weight, passing the unused part of each share on to the others.
+
+        Args:
+            demands: Number of tokens each source needs.
+            weights: Relative weight of each source.
+            available: Number of tokens to split.
+
+        Returns:
+            dict: Number of tokens granted to each source.
+        """
+        budgets = {key: 0 for key in demands}
+        pending = {key for key, demand in demands.items() if demand > 0}
+        while pending and available > 0:
+            total_weight = sum(weights[key] for key in pending)
+            shares = {key: int(available * weights[key] / total_weight) for key in pending}
+            satisfied = {key for key in pending if demands[key] <= shares[key]}
+            if not satisfied:
+                budgets.update(shares)
+                break
+            for key in satisfied:
+                budgets[key] = demands[key]
+                available -= demands[key]
+            pending -= satisfied
+        return budgets
+
+    def truncate(self, text: str, budget: int, tokens: int | None = None) -> str:
+        """
+        Keeps the leading lines of the text that fit the budget.
+
+        Args:
+            text: Text to truncate.
+            budget: Maximum number of tokens.
+            tokens: Number of tokens in the text, if already known.
+
+        Returns:
+            str: The text itself if it fits, otherwise its prefix followed by a gap marker.
+        """
+        tokens = self.count_tokens(text) if tokens is None else tokens
+        if tokens <= budget:
+            return text
+        lines = text.splitlines()
+        selected = self._select_lines(lines, budget, list(range(len(lines))), contiguous=True)
+        return self._join_selected(lines, selected)
+
+    def pack_tree(self, tree: str, budget: int, tokens: int | None = None) -> str:
+        """
+        Keeps the shallowest paths of the repository tree that fit the budget.
+
+        Args:
+            tree: Repository file tree, one path per line.
+            budget: Maximum number of tokens.
+            tokens: Number of tokens in the tree, if already known.
+
+        Returns:
+            str: The tree itself if it fits, otherwise its top levels in the original order.
+        """
+        tokens = self.count_tokens(tree) if tokens is None else tokens
+        if tokens <= budget:
+            return tree
+        paths = tree.splitlines()
+        order = sorted(range(len(paths)), key=lambda index: (paths[index].count("/"), index))
+        selected = self._select_lines(paths, budget, order)
+        return "\n".join(paths[index] for index in sorted(selected)) + f"\n{GAP_MARKER}"
+
+    def pack_source(self, content: str, budget: int, tokens: int | None = None) -> str:
+        """
+        Reduces a file to its most informative lines within the budget.
+
+        The top of the file (module docstring, imports) is kept first, then signatures of classes and functions
+        together with their docstrings, then the rest of the file in order.
+
+        Args:
+            content: File content.
+            budget: Maximum number of tokens.
+            tokens: Number of tokens in the content, if already known.
+
+        Returns:
+            str: The content itself if it fits, otherwise the selected lines with gaps marked.
+        """
+        tokens = self.count_tokens(content) if tokens is None else tokens
+        if tokens <= budget:
+            return content
+
+        lines = content.splitlines()
+        head_budget = budget // 3
+        head = self._select_lines(lines, head_budget, list(range(len(lines))), contiguous=True)
+        order = dict.fromkeys(sorted(head))
+        for index, line in enumerate(lines):
+            if index not in head and SIGNATURE_PATTERN.match(line):
+                order.update(dict.fromkeys(self._signature_block(lines, index)))
+        order.update(dict.fromkeys(range(len(lines))))
+        return self._join_selected(lines, self._select_lines(lines, budget, list(order)))
+
+    @staticmethod
+    def _signature_block(lines: list[str], index: int) -> list[int]:
+        """Returns the indices of a signature line, its continuation up to the colon and its docstring."""
+        block = [index]
+        position = index
+        while position < len(lines) - 1 and not lines[position].rstrip().endswith(":") and len(block) < 10:
+            position += 1
+            block.append(position)
+        if position + 1 < len(lines) and lines[position + 1].strip().startswith(('"""', "'''")):
+            position += 1
+            block.append(position)
+            quote = lines[position].strip()[:3]
+            closed = lines[position].strip().count(quote) > 1
+            while not closed and position < len(lines) - 1:
+                position += 1
+                block.append(position)
+                closed = quote in lines[position]
+        return block
+
+    def _select_lines(self, lines: list[str], budget: int, order: list[int], contiguous: bool = False) -> set[int]:
+        """Takes lines in the given order while they fit the budget, skipping those that do not unless contiguous."""
+        selected = set()
+        used = 0
+        for index in order:
+            cost = self.count_tokens(lines[index] + "\n")
+            if used + cost > budget:
+                if contiguous:
+                    break
+                continue
+            selected.add(index)
+            used += cost
+        return selected
+
+    @staticmethod
+    def _join_selected(lines: list[str], selected: set[int]) -> str:
+        """Joins selected lines in the original order, marking skipped fragments."""
+        result = []
+        previous = -1
+        for index in sorted(selected):
+            if index != previous + 1:
+                result.append(GAP_MARKER)
+            result.append(lines[index])
+            previous = index
+        if previous != len(lines) - 1:
+            result.append(GAP_MARKER)
+        return "\n".join(result)
+
+    @staticmethod
+    def _file_header(file: FileContext) -> str:
+        return f"### {file.name} ({file.path})\n\n\n"
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(encoder: str) -> tiktoken.Encoding | None:
+    """Loads the tokenizer once per process, falling back to length-based estimates if it is unavailable."""
+    try:
+        return tiktoken.get_encoding(encoder)
+    except Exception as e:
+        logger.warning(f"Tokenizer '{encoder}' is unavailable, estimating tokens by length: {e}")
+        return None
@@ -4,6 +4,7 @@ import re
 import requests
 import tomli
 
+from osa_tool import http_client
 from osa_tool.readmegen.utils import find_in_repo_tree, read_file
 from osa_tool.utils import logger
 
@@ -123,7 +124,7 @@ class PyPiPackageInspector:
         """
         url = self.pypi_url_template.format(package=package_name)
         try:
-            response = requests.get(url)
+            response = http_client.get(url)
             return response.status_code == 200
         except requests.RequestException as e:
             logger.error(f"Request to PyPI failed: {e}")
@@ -141,7 +142,7 @@ class PyPiPackageInspector:
         """
         url = self.pypi_url_template.format(package=package_name)
         try:
-            response = requests.get(url)
+            response = http_client.get(url)
             if response.status_code == 200:
                 data = response.json()
                 return data.get("info", {}).get("version")
@@ -163,7 +164,7 @@ class PyPiPackageInspector:
         headers = {"X-API-Key": f"{self.api_key}"}
 
         try:
-            response = requests.get(url, headers=headers)
+            response = http_client.get(url, headers=headers)
             if response.status_code == 200:
                 data = response.json()
                 return data.get("total_downloads")
@@ -2,9 +2,9 @@ import json
 import os
 import re
 
-import requests
 import tomli
 
+from osa_tool import http_client
 from osa_tool.analytics.metadata import load_data_metadata
 from osa_tool.analytics.sourcerank import SourceRank
 from osa_tool.config.settings import ConfigLoader
@@ -73,7 +73,7 @@ class MarkdownBuilder:
 
     @staticmethod
     def _check_url(url):
-        response = requests.get(url)
+        response = http_client.get(url)
         return response.status_code == 200
 
     @property
@@ -7,7 +7,7 @@ from osa_tool.readmegen.context.files_contents import FileProcessor
 from osa_tool.readmegen.postprocessor.response_cleaner import process_text
 from osa_tool.readmegen.prompts.prompts_builder import PromptBuilder
 from osa_tool.readmegen.utils import extract_example_paths, extract_relative_paths
-from osa_tool.utils import logger
+from osa_tool.utils import logger, run_task_graph
 
 
 class LLMClient:
@@ -26,6 +26,7 @@ class LLMClient:
         This method processes key files to extract core features and a general overview of the project.
         If example files are detected (e.g., scripts or notebooks demonstrating usage), it also generates
         a Getting Started section. Each part is generated by sending prompts to the model and cleaned before returning.
+        The Getting Started request does not depend on the other parts and runs concurrently with them.
 
         Returns:
             tuple[str, str, str]: A tuple containing:
@@ -34,23 +35,18 @@ class LLMClient:
                 - getting_started: (Optional) Setup or usage guide if examples are available.
         """
         logger.info("Started generating README-style summary.")
-        key_files = self.get_key_files()
-        key_files_content = FileProcessor(self.config_loader, key_files).process_files()
-
-        logger.info("Generating core features of the project...")
-        core_features = self.run_request(self.prompts.get_prompt_core_features(key_files_content))
-
-        logger.info("Generating project overview...")
-        overview = self.run_request(self.prompts.get_prompt_overview(core_features))
+        results = run_task_graph(
+            {
+                "key_files_content": (self._get_key_files_content, []),
+                "core_features": (self._generate_core_features, ["key_files_content"]),
+                "overview": (self._generate_overview, ["core_features"]),
+                "getting_started": (self._generate_getting_started, []),
+            }
+        )
 
-        core_features = process_text(core_features)
-        overview = process_text(overview)
-
-        logger.info("Attempting to generate Getting Started section...")
-        examples_files = extract_example_paths(self.tree)
-        examples_content = FileProcessor(self.config_loader, examples_files).process_files()
-        getting_started = self.run_request(self.prompts.get_prompt_getting_started(examples_content))
-        getting_started = process_text(getting_started)
+        core_features = process_text(results["core_features"])
+        overview = process_text(results["overview"])
+        getting_started = process_text(results["getting_started"])
 
         logger.info("README-style summary generation completed.")
         return core_features, overview, getting_started
@@ -67,35 +63,73 @@ class LLMClient:
              - overview: General description and project context.
              - content: Content section based on key files and documentation.
              - algorithms: Description of algorithms used.
+
+        The key files branch and the PDF extraction branch run concurrently, and the final three requests
+        are sent in parallel once both summaries are ready.
         """
         logger.info("Started generating Article-style summary.")
+        results = run_task_graph(
+            {
+                "key_files_content": (self._get_key_files_content, []),
+                "files_summary": (self._generate_files_summary, ["key_files_content"]),
+                "pdf_content": (lambda: self._extract_pdf_content(article), []),
+                "pdf_summary": (self._generate_pdf_summary, ["pdf_content"]),
+                "overview": (self._generate_overview_article, ["files_summary", "pdf_summary"]),
+                "content": (self._generate_content_article, ["key_files_content", "pdf_summary"]),
+                "algorithms": (self._generate_algorithms_article, ["files_summary", "pdf_summary"]),
+            }
+        )
+
+        overview = process_text(results["overview"])
+        content = process_text(results["content"])
+        algorithms = process_text(results["algorithms"])
+
+        logger.info("Article-style summary generation completed.")
+        return overview, content, algorithms
+
+    def _get_key_files_content(self) -> list:
+        """Identifies key files of the repository and reads their contents."""
         key_files = self.get_key_files()
-        key_files_content = FileProcessor(self.config_loader, key_files).process_files()
+        return FileProcessor(self.config_loader, key_files).process_files()
+
+    def _generate_core_features(self, key_files_content: list) -> str:
+        logger.info("Generating core features of the project...")
+        return self.run_request(self.prompts.get_prompt_core_features(key_files_content))
+
+    def _generate_overview(self, core_features: str) -> str:
+        logger.info("Generating project overview...")
+        return self.run_request(self.prompts.get_prompt_overview(core_features))
+
+    def _generate_getting_started(self) -> str:
+        logger.info("Attempting to generate Getting Started section...")
+        examples_files = extract_example_paths(self.tree)
+        examples_content = FileProcessor(self.config_loader, examples_files).process_files()
+        return self.run_request(self.prompts.get_prompt_getting_started(examples_content))
 
+    def _generate_files_summary(self, key_files_content: list) -> str:
         logger.info("Generating summary of key files...")
-        files_summary = self.run_request(self.prompts.get_prompt_files_summary(key_files_content))
+        return self.run_request(self.prompts.get_prompt_files_summary(key_files_content))
 
+    @staticmethod
+    def _extract_pdf_content(article: str) -> str:
         path_to_pdf = get_pdf_path(article)
-        pdf_content = PdfParser(path_to_pdf).data_extractor()
+        return PdfParser(path_to_pdf).data_extractor()
 
+    def _generate_pdf_summary(self, pdf_content: str) -> str:
         logger.info("Generating summary of PDF content...")
-        pdf_summary = self.run_request(self.prompts.get_prompt_pdf_summary(pdf_content))
+        return self.run_request(self.prompts.get_prompt_pdf_summary(pdf_content))
 
+    def _generate_overview_article(self, files_summary: str, pdf_summary: str) -> str:
         logger.info("Generating project overview from combined sources...")
-        overview = self.run_request(self.prompts.get_prompt_overview_article(files_summary, pdf_summary))
+        return self.run_request(self.prompts.get_prompt_overview_article(files_summary, pdf_summary))
 
+    def _generate_content_article(self, key_files_content: list, pdf_summary: str) -> str:
         logger.info("Generating content section...")
-        content = self.run_request(self.prompts.get_prompt_content_article(key_files_content, pdf_summary))
+        return self.run_request(self.prompts.get_prompt_content_article(key_files_content, pdf_summary))
 
+    def _generate_algorithms_article(self, files_summary: str, pdf_summary: str) -> str:
         logger.info("Generating algorithm description...")
-        algorithms = self.run_request(self.prompts.get_prompt_algorithms_article(files_summary, pdf_summary))
-
-        overview = process_text(overview)
-        content = process_text(content)
-        algorithms = process_text(algorithms)
-
-        logger.info("Article-style summary generation completed.")
-        return overview, content, algorithms
+        return self.run_request(self.prompts.get_prompt_algorithms_article(files_summary, pdf_summary))
 
     def run_request(self, prompt: str) -> str:
         """Sends a prompt to the model and returns the response."""
@@ -1,4 +1,7 @@
 import re
+from typing import Iterable
+
+from osa_tool.models.streaming import collect_stream, is_json_complete, json_object_end
 
 
 def process_text(response: str) -> str:
@@ -16,6 +19,26 @@ def process_text(response: str) -> str:
     return text
 
 
+def process_text_stream(chunks: Iterable[str]) -> str:
+    """
+    Streaming variant of `process_text` for JSON responses.
+
+    Stops reading the stream as soon as a complete JSON object has been received,
+    drops anything generated after it and cleans the rest as `process_text` does.
+
+    Args:
+        chunks: Response chunks yielded by `ModelHandler.send_request_stream`.
+
+    Returns:
+        str: The cleaned response.
+    """
+    text = collect_stream(chunks, is_json_complete)
+    end = json_object_end(text)
+    if end != -1:
+        text = text[:end]
+    return process_text(text)
+
+
 def clean_llm_response(response: str) -> str:
     """
     Cleans the LLM response by removing leading and trailing quotes (single, double, or backticks)
@@ -3,6 +3,7 @@ import os
 from osa_tool.analytics.metadata import load_data_metadata
 from osa_tool.analytics.sourcerank import SourceRank
 from osa_tool.config.settings import ConfigLoader
+from osa_tool.readmegen.context.context_packer import ContextPacker
 from osa_tool.readmegen.context.files_contents import FileContext
 from osa_tool.readmegen.prompts.prompts_article_config import PromptArticleLoader
 from osa_tool.readmegen.prompts.prompts_config import PromptLoader
@@ -21,13 +22,20 @@ class PromptBuilder:
         self.repo_url = self.config.git.repository
         self.metadata = load_data_metadata(self.repo_url)
         self.base_path = os.path.join(os.getcwd(), parse_folder_name(self.repo_url))
+        self.packer = ContextPacker(self.config)
 
     def get_prompt_preanalysis(self) -> str:
         """Builds a preanalysis prompt using the repository tree and README content."""
         try:
-            formatted_prompt = self.prompts["preanalysis"].format(
-                repository_tree=self.tree,
-                readme_content=extract_readme_content(self.base_path),
+            template = self.prompts["preanalysis"]
+            context = self.packer.pack(
+                [template],
+                readme=extract_readme_content(self.base_path),
+                tree=self.tree,
+            )
+            formatted_prompt = template.format(
+                repository_tree=context.tree,
+                readme_content=context.readme,
             )
             return formatted_prompt
         except Exception as e:
@@ -37,11 +45,17 @@ class PromptBuilder:
     def get_prompt_core_features(self, key_files: list[FileContext]) -> str:
         """Builds a core features prompt using project metadata, README content, and key files."""
         try:
-            formatted_prompt = self.prompts["core_features"].format(
+            template = self.prompts["core_features"]
+            context = self.packer.pack(
+                [template, self.metadata.name, self.metadata],
+                readme=extract_readme_content(self.base_path),
+                files=key_files,
+            )
+            formatted_prompt = template.format(
                 project_name=self.metadata.name,
                 metadata=self.metadata,
-                readme_content=extract_readme_content(self.base_path),
-                key_files_content=self.serialize_file_contexts(key_files),
+                readme_content=context.readme,
+                key_files_content=self.serialize_file_contexts(context.files),
             )
             return formatted_prompt
         except Exception as e:
@@ -51,10 +65,15 @@ class PromptBuilder:
     def get_prompt_overview(self, core_features: str) -> str:
         """Builds an overview prompt using metadata, README content, and extracted core features."""
         try:
-            formatted_prompt = self.prompts["overview"].format(
+            template = self.prompts["overview"]
+            context = self.packer.pack(
+                [template, self.metadata.name, self.metadata.description, core_features],
+                readme=extract_readme_content(self.base_path),
+            )
+            formatted_prompt = template.format(
                 project_name=self.metadata.name,
                 description=self.metadata.description,
-                readme_content=extract_readme_content(self.base_path),
+                readme_content=context.readme,
                 core_features=core_features,
             )
             return formatted_prompt
@@ -65,10 +84,16 @@ class PromptBuilder:
     def get_prompt_getting_started(self, examples_files: list[FileContext]) -> str:
         """Builds a getting started prompt using metadata, README content, and example files."""
         try:
-            formatted_prompt = self.prompts["getting_started"].format(
+            template = self.prompts["getting_started"]
+            context = self.packer.pack(
+                [template, self.metadata.name],
+                readme=extract_readme_content(self.base_path),
+                files=examples_files,
+            )
+            formatted_prompt = template.format(
                 project_name=self.metadata.name,
-                readme_content=extract_readme_content(self.base_path),
-                examples_files_content=self.serialize_file_contexts(examples_files),
+                readme_content=context.readme,
+                examples_files_content=self.serialize_file_contexts(context.files),
             )
             return formatted_prompt
         except Exception as e:
@@ -90,9 +115,9 @@ class PromptBuilder:
     def get_prompt_files_summary(self, files_content: list[FileContext]) -> str:
         """Builds a files summary prompt using serialized file contents."""
         try:
-            formatted_prompt = self.prompts_article["file_summary"].format(
-                files_content=self.serialize_file_contexts(files_content)
-            )
+            template = self.prompts_article["file_summary"]
+            context = self.packer.pack([template], files=files_content)
+            formatted_prompt = template.format(files_content=self.serialize_file_contexts(context.files))
             return formatted_prompt
         except Exception as e:
             logger.error(f"Failed to build files summary prompt: {e}")
@@ -123,9 +148,11 @@ class PromptBuilder:
     def get_prompt_content_article(self, key_files: list[FileContext], pdf_summary: str) -> str:
         """Builds a content article prompt using metadata, key file content, and PDF summary."""
         try:
-            formatted_prompt = self.prompts_article["content"].format(
+            template = self.prompts_article["content"]
+            context = self.packer.pack([template, self.metadata.name, pdf_summary], files=key_files)
+            formatted_prompt = template.format(
                 project_name=self.metadata.name,
-                files_content=key_files,
+                files_content=self.serialize_file_contexts(context.files),
                 pdf_summary=pdf_summary,
             )
             return formatted_prompt
@@ -13,6 +13,9 @@ from osa_tool.convertion.notebook_converter import NotebookConverter
 from osa_tool.docs_generator.docs_run import generate_documentation
 from osa_tool.docs_generator.license import compile_license_file
 from osa_tool.github_agent.github_agent import GithubAgent
+from osa_tool.http_client import configure_http_client
+from osa_tool.models.cache import log_cache_summary
+from osa_tool.models.rate_limiter import log_rate_limiter_summary
 from osa_tool.organization.repo_organizer import RepoOrganizer
 from osa_tool.osatreesitter.docgen import DocGen
 from osa_tool.osatreesitter.osa_treesitter import OSA_TreeSitter
@@ -37,105 +40,140 @@ def main():
     parser = build_parser_from_yaml(build_arguments_path())
     args = parser.parse_args()
     workflow_keys = get_keys_from_group_in_yaml(build_arguments_path(), "workflow")
-    create_fork = not args.no_fork
-    create_pull_request = not args.no_pull_request
 
     try:
-        # Load configurations and update
-        config = load_configuration(
-            repo_url=args.repository,
-            api=args.api,
-            base_url=args.base_url,
-            model_name=args.model,
-        )
-        sourcerank = SourceRank(config)
+        run_pipeline(args, workflow_keys)
+        log_cache_summary()
+        log_rate_limiter_summary()
+        rich_section("All operations completed successfully")
+    except Exception as e:
+        logger.error("Error: %s", e, exc_info=True)
 
-        # Initialize GitHub agent and perform operations
-        github_agent = GithubAgent(args.repository, args.branch)
-        if create_fork:
-            github_agent.star_repository()
-            github_agent.create_fork()
-        github_agent.clone_repository()
 
-        # Initialize ModeScheduler
-        scheduler = ModeScheduler(config, sourcerank, args, workflow_keys)
-        plan = scheduler.plan
+def run_pipeline(args, workflow_keys: list, interactive: bool = True, cache_directory: str | None = None) -> dict:
+    """Processes a single repository according to the command-line arguments.
 
+    Args:
+        args: Parsed command-line arguments.
+        workflow_keys: Names of the arguments of the workflow group.
+        interactive: Whether the task plan is confirmed by the user before execution.
+        cache_directory: Directory of the on-disk caches, overriding the configured one.
+
+    Returns:
+        dict: The executed task plan.
+
+    Raises:
+        Exception: Any error that stopped the processing.
+    """
+    create_fork = not args.no_fork
+    create_pull_request = not args.no_pull_request
+
+    # Load configurations and update
+    config = load_configuration(
+        repo_url=args.repository,
+        api=args.api,
+        base_url=args.base_url,
+        model_name=args.model,
+    )
+    if cache_directory:
+        config.config.cache = config.config.cache.model_copy(update={"directory": cache_directory})
+    configure_http_client(config.config.http)
+
+    # Initialize GitHub agent and perform operations
+    mirror_dir = os.path.join(config.config.cache.directory, "git") if config.config.clone.mirror else None
+    github_agent = GithubAgent(args.repository, args.branch, clone_settings=config.config.clone, mirror_dir=mirror_dir)
+    if create_fork:
+        github_agent.star_repository()
+        github_agent.create_fork()
+    github_agent.clone_repository()
+
+    # Repository file tree is indexed once and shared by all stages
+    sourcerank = SourceRank(config)
+
+    # Initialize ModeScheduler
+    scheduler = ModeScheduler(config, sourcerank, args, workflow_keys, interactive=interactive)
+    plan = scheduler.plan
+
+    if create_fork:
+        github_agent.create_and_checkout_branch()
+
+    # .ipynb to .py convertion
+    if plan.get("convert_notebooks"):
+        rich_section("Jupyter notebooks convertion")
+        convert_notebooks(args.repository, plan.get("convert_notebooks"))
+        sourcerank.snapshot.invalidate()
+
+    # Repository Analysis Report generation
+    if plan.get("report"):
+        rich_section("Report generation")
+        analytics = ReportGenerator(config, sourcerank)
+        analytics.build_pdf()
         if create_fork:
-            github_agent.create_and_checkout_branch()
-
-        # .ipynb to .py convertion
-        if plan.get("convert_notebooks"):
-            rich_section("Jupyter notebooks convertion")
-            convert_notebooks(args.repository, plan.get("convert_notebooks"))
-
-        # Repository Analysis Report generation
-        if plan.get("report"):
-            rich_section("Report generation")
-            analytics = ReportGenerator(config, sourcerank)
-            analytics.build_pdf()
-            if create_fork:
-                github_agent.upload_report(analytics.filename, analytics.output_path)
-
-        # Auto translating names of directories
-        if plan.get("translate_dirs"):
-            rich_section("Directory and file translation")
-            translation = DirectoryTranslator(config)
-            translation.rename_directories_and_files()
-
-        # Docstring generation
-        if plan.get("docstring"):
-            rich_section("Docstrings generation")
-            generate_docstrings(config)
-
-        # License compiling
-        if plan.get("ensure_license"):
-            rich_section("License generation")
-            compile_license_file(sourcerank, plan.get("ensure_license"))
-
-        # Generate community documentation
-        if plan.get("community_docs"):
-            rich_section("Community docs generation")
-            generate_documentation(config)
-
-        # Readme generation
-        if plan.get("readme"):
-            rich_section("README generation")
-            readme_agent(config, plan.get("article"))
-
-        # About section generation
-        about_gen = None
-        if plan.get("about"):
-            rich_section("About Section generation")
-            about_gen = AboutGenerator(config)
-            about_gen.generate_about_content()
-            if create_fork:
-                github_agent.update_about_section(about_gen.get_about_content())
-
-        # Generate GitHub workflows
-        if plan.get("generate_workflows"):
-            rich_section("Workflows generation")
-            update_workflow_config(config, plan, workflow_keys)
-            generate_github_workflows(config)
-
-        # Organize repository by adding 'tests' and 'examples' directories if they aren't exist
-        if plan.get("organize"):
-            rich_section("Repository organization")
-            organizer = RepoOrganizer(os.path.join(os.getcwd(), parse_folder_name(args.repository)))
-            organizer.organize()
-
-        if create_fork and create_pull_request:
-            rich_section("Publishing changes")
-            github_agent.commit_and_push_changes()
-            github_agent.create_pull_request(body=about_gen.get_about_section_message())
-
-        if plan.get("delete_dir"):
-            rich_section("Repository deletion")
-            delete_repository(args.repository)
+            github_agent.upload_report(analytics.filename, analytics.output_path)
+
+    # Auto translating names of directories
+    if plan.get("translate_dirs"):
+        rich_section("Directory and file translation")
+        translation = DirectoryTranslator(config)
+        translation.rename_directories_and_files()
+        sourcerank.snapshot.invalidate()
+
+    # Docstring generation
+    if plan.get("docstring"):
+        rich_section("Docstrings generation")
+        generate_docstrings(config)
+        sourcerank.snapshot.invalidate()
+
+    # License compiling
+    if plan.get("ensure_license"):
+        rich_section("License generation")
+        compile_license_file(sourcerank, plan.get("ensure_license"))
+        sourcerank.snapshot.invalidate()
+
+    # Generate community documentation
+    if plan.get("community_docs"):
+        rich_section("Community docs generation")
+        generate_documentation(config)
+        sourcerank.snapshot.invalidate()
+
+    # Readme generation
+    if plan.get("readme"):
+        rich_section("README generation")
+        readme_agent(config, plan.get("article"))
+        sourcerank.snapshot.invalidate()
+
+    # About section generation
+    about_gen = None
+    if plan.get("about"):
+        rich_section("About Section generation")
+        about_gen = AboutGenerator(config)
+        about_gen.generate_about_content()
+        if create_fork:
+            github_agent.update_about_section(about_gen.get_about_content())
 
-        rich_section("All operations completed successfully")
-    except Exception as e:
-        logger.error("Error: %s", e, exc_info=True)
+    # Generate GitHub workflows
+    if plan.get("generate_workflows"):
+        rich_section("Workflows generation")
+        update_workflow_config(config, plan, workflow_keys)
+        generate_github_workflows(config)
+        sourcerank.snapshot.invalidate()
+
+    # Organize repository by adding 'tests' and 'examples' directories if they aren't exist
+    if plan.get("organize"):
+        rich_section("Repository organization")
+        organizer = RepoOrganizer(os.path.join(os.getcwd(), parse_folder_name(args.repository)))
+        organizer.organize()
+
+    if create_fork and create_pull_request:
+        rich_section("Publishing changes")
+        github_agent.commit_and_push_changes()
+        github_agent.create_pull_request(body=about_gen.get_about_section_message())
+
+    if plan.get("delete_dir"):
+        rich_section("Repository deletion")
+        delete_repository(args.repository)
+
+    return plan
 
 
 def convert_notebooks(repo_url: str, notebook_paths: List[str] | None = None) -> None:
@@ -168,10 +206,19 @@ def generate_docstrings(config_loader: ConfigLoader) -> None:
     try:
         repo_url = config_loader.config.git.repository
         repo_path = parse_folder_name(repo_url)
-        ts = OSA_TreeSitter(repo_path)
-        res = ts.analyze_directory(ts.cwd)
+        docstring_settings = config_loader.config.docstrings
+        cache_settings = config_loader.config.cache
+        cache_path = None
+        if cache_settings.enabled and docstring_settings.parse_cache:
+            cache_path = os.path.join(cache_settings.directory, "structures.sqlite")
+        ts = OSA_TreeSitter(
+            repo_path,
+            workers=docstring_settings.parse_workers,
+            parallel_threshold=docstring_settings.parallel_parse_threshold,
+            cache_path=cache_path,
+        )
         dg = DocGen(config_loader)
-        dg.process_python_file(res)
+        dg.process_python_file(ts.iter_structures(ts.cwd))
         dg.generate_documentation_mkdocs(repo_path)
         dg.create_mkdocs_github_workflow(repo_url, repo_path)
 
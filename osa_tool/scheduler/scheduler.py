@@ -7,7 +7,7 @@ from osa_tool.analytics.metadata import load_data_metadata
 from osa_tool.analytics.sourcerank import SourceRank
 from osa_tool.config.settings import ConfigLoader
 from osa_tool.models.models import ModelHandlerFactory, ModelHandler
-from osa_tool.readmegen.postprocessor.response_cleaner import process_text
+from osa_tool.readmegen.postprocessor.response_cleaner import process_text, process_text_stream
 from osa_tool.scheduler.prompts import PromptLoader, PromptConfig
 from osa_tool.scheduler.workflow_manager import WorkflowManager
 from osa_tool.ui.plan_editor import PlanEditor
@@ -21,8 +21,11 @@ class ModeScheduler:
     based on repository analysis, configuration, and selected execution mode.
     """
 
-    def __init__(self, config: ConfigLoader, sourcerank: SourceRank, args, workflow_keys: list):
+    def __init__(
+        self, config: ConfigLoader, sourcerank: SourceRank, args, workflow_keys: list, interactive: bool = True
+    ):
         self.mode = args.mode
+        self.interactive = interactive
         self.args = args
         self.workflow_keys = workflow_keys
         self.config = config.config
@@ -85,6 +88,10 @@ class ModeScheduler:
         else:
             raise ValueError(f"Unsupported mode: {self.mode}")
 
+        if not self.interactive:
+            logger.info("Non-interactive run, using the plan without confirmation.")
+            return plan
+
         if self.args.web_mode:
             logger.info("Web mode enabled, returning plan for web interface.")
             if self.mode in ["basic", "advanced"]:
@@ -113,8 +120,10 @@ class ModeScheduler:
             readme_content=extract_readme_content(self.base_path),
         )
 
-        response = self.model_handler.send_request(formatted_prompt)
-        cleaned_response = process_text(response)
+        if self.config.llm.stream is True:
+            cleaned_response = process_text_stream(self.model_handler.send_request_stream(formatted_prompt))
+        else:
+            cleaned_response = process_text(self.model_handler.send_request(formatted_prompt))
 
         try:
             parsed_json = json.loads(cleaned_response)
@@ -1,12 +1,16 @@
 import logging
 import os
 import shutil
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Any, Callable
 from urllib.parse import urlparse
 
 from rich.console import Console
 from rich.logging import RichHandler
 
+from osa_tool.analytics.snapshot import RepositorySnapshot
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(message)s",
@@ -122,6 +126,51 @@ def parse_git_url(repo_url: str) -> tuple[str, str, str, str]:
     return host_domain, host, name, full_name
 
 
+def run_task_graph(tasks: dict[str, tuple[Callable, list[str]]], max_workers: int | None = None) -> dict[str, Any]:
+    """
+    Runs a dependency graph of tasks in a thread pool, starting each task as soon as its dependencies are done.
+
+    Args:
+        tasks: Mapping of task names to a function and the names of the tasks it depends on.
+            The function receives the results of its dependencies as positional arguments, in the listed order.
+        max_workers: Maximum number of tasks running at once. Defaults to the number of tasks.
+
+    Returns:
+        dict[str, Any]: Results of all tasks by name.
+
+    Raises:
+        ValueError: If a task depends on an unknown task or the dependencies form a cycle.
+        Exception: The first exception raised by a task; tasks that have not started yet are cancelled.
+    """
+    for name, (_, dependencies) in tasks.items():
+        unknown = set(dependencies) - tasks.keys()
+        if unknown:
+            raise ValueError(f"Task '{name}' depends on unknown tasks: {sorted(unknown)}")
+
+    results: dict[str, Any] = {}
+    running: dict[Future, str] = {}
+    waiting = dict(tasks)
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(tasks))) as executor:
+        while waiting or running:
+            for name, (func, dependencies) in list(waiting.items()):
+                if all(dependency in results for dependency in dependencies):
+                    running[executor.submit(func, *(results[dependency] for dependency in dependencies))] = name
+                    del waiting[name]
+            if not running:
+                raise ValueError(f"Tasks have cyclic dependencies: {sorted(waiting)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception:
+                    for pending in running:
+                        pending.cancel()
+                    raise
+    return results
+
+
 def get_repo_tree(repo_path: str) -> str:
     """
     Builds a text representation of the project file tree, excluding the .git directory.
@@ -134,54 +183,7 @@ def get_repo_tree(repo_path: str) -> str:
              excluding the `.git` directory. Each file or directory path is on a new line.
 
     """
-    repo_path = Path(repo_path)
-    excluded_extensions = {
-        ".png",
-        ".jpg",
-        ".jpeg",
-        ".gif",
-        ".bmp",
-        ".tiff",
-        ".webp",
-        ".drawio",  # images
-        ".mp4",
-        ".mov",
-        ".avi",
-        ".mkv",
-        ".flv",
-        ".wmv",
-        ".webm",  # videos
-        ".csv",
-        ".tsv",
-        ".parquet",
-        ".json",
-        ".xml",
-        ".xls",
-        ".xlsx",  # data files
-        ".zip",
-        ".tar",
-        ".gz",
-        ".bz2",
-        ".7z",  # archives
-        ".exe",
-        ".dll",
-        ".so",
-        ".bin",
-        ".obj",
-        ".class",
-        ".pkl",  # binaries
-        ".pdf",  # documents
-    }
-
-    lines = []
-    for path in sorted(repo_path.rglob("*")):
-        if any(part.lower() in {".git", "log", "logs"} for part in path.parts):
-            continue
-        if path.is_file() and path.suffix.lower() in excluded_extensions:
-            continue
-        rel_path = path.relative_to(repo_path).as_posix()
-        lines.append(str(rel_path))
-    return "\n".join(lines)
+    return RepositorySnapshot(repo_path).tree
 
 
 def extract_readme_content(repo_path: str) -> str:
@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osa_tool.aboutgen.topic_index import CURATED_TOPICS_URL, TopicIndex
+
+
+def make_response(status_code: int, payload=None, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.headers = headers or {}
+    return response
+
+
+def fake_get(url, params=None, headers=None):
+    if url == CURATED_TOPICS_URL:
+        return make_response(200, [{"name": "python", "type": "dir"}, {"name": "README.md", "type": "file"}])
+    query = params["q"].split()[0]
+    if query == "ml":
+        return make_response(200, {"total_count": 1, "items": [{"name": "machine-learning"}]})
+    if query == "automl":
+        return make_response(200, {"total_count": 3, "items": [{"name": "automl"}, {"name": "hyperparameter-tuning"}]})
+    return make_response(200, {"total_count": 0, "items": []})
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "topics.json")
+
+
+@patch("osa_tool.aboutgen.topic_index.http_client.get", side_effect=fake_get)
+def test_validate_uses_curated_topics_and_searches_misses(mock_get, index_path):
+    # Arrange
+    index = TopicIndex(index_path, ttl_hours=1)
+    # Act
+    result = index.validate(["Python", "ml", "automl", "made-up-topic"])
+    # Assert
+    assert result == ["python", "machine-learning", "automl"]
+    searched = [call.kwargs["params"]["q"] for call in mock_get.call_args_list if call.kwargs.get("params")]
+    assert len(searched) == 3
+
+
+@patch("osa_tool.aboutgen.topic_index.http_client.get", side_effect=fake_get)
+def test_search_results_are_reused_from_disk(mock_get, index_path):
+    # Arrange
+    TopicIndex(index_path, ttl_hours=1).validate(["automl"])
+    mock_get.reset_mock()
+    # Act
+    result = TopicIndex(index_path, ttl_hours=1).validate(["automl", "hyperparameter-tuning", "python"])
+    # Assert
+    assert result == ["automl", "hyperparameter-tuning", "python"]
+    mock_get.assert_not_called()
+
+
+@patch("osa_tool.aboutgen.topic_index.http_client.get")
+def test_expired_index_is_revalidated_by_etag(mock_get, index_path):
+    # Arrange
+    mock_get.return_value = make_response(200, [{"name": "python", "type": "dir"}], {"ETag": '"v1"'})
+    index = TopicIndex(index_path, ttl_hours=1)
+    index.refresh()
+    index._refreshed_at -= 7200
+    mock_get.return_value = make_response(304)
+    # Act
+    index.refresh()
+    # Assert
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert index.curated == {"python"}
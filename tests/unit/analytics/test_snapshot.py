@@ -0,0 +1,55 @@
+from osa_tool.analytics.snapshot import RepositorySnapshot
+
+
+def make_repo(root):
+    (root / ".git" / "objects").mkdir(parents=True)
+    (root / "logs").mkdir()
+    (root / "logs" / "run.txt").write_text("log")
+    (root / "src").mkdir()
+    (root / "src" / "main.py").write_text("print('hello')")
+    (root / "src" / "image.png").write_bytes(b"\x89PNG")
+    (root / "README.md").write_text("# Repo")
+
+
+def test_tree_lists_relative_paths_with_exclusions(tmp_path):
+    # Arrange
+    make_repo(tmp_path)
+    # Act
+    lines = RepositorySnapshot(str(tmp_path)).tree.splitlines()
+    # Assert
+    assert lines == ["README.md", "src", "src/main.py"]
+
+
+def test_files_filters_by_extension(tmp_path):
+    # Arrange
+    make_repo(tmp_path)
+    snapshot = RepositorySnapshot(str(tmp_path))
+    # Act
+    files = snapshot.files({".py"})
+    # Assert
+    assert [entry.path for entry in files] == ["src/main.py"]
+    assert not any(entry.path.startswith(".git") for entry in snapshot.entries)
+
+
+def test_for_path_returns_shared_snapshot(tmp_path):
+    # Assert
+    assert RepositorySnapshot.for_path(str(tmp_path)) is RepositorySnapshot.for_path(str(tmp_path / "."))
+
+
+def test_invalidate_rescans_repository(tmp_path):
+    # Arrange
+    make_repo(tmp_path)
+    snapshot = RepositorySnapshot(str(tmp_path))
+    assert "LICENSE" not in snapshot.tree.splitlines()
+    (tmp_path / "LICENSE").write_text("MIT")
+    # Act
+    stale = snapshot.tree
+    snapshot.invalidate()
+    # Assert
+    assert "LICENSE" not in stale.splitlines()
+    assert "LICENSE" in snapshot.tree.splitlines()
+
+
+def test_missing_repository_is_empty(tmp_path):
+    # Assert
+    assert RepositorySnapshot(str(tmp_path / "absent")).tree == ""
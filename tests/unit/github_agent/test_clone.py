@@ -3,6 +3,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 from git import GitCommandError, InvalidGitRepositoryError
 
+from osa_tool.config.settings import CloneSettings
+
 
 @patch("osa_tool.github_agent.github_agent.Repo")
 @patch("osa_tool.github_agent.github_agent.logger")
@@ -47,6 +49,7 @@ def test_clone_repository_clone_new_repo(mock_exists, mock_logger, mock_repo, gi
         to_path=github_agent.clone_dir,
         branch=github_agent.base_branch,
         single_branch=True,
+        depth=1,
     )
     mock_logger.info.assert_any_call(
         f"Cloning the {github_agent.base_branch} branch from {github_agent.repo_url} into directory {github_agent.clone_dir}..."
@@ -66,3 +69,39 @@ def test_clone_repository_clone_error(mock_exists, mock_logger, mock_repo, githu
         github_agent.clone_repository()
     # Assert
     mock_logger.error.assert_called_once_with("Cloning failed: GitCommandError('Cloning failed', 'git')")
+
+
+@patch("osa_tool.github_agent.github_agent.Repo")
+@patch("osa_tool.github_agent.github_agent.os.path.exists")
+def test_clone_repository_partial_sparse_clone(mock_exists, mock_repo, github_agent):
+    # Arrange
+    github_agent.repo = None
+    github_agent.clone_settings = CloneSettings(depth=0, filter="blob:none", sparse_extensions=["py", ".md"])
+    mock_exists.return_value = False
+    # Act
+    github_agent.clone_repository()
+    # Assert
+    kwargs = mock_repo.clone_from.call_args.kwargs
+    assert kwargs["filter"] == "blob:none"
+    assert kwargs["no_checkout"] is True
+    assert "depth" not in kwargs
+    repo = mock_repo.clone_from.return_value
+    repo.git.sparse_checkout.assert_called_once_with("set", "--no-cone", "/*", "!/*/", "/.github/", "*.py", "*.md")
+    repo.git.checkout.assert_called_once_with(github_agent.base_branch)
+
+
+@patch("osa_tool.github_agent.github_agent.Repo")
+def test_clone_repository_from_mirror(mock_repo, github_agent, tmp_path):
+    # Arrange
+    github_agent.repo = None
+    github_agent.clone_dir = str(tmp_path / "testrepo")
+    github_agent.mirror_dir = str(tmp_path / "mirrors")
+    # Act
+    github_agent.clone_repository()
+    # Assert
+    mirror_path = tmp_path / "mirrors" / "testuser__testrepo.git"
+    mock_repo.init.assert_called_once_with(str(mirror_path), bare=True, mkdir=True)
+    fetch_args = mock_repo.init.return_value.git.fetch.call_args.args
+    assert fetch_args[0] == github_agent._get_auth_url()
+    assert mock_repo.clone_from.call_args.kwargs["url"] == mirror_path.as_uri()
+    mock_repo.clone_from.return_value.remote.return_value.set_url.assert_called_once_with(github_agent._get_auth_url())
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import patch
 
 
-@patch("osa_tool.github_agent.github_agent.requests.post")
+@patch("osa_tool.github_agent.github_agent.http_client.post")
 def test_create_fork_success(mock_post, github_agent):
     # Arrange
     github_agent.token = "test_token"
@@ -14,7 +14,7 @@ def test_create_fork_success(mock_post, github_agent):
     assert github_agent.fork_url == "https://github.com/testuser/testrepo-fork"
 
 
-@patch("osa_tool.github_agent.github_agent.requests.post")
+@patch("osa_tool.github_agent.github_agent.http_client.post")
 def test_create_fork_error(mock_post, github_agent):
     # Arrange
     github_agent.token = "test_token"
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import patch
 
 
-@patch("osa_tool.github_agent.github_agent.requests.post")
+@patch("osa_tool.github_agent.github_agent.http_client.post")
 @patch("osa_tool.github_agent.github_agent.logger")
 def test_create_pull_request_success(mock_logger, mock_post, github_agent):
     # Arrange
@@ -30,7 +30,7 @@ def test_create_pull_request_success(mock_logger, mock_post, github_agent):
     )
 
 
-@patch("osa_tool.github_agent.github_agent.requests.post")
+@patch("osa_tool.github_agent.github_agent.http_client.post")
 @patch("osa_tool.github_agent.github_agent.logger")
 def test_create_pull_request_error(mock_logger, mock_post, github_agent):
     # Arrange
@@ -43,7 +43,7 @@ def test_create_pull_request_error(mock_logger, mock_post, github_agent):
     mock_logger.error.assert_called_once_with("Failed to create pull request: 400 - Bad Request")
 
 
-@patch("osa_tool.github_agent.github_agent.requests.post")
+@patch("osa_tool.github_agent.github_agent.http_client.post")
 @patch("osa_tool.github_agent.github_agent.logger")
 def test_create_pull_request_already_exists(mock_logger, mock_post, github_agent):
     # Arrange
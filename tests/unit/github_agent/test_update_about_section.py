@@ -23,7 +23,7 @@ def about_content():
 
 
 def test_update_about_section_success(github_agent, about_content):
-    with patch("requests.patch") as mock_patch, patch("requests.put") as mock_put:
+    with patch("osa_tool.http_client.patch") as mock_patch, patch("osa_tool.http_client.put") as mock_put:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_patch.return_value = mock_response
@@ -48,7 +48,7 @@ def test_update_about_section_no_fork(github_agent, about_content):
 
 
 def test_update_about_section_api_failure(github_agent, about_content):
-    with patch("requests.patch") as mock_patch, patch("requests.put") as mock_put:
+    with patch("osa_tool.http_client.patch") as mock_patch, patch("osa_tool.http_client.put") as mock_put:
         mock_response = Mock()
         mock_response.status_code = 400
         mock_patch.return_value = mock_response
@@ -61,7 +61,7 @@ def test_update_about_section_api_failure(github_agent, about_content):
 
 
 def test_update_about_section_content_format(github_agent, about_content):
-    with patch("requests.patch") as mock_patch, patch("requests.put") as mock_put:
+    with patch("osa_tool.http_client.patch") as mock_patch, patch("osa_tool.http_client.put") as mock_put:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_patch.return_value = mock_response
@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osa_tool.config.settings import CacheSettings
+from osa_tool.models.cache import ResponseCache, get_response_cache
+from osa_tool.models.models import CachedModelHandler, ModelHandler
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path / "cache.sqlite"), max_size_mb=1, ttl_hours=1)
+
+
+@pytest.fixture
+def mock_config():
+    config = MagicMock()
+    config.llm.model = "gpt-test"
+    config.llm.temperature = 0.05
+    config.llm.tokens = 100
+    return config
+
+
+def test_make_key_depends_on_request_content():
+    messages = [{"role": "user", "content": "hello"}]
+    # Assert
+    assert ResponseCache.make_key("m", 0.1, messages) == ResponseCache.make_key("m", 0.1, list(messages))
+    assert ResponseCache.make_key("m", 0.1, messages) != ResponseCache.make_key("m", 0.2, messages)
+    assert ResponseCache.make_key("m", 0.1, messages) != ResponseCache.make_key("other", 0.1, messages)
+
+
+def test_get_put_counts_hits_and_misses(cache):
+    # Act
+    assert cache.get("key") is None
+    cache.put("key", "response")
+    # Assert
+    assert cache.get("key") == "response"
+    assert cache.summary() == {"hits": 1, "misses": 1, "lookups": 2, "hit_ratio": 0.5}
+
+
+def test_expired_entry_is_a_miss(cache):
+    # Arrange
+    with patch("osa_tool.models.cache.time.time", return_value=1000.0):
+        cache.put("key", "response")
+    # Act
+    with patch("osa_tool.models.cache.time.time", return_value=1000.0 + 2 * 3600):
+        result = cache.get("key")
+    # Assert
+    assert result is None
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    # Arrange
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_size_mb=1, ttl_hours=0)
+    chunk = "x" * (400 * 1024)
+    with patch("osa_tool.models.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+        cache.put("first", chunk)
+        cache.put("second", chunk)
+        cache.get("first")
+        cache.put("third", chunk)
+    # Assert
+    assert cache.get("first") == chunk
+    assert cache.get("second") is None
+    assert cache.get("third") == chunk
+
+
+def test_get_response_cache_shared_and_disabled(tmp_path):
+    # Arrange
+    settings = CacheSettings(directory=str(tmp_path))
+    # Assert
+    assert get_response_cache(settings) is get_response_cache(settings)
+    assert get_response_cache(CacheSettings(enabled=False)) is None
+
+
+def test_cached_handler_sends_identical_prompt_once(cache, mock_config):
+    # Arrange
+    handler = MagicMock(ModelHandler)
+    handler.send_request.return_value = "generated"
+    cached_handler = CachedModelHandler(handler, cache, mock_config)
+    # Act
+    first = cached_handler.send_request("prompt")
+    second = cached_handler.send_request("prompt")
+    # Assert
+    assert first == second == "generated"
+    handler.send_request.assert_called_once_with("prompt")
+
+
+def test_cached_handler_stores_stream_closed_early(cache, mock_config):
+    # Arrange
+    handler = MagicMock(ModelHandler)
+    handler.send_request_stream.return_value = (chunk for chunk in ["{}", " and more"])
+    cached_handler = CachedModelHandler(handler, cache, mock_config)
+    # Act
+    stream = cached_handler.send_request_stream("prompt")
+    first_chunk = next(stream)
+    stream.close()
+    second = list(cached_handler.send_request_stream("prompt"))
+    # Assert
+    assert first_chunk == "{}"
+    assert second == ["{}"]
+    handler.send_request_stream.assert_called_once_with("prompt")
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osa_tool.config.settings import ConfigLoader
+from osa_tool.models.models import ModelHandlerFactory
+
+
+@pytest.fixture
+def config():
+    config = ConfigLoader().config
+    config.cache.enabled = False
+    return config
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    ModelHandlerFactory._handlers.clear()
+    yield
+    ModelHandlerFactory._handlers.clear()
+
+
+@patch.object(ModelHandlerFactory, "create_handler", side_effect=lambda config: MagicMock())
+def test_handlers_are_pooled_by_model_settings(mock_create, config):
+    # Act
+    first = ModelHandlerFactory.get_handler(config)
+    second = ModelHandlerFactory.get_handler(config.model_copy(deep=True))
+    config.llm.model = "other-model"
+    third = ModelHandlerFactory.get_handler(config)
+    # Assert
+    assert first is second
+    assert third is not first
+    assert mock_create.call_count == 2
+
+
+@patch.object(ModelHandlerFactory, "create_handler", side_effect=lambda config: MagicMock())
+def test_build_wraps_pooled_handler(mock_create, config):
+    # Act
+    first = ModelHandlerFactory.build(config)
+    second = ModelHandlerFactory.build(config)
+    # Assert
+    assert first.handler is second.handler
+    mock_create.assert_called_once()
@@ -0,0 +1,81 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osa_tool.config.settings import ApiSettings
+from osa_tool.models.models import ModelHandler, RateLimitedModelHandler
+from osa_tool.models.rate_limiter import RateLimiter, TokenBucket, is_rate_limit_error
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_token_bucket_waits_for_refill():
+    # Arrange
+    bucket = TokenBucket(per_minute=60)
+    # Act
+    with patch("osa_tool.models.rate_limiter.time.sleep") as mock_sleep:
+        first_wait = bucket.acquire(60)
+        second_wait = bucket.acquire(3)
+    # Assert
+    assert first_wait == 0
+    assert second_wait == pytest.approx(3, abs=0.1)
+    mock_sleep.assert_called_once()
+
+
+def test_concurrency_is_bounded():
+    # Arrange
+    limiter = RateLimiter(ApiSettings(rate_limit=2))
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def send(prompt):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return prompt
+
+    # Act
+    threads = [threading.Thread(target=limiter.call, args=(send, "p")) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Assert
+    assert peak[0] == 2
+    assert limiter.summary()["requests"] == 6
+
+
+def test_rate_limited_request_is_retried_after_backoff():
+    # Arrange
+    limiter = RateLimiter(ApiSettings(max_retries=2, backoff_factor=0))
+    handler = MagicMock(ModelHandler)
+    error = RuntimeError("request failed")
+    error.__cause__ = RateLimitError()
+    handler.send_request.side_effect = [error, "response"]
+    limited_handler = RateLimitedModelHandler(handler, limiter)
+    # Act
+    response = limited_handler.send_request("prompt")
+    # Assert
+    assert response == "response"
+    assert handler.send_request.call_count == 2
+    assert limiter.summary()["throttled"] == 1
+
+
+def test_other_errors_are_not_retried():
+    # Arrange
+    limiter = RateLimiter(ApiSettings())
+    handler = MagicMock(ModelHandler)
+    handler.send_request.side_effect = ValueError("bad request")
+    # Act
+    with pytest.raises(ValueError):
+        RateLimitedModelHandler(handler, limiter).send_request("prompt")
+    # Assert
+    assert handler.send_request.call_count == 1
+    assert not is_rate_limit_error(ValueError("bad request"))
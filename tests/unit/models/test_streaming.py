@@ -0,0 +1,43 @@
+import pytest
+
+from osa_tool.models.streaming import collect_stream, is_docstring_complete, is_json_complete, json_object_end
+
+
+def make_stream(chunks: list[str], consumed: list[str]):
+    for chunk in chunks:
+        consumed.append(chunk)
+        yield chunk
+
+
+def test_collect_stream_stops_once_complete():
+    # Arrange
+    consumed = []
+    stream = make_stream(['Here: """Summary.', '\n"""', " trailing", " text"], consumed)
+    # Act
+    result = collect_stream(stream, is_docstring_complete)
+    # Assert
+    assert result == 'Here: """Summary.\n"""'
+    assert len(consumed) == 2
+    assert stream.gi_frame is None
+
+
+def test_collect_stream_reads_everything_without_predicate():
+    # Act
+    result = collect_stream(iter(["a", "b", "c"]))
+    # Assert
+    assert result == "abc"
+
+
+@pytest.mark.parametrize(
+    "text, expected_end",
+    [
+        ('```json\n{"a": 1} tail', 16),
+        ('{"a": "}", "b": {"c": "\\""}}', 28),
+        ('{"a": {"b": 1}', -1),
+        ("no json here", -1),
+    ],
+)
+def test_json_object_end(text, expected_end):
+    # Assert
+    assert json_object_end(text) == expected_end
+    assert is_json_complete(text) is (expected_end != -1)
@@ -0,0 +1,56 @@
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from osa_tool.batch import collect_repositories, process_repository, run_batch
+
+
+def test_collect_repositories_merges_file_and_arguments(tmp_path):
+    # Arrange
+    repositories_file = tmp_path / "repos.txt"
+    repositories_file.write_text(
+        "# comment\nhttps://github.com/a/b\n\nhttps://github.com/c/d/\n",
+        encoding="utf-8",
+    )
+    # Act
+    result = collect_repositories(["https://github.com/a/b"], str(repositories_file))
+    # Assert
+    assert result == ["https://github.com/a/b", "https://github.com/c/d"]
+
+
+@patch("osa_tool.batch.log_cache_summary")
+@patch("osa_tool.batch.run_pipeline")
+def test_process_repository_runs_in_own_directory(mock_run_pipeline, mock_summary, tmp_path):
+    # Arrange
+    args = argparse.Namespace(repository=None, readme=True)
+    mock_run_pipeline.return_value = {"readme": True, "about": False, "api": "openai"}
+    # Act
+    result = process_repository("https://github.com/a/b", args, [], str(tmp_path), str(tmp_path / "cache"))
+    # Assert
+    repo_args = mock_run_pipeline.call_args.args[0]
+    assert repo_args.repository == "https://github.com/a/b"
+    assert args.repository is None
+    assert mock_run_pipeline.call_args.kwargs["interactive"] is False
+    assert (tmp_path / "a__b").is_dir()
+    assert result["status"] == "success"
+    assert result["tasks"] == ["readme"]
+
+
+@patch("osa_tool.batch.log_cache_summary")
+@patch("osa_tool.batch.run_pipeline")
+@patch("osa_tool.batch.ProcessPoolExecutor", ThreadPoolExecutor)
+def test_run_batch_isolates_failures(mock_run_pipeline, mock_summary, tmp_path):
+    # Arrange
+    def fake_pipeline(args, workflow_keys, interactive, cache_directory):
+        if args.repository.endswith("broken"):
+            raise RuntimeError("clone failed")
+        return {"readme": True}
+
+    mock_run_pipeline.side_effect = fake_pipeline
+    repositories = ["https://github.com/a/broken", "https://github.com/a/ok"]
+    # Act
+    summary = run_batch(repositories, argparse.Namespace(repository=None), [], 1, str(tmp_path))
+    # Assert
+    assert [result["repository"] for result in summary] == repositories
+    assert [result["status"] for result in summary] == ["failed", "success"]
+    assert "clone failed" in summary[0]["error"]
@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from osa_tool.config.settings import HttpSettings
+from osa_tool.http_client import HttpClient
+
+
+def make_response(status_code: int, headers: dict | None = None, text: str = "") -> MagicMock:
+    response = MagicMock(requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = text
+    return response
+
+
+@pytest.fixture
+def client():
+    return HttpClient(HttpSettings(max_retries=2, backoff_factor=0.5, max_backoff=10, timeout=5))
+
+
+def test_request_sets_default_timeout(client):
+    # Arrange
+    with patch.object(client.session, "request", return_value=make_response(200)) as mock_request:
+        # Act
+        client.get("https://example.com")
+    # Assert
+    assert mock_request.call_args.kwargs["timeout"] == 5
+
+
+@patch("osa_tool.http_client.time.sleep")
+def test_retry_honors_retry_after(mock_sleep, client):
+    # Arrange
+    responses = [make_response(429, {"Retry-After": "3"}), make_response(200)]
+    with patch.object(client.session, "request", side_effect=responses):
+        # Act
+        response = client.get("https://api.github.com/repos/a/b")
+    # Assert
+    assert response.status_code == 200
+    mock_sleep.assert_called_once_with(3.0)
+
+
+@patch("osa_tool.http_client.time.time", return_value=1000.0)
+@patch("osa_tool.http_client.time.sleep")
+def test_retry_honors_rate_limit_reset(mock_sleep, mock_time, client):
+    # Arrange
+    limited = make_response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1004"})
+    with patch.object(client.session, "request", side_effect=[limited, make_response(200)]):
+        # Act
+        client.post("https://api.github.com/repos/a/b/forks")
+    # Assert
+    mock_sleep.assert_called_once_with(5.0)
+
+
+@patch("osa_tool.http_client.time.sleep")
+def test_post_is_not_retried_on_server_error(mock_sleep, client):
+    # Arrange
+    with patch.object(client.session, "request", return_value=make_response(502)) as mock_request:
+        # Act
+        response = client.post("https://api.github.com/repos/a/b/pulls")
+    # Assert
+    assert response.status_code == 502
+    assert mock_request.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("osa_tool.http_client.time.sleep")
+def test_get_gives_up_after_max_retries(mock_sleep, client):
+    # Arrange
+    with patch.object(client.session, "request", side_effect=requests.ConnectionError("down")) as mock_request:
+        # Assert
+        with pytest.raises(requests.ConnectionError):
+            client.get("https://pypi.org/pypi/osa/json")
+    assert mock_request.call_count == 3
+
+
+def test_etag_revalidation_returns_cached_response(client):
+    # Arrange
+    first = make_response(200, {"ETag": '"abc"'})
+    with patch.object(client.session, "request", side_effect=[first, make_response(304)]) as mock_request:
+        # Act
+        client.get("https://api.github.com/repos/a/b", headers={"Accept": "json"})
+        second = client.get("https://api.github.com/repos/a/b", headers={"Accept": "json"})
+    # Assert
+    assert second is first
+    assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
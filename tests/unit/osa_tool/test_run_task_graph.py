@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+
+from osa_tool.utils import run_task_graph
+
+
+def test_run_task_graph_passes_dependency_results():
+    # Act
+    results = run_task_graph(
+        {
+            "a": (lambda: 2, []),
+            "b": (lambda a: a * 3, ["a"]),
+            "c": (lambda a, b: a + b, ["a", "b"]),
+        }
+    )
+    # Assert
+    assert results == {"a": 2, "b": 6, "c": 8}
+
+
+def test_run_task_graph_runs_independent_tasks_concurrently():
+    # Arrange
+    barrier = threading.Barrier(2, timeout=5)
+    # Act
+    results = run_task_graph({"first": (lambda: barrier.wait() is not None, []), "second": (barrier.wait, [])})
+    # Assert
+    assert set(results) == {"first", "second"}
+
+
+def test_run_task_graph_propagates_errors():
+    # Arrange
+    def fail():
+        raise RuntimeError("boom")
+
+    # Assert
+    with pytest.raises(RuntimeError, match="boom"):
+        run_task_graph({"fail": (fail, []), "after": (lambda value: value, ["fail"])})
+
+
+def test_run_task_graph_rejects_unknown_and_cyclic_dependencies():
+    # Assert
+    with pytest.raises(ValueError):
+        run_task_graph({"a": (lambda missing: missing, ["missing"])})
+    with pytest.raises(ValueError):
+        run_task_graph({"a": (lambda b: b, ["b"]), "b": (lambda a: a, ["a"])})
@@ -0,0 +1,144 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osa_tool.config.settings import ConfigLoader
+from osa_tool.osatreesitter.docgen import DocGen
+from osa_tool.osatreesitter.osa_treesitter import OSA_TreeSitter
+
+SOURCE = """class Greeter:
+    def hello(self):
+        return "hello"
+
+    def bye(self):
+        return "bye"
+
+
+def standalone():
+    return 1
+"""
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    file = tmp_path / "module.py"
+    file.write_text(SOURCE, encoding="utf-8")
+    return file
+
+
+@pytest.fixture
+def docgen(tmp_path):
+    config_loader = ConfigLoader()
+    config_loader.config.docstrings.max_workers = 4
+    config_loader.config.docstrings.manifest = str(tmp_path / "manifest.json")
+    with patch("osa_tool.osatreesitter.docgen.ModelHandlerFactory.build") as mock_build:
+        mock_build.return_value = MagicMock()
+        return DocGen(config_loader)
+
+
+def fake_response(prompt: str) -> str:
+    for name in ("hello", "bye", "standalone"):
+        if f"Method Name: {name}" in prompt:
+            return f'"""Docstring of {name}."""'
+    return '"""Docstring of Greeter."""'
+
+
+def test_process_python_file_inserts_all_docstrings(docgen, source_file):
+    # Arrange
+    docgen.model_handler.send_request.side_effect = fake_response
+    ts = OSA_TreeSitter(str(source_file.parent))
+    parsed = ts.analyze_directory(ts.cwd)
+    # Act
+    docgen.process_python_file(parsed)
+    # Assert
+    result = source_file.read_text(encoding="utf-8")
+    assert result.index("Docstring of Greeter.") < result.index("Docstring of hello.")
+    assert result.index("Docstring of hello.") < result.index("Docstring of bye.")
+    assert result.index("Docstring of bye.") < result.index("Docstring of standalone.")
+
+
+def test_class_docstring_requested_after_methods(docgen, source_file):
+    # Arrange
+    calls = []
+    lock = threading.Lock()
+
+    def record(prompt: str) -> str:
+        response = fake_response(prompt)
+        with lock:
+            calls.append(response)
+        return response
+
+    docgen.model_handler.send_request.side_effect = record
+    ts = OSA_TreeSitter(str(source_file.parent))
+    parsed = ts.analyze_directory(ts.cwd)
+    # Act
+    docgen.process_python_file(parsed)
+    # Assert
+    assert len(calls) == 4
+    assert calls[-1] == '"""Docstring of Greeter."""'
+    assert "Docstring of hello." in parsed[str(source_file)]["structure"][0]["methods"][0]["docstring"]
+
+
+def test_unchanged_file_is_skipped_on_next_run(docgen, source_file):
+    # Arrange
+    docgen.model_handler.send_request.side_effect = fake_response
+    ts = OSA_TreeSitter(str(source_file.parent))
+    docgen.process_python_file(ts.analyze_directory(ts.cwd))
+    docgen.model_handler.send_request.reset_mock()
+    # Act
+    with patch.object(DocGen, "format_with_black") as mock_black:
+        docgen.process_python_file(ts.analyze_directory(ts.cwd))
+    # Assert
+    docgen.model_handler.send_request.assert_not_called()
+    mock_black.assert_not_called()
+
+
+def test_only_changed_functions_are_requested(docgen, source_file):
+    # Arrange
+    docgen.model_handler.send_request.side_effect = fake_response
+    ts = OSA_TreeSitter(str(source_file.parent))
+    docgen.process_python_file(ts.analyze_directory(ts.cwd))
+    docgen.model_handler.send_request.reset_mock()
+    source_file.write_text(SOURCE.replace("return 1", "return 2"), encoding="utf-8")
+    # Act
+    docgen.process_python_file(ts.analyze_directory(ts.cwd))
+    # Assert
+    prompts = [call.args[0] for call in docgen.model_handler.send_request.call_args_list]
+    assert len(prompts) == 2
+    assert "Method Name: standalone" in prompts[0]
+    assert "Docstring of hello." in source_file.read_text(encoding="utf-8")
+
+
+def test_streamed_docstring_request_stops_at_closing_quotes(docgen, source_file):
+    # Arrange
+    docgen.config.llm.stream = True
+    docgen.model_handler.send_request_stream.side_effect = lambda prompt: iter(
+        [fake_response(prompt)[:-3], '"""', "\nThis docstring follows the Google style."]
+    )
+    ts = OSA_TreeSitter(str(source_file.parent))
+    # Act
+    docgen.process_python_file(ts.analyze_directory(ts.cwd))
+    # Assert
+    docgen.model_handler.send_request.assert_not_called()
+    result = source_file.read_text(encoding="utf-8")
+    assert "Docstring of standalone." in result
+    assert "Google style" not in result
+
+
+def test_process_python_file_accepts_structure_stream(docgen, tmp_path):
+    # Arrange
+    (tmp_path / "helpers.py").write_text('def tool():\n    return "tool"\n', encoding="utf-8")
+    (tmp_path / "module.py").write_text(
+        "from helpers import tool\n\n\ndef main():\n    return tool()\n", encoding="utf-8"
+    )
+    prompts = []
+    docgen.model_handler.send_request.side_effect = lambda prompt: prompts.append(prompt) or '"""Docstring."""'
+    ts = OSA_TreeSitter(str(tmp_path), workers=1)
+    # Act
+    docgen.process_python_file(ts.iter_structures(ts.cwd))
+    # Assert
+    assert len(prompts) == 2
+    main_prompt = next(prompt for prompt in prompts if "Method Name: main" in prompt)
+    assert "# Function tool" in main_prompt
+    assert '"""Docstring."""' in (tmp_path / "module.py").read_text(encoding="utf-8")
@@ -0,0 +1,74 @@
+from osa_tool.osatreesitter.docstring_inserter import DocstringInserter
+
+SOURCE = '''import os
+
+
+class First:
+    def run(self, value: dict[str, tuple[int, int]] = {"a": (1, 2)}) -> "First":
+        return self
+
+    @property
+    def name(self):
+        """Existing."""
+        return "first"
+
+
+class Second:
+    # comment
+    def run(self):
+        return 2
+
+
+def helper():
+    return "ключ"
+
+
+def helper():
+    return 1
+
+
+def inline(): return 0
+'''
+
+
+def test_method_docstring_targets_the_right_class():
+    # Arrange
+    inserter = DocstringInserter(SOURCE)
+    # Act
+    added = inserter.add_function_docstring('"""Runs second."""', "run", class_name="Second")
+    result = inserter.apply()
+    # Assert
+    assert added
+    assert 'def run(self):\n        """Runs second."""\n        return 2' in result
+    assert result.count('"""Runs second."""') == 1
+
+
+def test_all_insertions_are_applied_in_one_pass():
+    # Arrange
+    inserter = DocstringInserter(SOURCE)
+    # Act
+    inserter.add_function_docstring('"""Runs first."""', "run", class_name="First")
+    inserter.add_class_docstring('"""First class."""', "First")
+    inserter.add_function_docstring('"""Second helper."""', "helper", occurrence=1)
+    inserter.add_function_docstring('"""First helper."""', "helper")
+    result = inserter.apply()
+    # Assert
+    assert 'class First:\n    """First class."""\n    def run' in result
+    assert '-> "First":\n        """Runs first."""\n        return self' in result
+    assert 'def helper():\n    """First helper."""\n    return "ключ"' in result
+    assert 'def helper():\n    """Second helper."""\n    return 1' in result
+    compile(result, "module.py", "exec")
+
+
+def test_existing_and_inline_bodies_are_left_untouched():
+    # Arrange
+    inserter = DocstringInserter(SOURCE)
+    # Act
+    added = [
+        inserter.add_function_docstring('"""New."""', "name", class_name="First"),
+        inserter.add_function_docstring('"""New."""', "inline"),
+        inserter.add_function_docstring('"""New."""', "missing"),
+    ]
+    # Assert
+    assert added == [False, False, False]
+    assert inserter.apply() == SOURCE
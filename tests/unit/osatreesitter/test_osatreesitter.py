@@ -221,3 +221,59 @@ def test_resolve_import_class_method_chain(osa_tree_sitter):
 
 def test_resolve_import_unknown(osa_tree_sitter):
     assert osa_tree_sitter._resolve_import("foo.bar", "foo", {}) == {}
+
+
+def test_analyze_directory_parallel_matches_serial(tmp_path):
+    # Arrange
+    for index in range(4):
+        (tmp_path / f"module_{index}.py").write_text(
+            f"import os\n\n\nclass Item{index}:\n    def run(self):\n        return {index}\n\n\ndef helper_{index}():\n    pass\n"
+        )
+    serial = OSA_TreeSitter(str(tmp_path), workers=1)
+    parallel = OSA_TreeSitter(str(tmp_path), workers=2, parallel_threshold=2)
+    # Act
+    serial_result = serial.analyze_directory(str(tmp_path))
+    parallel_result = parallel.analyze_directory(str(tmp_path))
+    # Assert
+    assert list(parallel_result) == list(serial_result)
+    assert parallel_result == serial_result
+
+
+def test_resolve_import_path_relative_and_package(tmp_path):
+    # Arrange
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "core.py").write_text("class Engine:\n    pass\n")
+    (package / "utils.py").write_text("")
+    ts = OSA_TreeSitter(str(tmp_path))
+    importing_file = str(package / "utils.py")
+    # Act
+    relative = ts._resolve_import_path("from .core import Engine", importing_file)
+    submodule = ts._resolve_import_path("from pkg import core as c")
+    package_import = ts._resolve_import_path("import pkg")
+    # Assert
+    assert relative["Engine"] == {"module": ".core", "class": "Engine", "path": str(package / "core.py")}
+    assert submodule["c"] == {"module": "pkg.core", "path": str(package / "core.py")}
+    assert package_import["pkg"]["path"] == str(package / "__init__.py")
+
+
+def test_iter_structures_parses_files_as_they_are_consumed(tmp_path):
+    # Arrange
+    for index in range(3):
+        (tmp_path / f"module_{index}.py").write_text(f"def function_{index}():\n    return {index}\n")
+    ts = OSA_TreeSitter(str(tmp_path), workers=1)
+    # Act
+    with patch.object(
+        OSA_TreeSitter, "extract_structure", autospec=True, side_effect=OSA_TreeSitter.extract_structure
+    ) as extract:
+        stream = ts.iter_structures(str(tmp_path))
+        files = list(stream.files)
+        first_filename, first_structure = next(stream)
+        parsed_after_first = extract.call_count
+        rest = list(stream)
+    # Assert
+    assert first_filename == files[0]
+    assert parsed_after_first == 1
+    assert [filename for filename, _ in rest] == files[1:]
+    assert first_structure["structure"][0]["details"]["method_name"].startswith("function_")
@@ -0,0 +1,75 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from osa_tool.osatreesitter.osa_treesitter import OSA_TreeSitter
+
+
+@pytest.fixture
+def project(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "app.py").write_text("from helpers import tool\n\n\ndef main():\n    tool()\n")
+    (source / "other.py").write_text("def other():\n    return 1\n")
+    return source, str(tmp_path / "cache" / "structures.sqlite")
+
+
+def analyze(source, cache_path):
+    ts = OSA_TreeSitter(str(source), workers=1, cache_path=cache_path)
+    with patch.object(
+        OSA_TreeSitter, "_parse_source_code", autospec=True, side_effect=OSA_TreeSitter._parse_source_code
+    ) as parse:
+        result = ts.analyze_directory(str(source))
+    parsed_files = sorted(os.path.basename(call.args[1]) for call in parse.call_args_list)
+    return result, parsed_files
+
+
+def test_parse_cache_reuses_unchanged_files(project):
+    # Arrange
+    source, cache_path = project
+    first_result, first_parsed = analyze(source, cache_path)
+    # Act
+    second_result, second_parsed = analyze(source, cache_path)
+    # Assert
+    assert first_parsed == ["app.py", "other.py"]
+    assert second_parsed == []
+    assert second_result == first_result
+    assert list(second_result) == list(first_result)
+
+
+def test_parse_cache_reparses_changed_files(project):
+    # Arrange
+    source, cache_path = project
+    analyze(source, cache_path)
+    (source / "other.py").write_text("def other():\n    return 2\n")
+    # Act
+    result, parsed = analyze(source, cache_path)
+    # Assert
+    assert parsed == ["other.py"]
+    assert "return 2" in result[str(source / "other.py")]["structure"][0]["details"]["source_code"]
+
+
+def test_parse_cache_reparses_importers_of_added_modules(project):
+    # Arrange
+    source, cache_path = project
+    first_result, _ = analyze(source, cache_path)
+    (source / "helpers.py").write_text("def tool():\n    pass\n")
+    # Act
+    result, parsed = analyze(source, cache_path)
+    # Assert
+    assert first_result[str(source / "app.py")]["imports"] == {}
+    assert parsed == ["app.py", "helpers.py"]
+    assert result[str(source / "app.py")]["imports"]["tool"]["path"] == str(source / "helpers.py")
+
+
+def test_import_resolution_uses_file_index(tmp_path):
+    # Arrange
+    ts = OSA_TreeSitter(str(tmp_path), file_index={str(tmp_path / "utils.py")})
+    # Act
+    with patch("os.path.exists", side_effect=AssertionError("file system probed")):
+        found = ts._resolve_import_path("from utils import Tool")
+        missing = ts._resolve_import_path("from missing import Tool")
+    # Assert
+    assert found["Tool"]["path"] == str(tmp_path / "utils.py")
+    assert missing == {}
@@ -0,0 +1,73 @@
+import json
+import pickle
+
+import pytest
+
+from osa_tool.osatreesitter.osa_treesitter import OSA_TreeSitter
+from osa_tool.osatreesitter.structures import FunctionStructure, dump_structure, load_structure
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(
+        "class Greeter:\n"
+        "    def greet(self, name: str) -> str:\n"
+        '        return f"Привет, {name}"\n\n\n'
+        "def shout(text):\n"
+        "    return text.upper()\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def structure(source_file):
+    return OSA_TreeSitter(str(source_file.parent)).extract_structure(str(source_file))
+
+
+def test_records_behave_like_dictionaries(structure):
+    # Arrange
+    cls, function = structure["structure"]
+    # Act
+    method = cls["methods"][0]
+    # Assert
+    assert cls["type"] == "class" and function["type"] == "function"
+    assert method["source_code"].endswith('return f"Привет, {name}"')
+    assert method["return_type"] == "str"
+    assert function["details"]["source_code"] == "def shout(text):\n    return text.upper()"
+    assert dict(function)["details"] is function["details"]
+    assert set(method) >= {"method_name", "docstring", "source_code", "method_calls"}
+
+
+def test_records_allow_assigning_fields_only(structure):
+    # Arrange
+    method = structure["structure"][0]["methods"][0]
+    # Act
+    method["docstring"] = '"""Greets."""'
+    # Assert
+    assert method.docstring == '"""Greets."""'
+    with pytest.raises(KeyError):
+        method["source_code"] = "def greet(): pass"
+
+
+def test_pickled_records_read_source_lazily(structure):
+    # Arrange
+    method = structure["structure"][0]["methods"][0]
+    # Act
+    restored = pickle.loads(pickle.dumps(method))
+    # Assert
+    assert isinstance(restored, FunctionStructure)
+    assert restored.source._data is None
+    assert restored == method
+    assert restored.source._data is not None
+
+
+def test_dump_and_load_structure_round_trip(structure):
+    # Arrange
+    data = json.loads(json.dumps(dump_structure(structure)))
+    # Act
+    restored = load_structure(data, structure["structure"][0].methods[0].source)
+    # Assert
+    assert "source_code" not in json.dumps(data)
+    assert restored == structure
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from osa_tool.osatreesitter.osa_treesitter import OSA_TreeSitter
+from osa_tool.osatreesitter.symbol_index import SymbolIndex
+
+
+@pytest.fixture
+def project(tmp_path):
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("from .core import Engine as Motor\n")
+    (package / "core.py").write_text(
+        "class Engine:\n"
+        "    def __init__(self):\n"
+        "        self.speed = 0\n\n"
+        "    def run(self):\n"
+        '        """Runs the engine."""\n'
+        "        return self.speed\n\n\n"
+        "def helper():\n"
+        "    return 1\n"
+    )
+    (tmp_path / "app.py").write_text(
+        "from pkg import Motor, core\n\n\n"
+        "def main():\n"
+        "    engine = Motor()\n"
+        "    engine.run()\n"
+        "    core.helper()\n"
+    )
+    ts = OSA_TreeSitter(str(tmp_path), workers=1)
+    return tmp_path, ts.analyze_directory(ts.cwd)
+
+
+def test_symbol_index_names_modules_and_packages(project):
+    # Arrange
+    root, parsed = project
+    # Act
+    index = SymbolIndex(parsed, str(root))
+    # Assert
+    assert index.module_of(str(root / "pkg" / "__init__.py")) == "pkg"
+    assert index.module_of(str(root / "pkg" / "core.py")) == "pkg.core"
+    assert index.lookup("pkg.core.Engine.run").docstring == '"""Runs the engine."""'
+    assert index.lookup("pkg.core.helper").kind == "function"
+
+
+def test_symbol_index_follows_re_exports(project):
+    # Arrange
+    root, parsed = project
+    index = SymbolIndex(parsed, str(root))
+    # Act
+    symbol = index.lookup("app.Motor.run")
+    # Assert
+    assert symbol.qualified_name == "pkg.core.Engine.run"
+    assert symbol.path.endswith("core.py")
+    source = (root / "pkg" / "core.py").read_bytes()
+    assert source[symbol.start_byte : symbol.end_byte].decode("utf-8") == symbol.source_code
+
+
+def test_symbol_index_resolves_calls(project):
+    # Arrange
+    root, parsed = project
+    index = SymbolIndex(parsed, str(root))
+    main = parsed[str(root / "app.py")]["structure"][0]["details"]
+    # Act
+    resolved = [index.resolve_call(call) for call in main["method_calls"]]
+    # Assert
+    assert [symbol.qualified_name for symbol in resolved] == [
+        "pkg.core.Engine.__init__",
+        "pkg.core.Engine.run",
+        "pkg.core.helper",
+    ]
+
+
+def test_symbol_index_ignores_unknown_and_cyclic_names():
+    # Arrange
+    parsed = {
+        "a.py": {"structure": [], "imports": {"x": {"module": "b", "class": "y", "path": "b.py"}}},
+        "b.py": {"structure": [], "imports": {"y": {"module": "a", "class": "x", "path": "a.py"}}},
+    }
+    index = SymbolIndex(parsed, "")
+    # Act / Assert
+    assert index.lookup("a.x") is None
+    assert index.lookup("a.missing") is None
+    assert index.resolve_call({"class": "x", "function": None, "path": "elsewhere.py"}) is None
+
+
+def test_symbol_index_lookup_waits_for_expected_files(project):
+    # Arrange
+    root, parsed = project
+    core = str(root / "pkg" / "core.py")
+    index = SymbolIndex(root=str(root), expected_files=parsed)
+    results = []
+    lookup = threading.Thread(target=lambda: results.append(index.lookup("pkg.core.helper")))
+    # Act
+    lookup.start()
+    lookup.join(timeout=0.1)
+    waited = lookup.is_alive()
+    index.add_file(core, parsed[core])
+    lookup.join(timeout=5)
+    # Assert
+    assert waited
+    assert results[0].qualified_name == "pkg.core.helper"
+
+
+def test_symbol_index_finish_releases_lookups_of_missing_files(project):
+    # Arrange
+    root, parsed = project
+    index = SymbolIndex(root=str(root), expected_files=parsed)
+    index.finish()
+    # Act
+    symbol = index.lookup("pkg.core.helper")
+    # Assert
+    assert symbol is None
@@ -25,7 +25,7 @@ def mock_url_response():
     return mock_response
 
 
-@patch("requests.get")
+@patch("osa_tool.http_client.get")
 def test_get_pdf_path_url(mock_get, mock_url_response):
     # Arrange
     mock_get.return_value = mock_url_response
@@ -40,7 +40,7 @@ def test_get_pdf_path_url(mock_get, mock_url_response):
     os.remove(pdf_path)
 
 
-@patch("requests.get")
+@patch("osa_tool.http_client.get")
 def test_get_pdf_path_invalid_url(mock_get):
     # Arrange
     mock_get.return_value = MagicMock(status_code=404)
@@ -72,7 +72,7 @@ def test_get_pdf_path_invalid_file():
     os.remove(invalid_path)
 
 
-@patch("requests.get")
+@patch("osa_tool.http_client.get")
 def test_fetch_pdf_from_url_success(mock_get, mock_url_response):
     # Arrange
     mock_get.return_value = mock_url_response
@@ -87,7 +87,7 @@ def test_fetch_pdf_from_url_success(mock_get, mock_url_response):
     os.remove(pdf_file_path)
 
 
-@patch("requests.get")
+@patch("osa_tool.http_client.get")
 def test_fetch_pdf_from_url_failure(mock_get):
     # Arrange
     mock_get.return_value = MagicMock(status_code=404)
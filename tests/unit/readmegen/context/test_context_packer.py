@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osa_tool.readmegen.context.context_packer import GAP_MARKER, ContextPacker
+from osa_tool.readmegen.context.files_contents import FileContext
+
+SOURCE = "\n".join(
+    ['"""Module docstring."""', "import os", ""]
+    + [f"x_{index} = {index}  # filler line number {index}" for index in range(200)]
+    + ["", "def important(value):", '    """Does the important thing."""', "    return value"]
+)
+
+
+@pytest.fixture
+def packer():
+    config = MagicMock()
+    config.llm.context_window = 400
+    config.llm.tokens = 100
+    config.llm.encoder = "cl100k_base"
+    with patch("osa_tool.readmegen.context.context_packer._load_encoding", return_value=None):
+        return ContextPacker(config)
+
+
+def test_pack_fits_context_window(packer):
+    # Arrange
+    files = [FileContext(path=f"src/m{index}.py", name=f"m{index}.py", content=SOURCE) for index in range(3)]
+    # Act
+    context = packer.pack(["template"], readme="# Title\n" + "text\n" * 500, tree="a\nb/c\n" * 200, files=files)
+    # Assert
+    total = (
+        packer.count_tokens("template")
+        + packer.count_tokens(context.readme)
+        + packer.count_tokens(context.tree)
+        + sum(packer.count_tokens(f"### {f.name} ({f.path})\n\n\n" + f.content) for f in context.files)
+    )
+    assert total <= packer.context_window - packer.response_tokens + 20
+    assert context.readme.startswith("# Title")
+    assert len(context.files) == 3
+
+
+def test_unused_share_goes_to_other_sources(packer):
+    # Arrange
+    files = [FileContext(path="src/m.py", name="m.py", content=SOURCE)]
+    # Act
+    context = packer.pack([], readme="short readme", files=files)
+    # Assert
+    assert context.readme == "short readme"
+    assert packer.count_tokens(context.files[0].content) > (packer.context_window - packer.response_tokens) // 2
+
+
+def test_pack_source_keeps_top_and_signatures(packer):
+    # Act
+    packed = packer.pack_source(SOURCE, budget=60)
+    # Assert
+    assert packed.startswith('"""Module docstring."""\nimport os')
+    assert "def important(value):" in packed
+    assert '"""Does the important thing."""' in packed
+    assert GAP_MARKER in packed
+
+
+def test_pack_tree_prefers_top_levels(packer):
+    # Arrange
+    tree = "\n".join(["README.md", "src"] + [f"src/deep/nested/file_{index}.py" for index in range(100)])
+    # Act
+    packed = packer.pack_tree(tree, budget=20)
+    # Assert
+    assert packed.splitlines()[:2] == ["README.md", "src"]
+    assert packed.endswith(GAP_MARKER)
+
+
+def test_context_without_window_is_unchanged():
+    # Arrange
+    packer = ContextPacker(MagicMock())
+    files = [FileContext(path="a.py", name="a.py", content=SOURCE)]
+    # Act
+    context = packer.pack(["template"], readme="readme", tree="tree", files=files)
+    # Assert
+    assert (context.readme, context.tree, context.files) == ("readme", "tree", files)
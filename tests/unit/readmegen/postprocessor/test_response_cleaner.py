@@ -3,6 +3,7 @@ import pytest
 from osa_tool.readmegen.postprocessor.response_cleaner import (
     clean_llm_response,
     process_text,
+    process_text_stream,
     remove_json_prefix,
     remove_plaintext_prefix,
 )
@@ -60,3 +61,13 @@ def test_remove_json_prefix(input_text, expected_output):
 )
 def test_process_text(input_text, expected_output):
     assert process_text(input_text) == expected_output
+
+
+def test_process_text_stream_stops_after_json_object():
+    # Arrange
+    chunks = iter(['```json\n{"key": ', '"value"}', "\n```\nHope this helps!"])
+    # Act
+    result = process_text_stream(chunks)
+    # Assert
+    assert result == '{"key": "value"}'
+    assert next(chunks) == "\n```\nHope this helps!"